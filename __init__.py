@@ -2,28 +2,71 @@
 LP Solver - Aplikace pro řešení lineárního programování.
 
 Tento balíček obsahuje kompletní řešení pro lineární programování s GUI.
+
+Importy jsou líné: jádro (modely, řešiče, dávkové řešení) nezávisí na Qt
+a knihovny řešičů se načítají až při prvním řešení. PySide6 se načte jen
+při přístupu ke GUI třídám (SolverThread, LPWindow).
 """
 
-from models import Variable, Constraint, Objective, LPProblem, SolverResult
-from solver_base import AbstractLPSolver
-from solver_pulp import PuLPSolver
-from solver_scipy import SciPySolver
-from solver_ortools import ORToolsSolver
-from solver_thread import SolverThread
-from main_window import LPWindow
-
-__all__ = [
-    "Variable",
-    "Constraint",
-    "Objective",
-    "LPProblem",
-    "SolverResult",
-    "AbstractLPSolver",
-    "PuLPSolver",
-    "SciPySolver",
-    "ORToolsSolver",
-    "SolverThread",
-    "LPWindow",
-]
+import importlib
+
+# Exportované jméno -> modul, ze kterého se načte při prvním přístupu
+_EXPORTS = {
+    "Variable": "models",
+    "Constraint": "models",
+    "Objective": "models",
+    "LPProblem": "models",
+    "SolverResult": "models",
+    "SolverOptions": "models",
+    "PhaseTimings": "models",
+    "ModelStats": "models",
+    "SolverCounters": "models",
+    "SolveProgress": "models",
+    "ProfileReport": "models",
+    "AbstractLPSolver": "solver_base",
+    "create_solver": "solver_base",
+    "PuLPSolver": "solver_pulp",
+    "SciPySolver": "solver_scipy",
+    "ORToolsSolver": "solver_ortools",
+    "PortfolioSolver": "solver_portfolio",
+    "AutoSolver": "solver_auto",
+    "ProcessSolver": "solver_process",
+    "CachedSolver": "solver_cache",
+    "ResultCache": "solver_cache",
+    "MetricsSolver": "metrics",
+    "ProfilingSolver": "profiling",
+    "PresolveSolver": "presolve",
+    "presolve": "presolve",
+    "SolveSession": "solve_session",
+    "Scenario": "scenarios",
+    "ScenarioResults": "scenarios",
+    "solve_many": "scenarios",
+    "run_sweep": "parametric",
+    "load_problem_file": "problem_io",
+    "save_problem_file": "problem_io",
+    "read_mps": "model_formats",
+    "write_mps": "model_formats",
+    "read_lp": "model_formats",
+    "write_lp": "model_formats",
+    "read_binary": "binary_format",
+    "write_binary": "binary_format",
+    "SolverThread": "solver_thread",
+    "LPWindow": "main_window",
+}
+
+__all__ = list(_EXPORTS)
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
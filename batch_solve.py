@@ -0,0 +1,378 @@
+"""
+Dávkové řešení uložených problémů z příkazové řádky (bez GUI).
+
+Soubory se řeší ve fondu pracovních procesů; výsledky se průběžně vypisují
+jako JSON Lines (jeden JSON objekt na řádek) v pořadí, v jakém doběhnou.
+Proces, který překročí časový limit souboru, je ukončen a nahrazen novým.
+
+Příklad:
+    python batch_solve.py ulohy/ --backend ortools --jobs 8 --timeout 60 -o vysledky.jsonl
+
+S --backend auto se řešič volí pro každý soubor podle historie řešení
+(viz solver_auto.py). Doby řešení se do historie připisují; přepínač
+--no-history zápis vypne (např. u měření, které historii nemá ovlivnit).
+
+Nativní nastavení řešiče se zadává přepínači --threads, --mip-gap,
+--algorithm a --no-native-presolve (viz SolverOptions).
+
+S přepínačem --profile ADRESÁŘ se každé řešení profiluje a záznam obsahuje
+souhrn nejdražších míst a cesty k uloženému profilu (viz profiling.py).
+"""
+
+import argparse
+import dataclasses
+import fnmatch
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+from collections import Counter, deque
+from typing import Iterable, List, Optional
+
+from models import SolverOptions, ALGORITHMS, ALGORITHM_AUTO
+from problem_io import FILE_PATTERNS
+from profiling import PROFILE_ENV, profile_dir_from_env
+from solver_base import SOLVER_REGISTRY
+
+
+def collect_files(paths: Iterable[str], patterns: List[str]) -> List[str]:
+    """Rozbalí adresáře na seznam souborů odpovídajících některému ze vzorů"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(
+                    os.path.join(root, name)
+                    for name in sorted(names)
+                    if any(fnmatch.fnmatch(name, p) for p in patterns)
+                )
+        else:
+            files.append(path)
+    return files
+
+
+def _worker_main(
+    backend: str, profile_dir: Optional[str], record_history: bool, conn
+):
+    """Pracovní proces: opakovaně načte soubor, vyřeší ho a pošle záznam"""
+    if hasattr(os, "setsid"):
+        # Vlastní skupina procesů, aby šlo ukončit i podprocesy řešiče
+        os.setsid()
+    # Výpisy řešičů (např. log CBC) nesmí znečistit výstup JSON Lines
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    from problem_io import load_problem_file
+    from presolve import PresolveSolver
+    from solver_base import create_solver
+    from solver_auto import StatsSolver
+    from metrics import MetricsSolver, hook_from_env
+
+    solver = create_solver(backend)
+    if record_history:
+        # Doby řešení se připisují do historie pro automatickou volbu řešiče
+        solver = StatsSolver(solver)
+    solver = PresolveSolver(solver)
+    if profile_dir is not None:
+        solver = solver.profiled(profile_dir)
+    hook = hook_from_env()
+    if hook is not None:
+        solver = MetricsSolver(solver, hook)
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+        path, options, with_values = task
+        start_time = time.perf_counter()
+        record = {"file": path, "backend": backend}
+        try:
+            problem = load_problem_file(path)
+            record["load_time"] = time.perf_counter() - start_time
+            result = solver.solve(problem, options)
+            record.update(
+                status=result.status,
+                objective_value=result.objective_value,
+                solve_time=result.solve_time,
+                error=result.error_message,
+            )
+            if result.backend:
+                record["backend"] = result.backend
+            if result.presolve_stats is not None:
+                record["presolve"] = dataclasses.asdict(result.presolve_stats)
+            for key in ("timings", "model_stats", "counters", "profile"):
+                if getattr(result, key) is not None:
+                    record[key] = dataclasses.asdict(getattr(result, key))
+            if with_values:
+                record["variable_values"] = result.variable_values
+        except Exception as e:
+            record.update(status="Error", objective_value=None, error=str(e))
+        record["wall_time"] = time.perf_counter() - start_time
+        conn.send(record)
+
+
+class _PoolWorker:
+    """Jeden pracovní proces fondu a úloha, kterou právě řeší"""
+
+    def __init__(
+        self,
+        ctx,
+        backend: str,
+        profile_dir: Optional[str] = None,
+        record_history: bool = True,
+    ):
+        self.conn, child_conn = ctx.Pipe()
+        # Proces nesmí být "daemon", jinak by nemohl spouštět vlastní
+        # podprocesy (portfolio řešičů)
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(backend, profile_dir, record_history, child_conn),
+            daemon=False,
+        )
+        self.process.start()
+        child_conn.close()
+        self.path = None
+        self.started = 0.0
+
+    def submit(self, path: str, options: SolverOptions, with_values: bool):
+        self.path = path
+        self.started = time.perf_counter()
+        self.conn.send((path, options, with_values))
+
+    def finish(self):
+        self.path = None
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        self.kill()
+
+    def kill(self):
+        from solver_process import kill_process_tree
+
+        kill_process_tree(self.process)
+        self.conn.close()
+
+
+def run_batch(
+    files: List[str],
+    backend: str = "pulp",
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    grace_period: float = 5.0,
+    with_values: bool = True,
+    presolve: bool = False,
+    out=sys.stdout,
+    profile_dir: Optional[str] = None,
+    solver_options: Optional[SolverOptions] = None,
+    record_history: bool = True,
+) -> dict:
+    """Vyřeší soubory ve fondu procesů a průběžně zapisuje JSON Lines do `out`.
+
+    Se zadaným `profile_dir` se každé řešení profiluje (viz profiling.py).
+    S `record_history=False` se doby řešení nepřipisují do historie
+    automatické volby řešiče (viz solver_auto.py).
+    `solver_options` určuje nativní nastavení řešiče; časový limit a presolve
+    se berou z `timeout` a `presolve`. Vrací souhrnné statistiky běhu.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(files) or 1))
+    options = dataclasses.replace(
+        solver_options or SolverOptions(), time_limit=timeout, presolve=presolve
+    )
+
+    pending = deque(files)
+    workers = [
+        _PoolWorker(ctx, backend, profile_dir, record_history) for _ in range(jobs)
+    ]
+    statuses = Counter()
+    failures = []
+    start_time = time.perf_counter()
+
+    def emit(record):
+        statuses[record["status"]] += 1
+        if record["status"] == "Error" or record.get("hard_timeout"):
+            failures.append(record["file"])
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+
+    try:
+        while pending or any(w.path for w in workers):
+            for worker in workers:
+                if worker.path is None and pending:
+                    worker.submit(pending.popleft(), options, with_values)
+
+            busy = [w for w in workers if w.path]
+            ready = multiprocessing.connection.wait(
+                [w.conn for w in busy], timeout=0.1
+            )
+            for i, worker in enumerate(workers):
+                if worker.path is None:
+                    continue
+                if worker.conn in ready:
+                    try:
+                        record = worker.conn.recv()
+                    except EOFError:
+                        record = None
+                    if record is not None:
+                        worker.finish()
+                        emit(record)
+                        continue
+
+                elapsed = time.perf_counter() - worker.started
+                crashed = not worker.process.is_alive()
+                overdue = timeout is not None and elapsed > timeout + grace_period
+                if crashed or overdue:
+                    # Proces se ukončí i s podprocesy a nahradí se novým
+                    record = {
+                        "file": worker.path,
+                        "backend": backend,
+                        "status": "TimeLimit" if overdue else "Error",
+                        "objective_value": None,
+                        "error": (
+                            "Překročen časový limit, proces byl ukončen"
+                            if overdue
+                            else f"Proces řešiče neočekávaně skončil "
+                            f"(kód {worker.process.exitcode})"
+                        ),
+                        "wall_time": elapsed,
+                        "hard_timeout": overdue,
+                    }
+                    worker.kill()
+                    workers[i] = _PoolWorker(
+                        ctx, backend, profile_dir, record_history
+                    )
+                    emit(record)
+    finally:
+        for worker in workers:
+            worker.stop()
+
+    wall_time = time.perf_counter() - start_time
+    return {
+        "files": len(files),
+        "jobs": jobs,
+        "backend": backend,
+        "wall_time": wall_time,
+        "throughput": len(files) / wall_time if wall_time > 0 else 0.0,
+        "statuses": dict(statuses),
+        "failures": failures,
+    }
+
+
+def print_summary(summary: dict, stream=sys.stderr):
+    print(
+        f"Vyřešeno {summary['files']} souborů za {summary['wall_time']:.2f} s "
+        f"({summary['throughput']:.2f} souborů/s, {summary['jobs']} procesů, "
+        f"řešič {summary['backend']})",
+        file=stream,
+    )
+    for status, count in sorted(summary["statuses"].items()):
+        print(f"  {status}: {count}", file=stream)
+    if summary["failures"]:
+        print(f"Selhání ({len(summary['failures'])}):", file=stream)
+        for path in summary["failures"]:
+            print(f"  {path}", file=stream)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Dávkové řešení LP problémů uložených v souborech"
+    )
+    parser.add_argument("paths", nargs="+", help="soubory nebo adresáře s úlohami")
+    parser.add_argument(
+        "-b", "--backend", default="pulp", choices=sorted(SOLVER_REGISTRY),
+        help="použitý řešič (výchozí: pulp)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="počet pracovních procesů (výchozí: počet CPU)",
+    )
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=None,
+        help="časový limit na jeden soubor v sekundách",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="výstupní soubor JSON Lines (výchozí: standardní výstup)",
+    )
+    parser.add_argument(
+        "--pattern", default=None,
+        help="vzor názvů souborů v adresářích (výchozí: všechny podporované formáty)",
+    )
+    parser.add_argument(
+        "--no-values", action="store_true",
+        help="nevypisovat hodnoty proměnných, jen stav a účelovou funkci",
+    )
+    parser.add_argument(
+        "--presolve", action="store_true",
+        help="před řešením zredukovat problém (presolve)",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=None,
+        help="počet vláken nativního řešiče (výchozí: podle řešiče)",
+    )
+    parser.add_argument(
+        "--mip-gap", type=float, default=None,
+        help="relativní mezera pro ukončení MIP, např. 0.01 = 1 %%",
+    )
+    parser.add_argument(
+        "--algorithm", default=ALGORITHM_AUTO, choices=ALGORITHMS,
+        help="algoritmus LP (výchozí: auto = podle řešiče)",
+    )
+    parser.add_argument(
+        "--no-native-presolve", action="store_true",
+        help="vypnout presolve nativního řešiče",
+    )
+    parser.add_argument(
+        "--profile", metavar="ADRESÁŘ", default=profile_dir_from_env(),
+        help="profilovat každé řešení (cProfile, tracemalloc) a profily uložit "
+        f"do adresáře (výchozí: proměnná {PROFILE_ENV})",
+    )
+    parser.add_argument(
+        "--no-history", action="store_true",
+        help="nepřipisovat doby řešení do historie automatické volby řešiče",
+    )
+    args = parser.parse_args(argv)
+    try:
+        solver_options = SolverOptions(
+            threads=args.threads,
+            mip_gap=args.mip_gap,
+            native_presolve=not args.no_native_presolve,
+            algorithm=args.algorithm,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    patterns = [args.pattern] if args.pattern else FILE_PATTERNS
+    files = collect_files(args.paths, patterns)
+    if not files:
+        print("Nebyly nalezeny žádné soubory k řešení", file=sys.stderr)
+        return 1
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        summary = run_batch(
+            files,
+            backend=args.backend,
+            jobs=args.jobs,
+            timeout=args.timeout,
+            with_values=not args.no_values,
+            presolve=args.presolve,
+            out=out,
+            profile_dir=args.profile,
+            solver_options=solver_options,
+            record_history=not args.no_history,
+        )
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print_summary(summary)
+    return 1 if summary["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,562 @@
+"""
+Srovnávací měření řešičů na reprodukovatelné sadě úloh.
+
+Sada obsahuje náhodné úlohy generované z pevného semínka (hustá / řídká
+matice, LP / MIP, přípustné / nepřípustné / neomezené, od velikosti
+optimal.json až po 10^5 nenulových prvků) a přiložené JSON příklady.
+Každá dvojice úloha + řešič se měří v novém interpretu, aby špičková paměť
+a načtené knihovny nezávisely na předchozích měřeních. Zvlášť se měří
+sestavení modelu, běh řešiče a převod výsledku.
+
+Výsledky se ukládají do JSON jako základ (baseline), se kterým lze
+později porovnat nové měření a najít regrese.
+
+Příklad:
+    python benchmark.py --json zaklad.json
+    python benchmark.py --sizes xs,s --backends ortools,pulp --compare zaklad.json
+"""
+
+import argparse
+import dataclasses
+import fnmatch
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from models import CSRMatrix, LPProblem, REL_LE, REL_GE, REL_EQ
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Velikost úlohy = cílový počet nenulových prvků matice
+SIZES = {"xs": 6, "s": 1_000, "m": 10_000, "l": 100_000}
+STRUCTURES = ("dense", "sparse")
+KINDS = ("lp", "mip")
+OUTCOMES = ("feasible", "infeasible", "unbounded")
+EXAMPLE_FILES = ("optimal.json", "optimal2.json", "infeasible.json", "unbounded.json")
+
+BACKENDS = ("pulp", "scipy", "ortools")
+# Očekávaný stav řešení podle druhu generované úlohy
+EXPECTED_STATUS = {
+    "feasible": "Optimal",
+    "infeasible": "Infeasible",
+    "unbounded": "Unbounded",
+}
+# Podíl celočíselných proměnných v MIP úlohách
+MIP_INTEGER_FRACTION = 0.2
+# Podíl řádků "≤", které v MIP úlohách mohou v optimu vázat
+MIP_BINDING_ROWS = 0.05
+# Průměrný počet nenulových prvků na řádek řídké matice
+SPARSE_ROW_NNZ = 5
+
+# Časy kratší než tato mez se při porovnání považují za šum
+MIN_TIME_DIFF = 0.005
+# Stejně tak přírůstek paměti do této meze (MB)
+MIN_MEMORY_DIFF = 5.0
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def dimensions(structure: str, size: str):
+    """Počet proměnných a omezení pro danou strukturu a velikost"""
+    nnz = SIZES[size]
+    if structure == "dense":
+        n_cons = max(2, round(math.sqrt(nnz / 1.5)))
+        return max(3, nnz // n_cons), n_cons
+    return max(3, nnz // 2), max(2, nnz // SPARSE_ROW_NNZ)
+
+
+def _random_matrix(rng, structure: str, n_vars: int, n_cons: int) -> CSRMatrix:
+    """Matice s celočíselnými kladnými koeficienty 1..9"""
+    if structure == "dense":
+        indptr = np.arange(n_cons + 1, dtype=np.int64) * n_vars
+        indices = np.tile(np.arange(n_vars, dtype=np.int32), n_cons)
+    else:
+        k = min(SPARSE_ROW_NNZ, n_vars)
+        rows = np.repeat(np.arange(n_cons, dtype=np.int64), k)
+        # Klíč řádek * n + sloupec; duplicitní prvky řádku se sloučí
+        keys = np.unique(rows * n_vars + rng.integers(0, n_vars, n_cons * k))
+        indptr = np.searchsorted(
+            keys, np.arange(n_cons + 1, dtype=np.int64) * n_vars
+        ).astype(np.int64)
+        indices = (keys % n_vars).astype(np.int32)
+    data = rng.integers(1, 10, len(indices)).astype(np.float64)
+    return CSRMatrix(indptr, indices, data, n_vars)
+
+
+def generate_problem(
+    structure: str, kind: str, outcome: str, size: str, seed: int = 0
+) -> LPProblem:
+    """Náhodná úloha se známým výsledkem (maximalizace, x >= 0).
+
+    Přípustnost zajišťuje bod x0 uvnitř mezí, ze kterého se dopočítají
+    pravé strany. Nepřípustná úloha má navíc dvojici řádků a·x <= b
+    a a·x >= b + 1, neomezená má proměnnou bez horní meze, kterou žádné
+    omezení neomezuje shora.
+    """
+    rng = np.random.default_rng(
+        [seed, STRUCTURES.index(structure), KINDS.index(kind),
+         OUTCOMES.index(outcome), list(SIZES).index(size)]
+    )
+    n_vars, n_cons = dimensions(structure, size)
+    if kind == "mip":
+        integer = rng.random(n_vars) < MIP_INTEGER_FRACTION
+        integer[0] = True
+    else:
+        integer = np.zeros(n_vars, dtype=bool)
+
+    upper = rng.integers(5, 21, n_vars).astype(np.float64)
+    lower = np.zeros(n_vars)
+    # Bod na dvě desetinná místa: pravé strany se přesně zapíší i do MPS (PuLP)
+    x0 = np.round(rng.uniform(0, upper), 2)
+    x0[integer] = np.floor(x0[integer])
+    objective = rng.integers(1, 10, n_vars).astype(np.float64)
+    matrix = _random_matrix(rng, structure, n_vars, n_cons)
+
+    # Rovnosti jen u přípustných a nepřípustných LP (u MIP by byly zbytečně těžké)
+    p_eq = 0.1 if kind == "lp" and outcome != "unbounded" else 0.0
+    rel = rng.choice(
+        np.array([REL_LE, REL_GE, REL_EQ], dtype=np.int8),
+        n_cons,
+        p=[0.8 - p_eq, 0.2, p_eq],
+    )
+    rows = matrix.row_indices()
+
+    if outcome == "unbounded":
+        # Proměnná 0 roste neomezeně: v řádcích "≤" má záporný koeficient,
+        # v řádcích "≥" kladný
+        upper[0] = np.inf
+        in_col = matrix.indices == 0
+        matrix.data[in_col & (rel[rows] == REL_LE)] *= -1
+
+    activity = np.bincount(
+        rows, weights=matrix.data * x0[matrix.indices], minlength=n_cons
+    )
+    slack = rng.integers(0, 10, n_cons).astype(np.float64)
+    rhs = np.select(
+        [rel == REL_LE, rel == REL_GE], [activity + slack, activity - slack], activity
+    )
+    if kind == "mip":
+        # Většina řádků "≤" má pravou stranu odvozenou z horních mezí místo
+        # z x0, takže v optimu neváže; jinak je náhodná MIP úloha příliš těžká
+        loose = (rel == REL_LE) & (rng.random(n_cons) >= MIP_BINDING_ROWS)
+        bound = np.where(np.isfinite(upper), upper, x0)
+        at_bound = np.bincount(
+            rows, weights=matrix.data * bound[matrix.indices], minlength=n_cons
+        )
+        rhs[loose] = at_bound[loose] + slack[loose]
+
+    if outcome == "infeasible":
+        # Dvě kopie řádku 0: a·x <= b a a·x >= b + 1
+        start, end = int(matrix.indptr[0]), int(matrix.indptr[1])
+        row_nnz = end - start
+        matrix = CSRMatrix(
+            np.concatenate(
+                [matrix.indptr, matrix.indptr[-1] + row_nnz * np.arange(1, 3)]
+            ),
+            np.concatenate([matrix.indices] + [matrix.indices[start:end]] * 2),
+            np.concatenate([matrix.data] + [matrix.data[start:end]] * 2),
+            n_vars,
+        )
+        rel = np.concatenate([rel, [REL_LE, REL_GE]]).astype(np.int8)
+        rhs = np.concatenate([rhs, [activity[0], activity[0] + 1]])
+
+    names = [f"x{j + 1}" for j in range(n_vars)]
+    return LPProblem.from_arrays(
+        names=names,
+        lower=lower,
+        upper=upper,
+        integer=integer,
+        sense="Maximalizovat",
+        objective=objective,
+        matrix=matrix,
+        rel=rel,
+        rhs=rhs,
+    )
+
+
+def suite(sizes=None, patterns=None) -> List[dict]:
+    """Seznam úloh sady (generované úlohy a přiložené příklady).
+
+    `patterns` jsou vzory názvů úloh (fnmatch), např. "sparse-mip-*".
+    """
+    cases = [
+        {"name": name, "file": name}
+        for name in EXAMPLE_FILES
+        if os.path.exists(os.path.join(HERE, name))
+    ]
+    for size in sizes or SIZES:
+        for structure in STRUCTURES:
+            for kind in KINDS:
+                for outcome in OUTCOMES:
+                    cases.append({
+                        "name": f"{structure}-{kind}-{outcome}-{size}",
+                        "structure": structure,
+                        "kind": kind,
+                        "outcome": outcome,
+                        "size": size,
+                    })
+    if patterns:
+        cases = [
+            case for case in cases
+            if any(fnmatch.fnmatch(case["name"], p) for p in patterns)
+        ]
+    return cases
+
+
+def load_case(case: dict, seed: int = 0) -> LPProblem:
+    if "file" in case:
+        from problem_io import load_problem_file
+
+        return load_problem_file(os.path.join(HERE, case["file"]))
+    return generate_problem(
+        case["structure"], case["kind"], case["outcome"], case["size"], seed
+    )
+
+
+def _peak_memory_mb():
+    """Špičková paměť (MB) tohoto procesu a jeho podprocesů (např. CBC)"""
+    if resource is None:
+        return None, None
+    # Linux udává kB, macOS bajty
+    scale = 1024**2 if sys.platform == "darwin" else 1024
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale,
+    )
+
+
+def measure_case(
+    case: dict, backend: str, repeat: int, time_limit: Optional[float], seed: int
+) -> dict:
+    """Změří jednu úlohu jedním řešičem (volá se v samostatném interpretu).
+
+    Před měřením se řešič zahřeje na nejmenší úloze, aby se do časů
+    a paměti nezapočetl import knihovny řešiče.
+    """
+    from models import PhaseTimings, SolverOptions
+    from solver_base import create_solver
+
+    problem = load_case(case, seed)
+    record = {
+        "case": case["name"],
+        "backend": backend,
+        "n_vars": problem.n_vars,
+        "n_cons": problem.n_cons,
+        "nnz": problem.matrix.nnz,
+        "integer": bool(problem.has_integers),
+        "expected": EXPECTED_STATUS.get(case.get("outcome")),
+    }
+    solver = create_solver(backend)
+    if problem.has_integers and not solver.supports_integers:
+        record["status"] = "Skipped"
+        return record
+
+    solver.solve(generate_problem("dense", "lp", "feasible", "xs", seed))
+    self_before, _ = _peak_memory_mb()
+
+    options = SolverOptions(time_limit=time_limit)
+    build, run, extract, total = [], [], [], []
+    for _ in range(repeat):
+        result = solver.solve(problem, options)
+        timings = result.timings or PhaseTimings()
+        build.append(timings.build_time)
+        run.append(timings.native_time)
+        extract.append(timings.extract_time)
+        total.append(result.solve_time)
+
+    self_peak, child_peak = _peak_memory_mb()
+    if result.counters is not None:
+        record.update(
+            (name, value)
+            for name, value in dataclasses.asdict(result.counters).items()
+            if value is not None
+        )
+    record.update(
+        status=result.status,
+        objective=result.objective_value,
+        error=result.error_message,
+        build_time=statistics.median(build),
+        run_time=statistics.median(run),
+        extract_time=statistics.median(extract),
+        total_time=statistics.median(total),
+        peak_rss_mb=self_peak,
+        child_rss_mb=child_peak,
+        # Paměť navíc oproti zahřátému řešiči + špička podprocesů řešiče
+        memory_mb=(
+            self_peak - self_before + child_peak if self_peak is not None else None
+        ),
+    )
+    return record
+
+
+_MEASURE_SCRIPT = """
+import json, sys
+from benchmark import measure_case
+print(json.dumps(measure_case(*json.loads(sys.argv[1]))))
+"""
+
+
+def measure(
+    case: dict, backend: str, repeat: int, time_limit: Optional[float], seed: int
+) -> dict:
+    """Spustí measure_case v novém interpretu"""
+    task = json.dumps([case, backend, repeat, time_limit, seed])
+    # Rezerva na načtení úlohy a zahřátí; bez limitu řešiče se nečeká věčně
+    timeout = (time_limit or 600) * (repeat + 1) * 1.5 + 60
+    try:
+        out = subprocess.run(
+            [sys.executable, "-c", _MEASURE_SCRIPT, task],
+            cwd=HERE,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"case": case["name"], "backend": backend, "status": "Timeout"}
+    lines = out.stdout.strip().splitlines()
+    if out.returncode != 0 or not lines:
+        error = out.stderr.strip().splitlines()
+        return {
+            "case": case["name"],
+            "backend": backend,
+            "status": "Error",
+            "error": error[-1] if error else f"návratový kód {out.returncode}",
+        }
+    # Řešiče mohou psát log na standardní výstup, záznam je poslední řádek
+    return json.loads(lines[-1])
+
+
+def _versions() -> dict:
+    from importlib import metadata
+
+    versions = {}
+    for package in ("numpy", "scipy", "pulp", "ortools"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def run(
+    cases: List[dict],
+    backends,
+    repeat: int = 3,
+    time_limit: Optional[float] = 60.0,
+    seed: int = 0,
+    report=None,
+) -> dict:
+    """Změří všechny kombinace úloh a řešičů; `report(záznam)` po každé"""
+    results = []
+    for case in cases:
+        for backend in backends:
+            record = measure(case, backend, repeat, time_limit, seed)
+            results.append(record)
+            if report is not None:
+                report(record)
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": _versions(),
+        "seed": seed,
+        "repeat": repeat,
+        "time_limit": time_limit,
+        "results": results,
+    }
+
+
+def _ms(value) -> str:
+    return f"{value * 1000:9.1f}" if value is not None else f"{'-':>9s}"
+
+
+def format_record(record: dict) -> str:
+    memory = record.get("memory_mb")
+    line = (
+        f"{record['case']:28s} {record['backend']:8s} {record['status']:11s}"
+        f"{_ms(record.get('build_time'))}{_ms(record.get('run_time'))}"
+        f"{_ms(record.get('extract_time'))}"
+        + (f"{memory:9.1f}" if memory is not None else f"{'-':>9s}")
+    )
+    expected = record.get("expected")
+    if expected and record["status"] not in (expected, "Skipped", "TimeLimit"):
+        line += f"  (očekáváno {expected})"
+    if record.get("error"):
+        line += f"  {record['error']}"
+    return line
+
+
+HEADER = (
+    f"{'úloha':28s} {'řešič':8s} {'status':11s}"
+    f"{'sestav.':>9s}{'řešení':>9s}{'převod':>9s}{'paměť':>9s}"
+    "\n" + f"{'':49s}{'[ms]':>9s}{'[ms]':>9s}{'[ms]':>9s}{'[MB]':>9s}"
+)
+
+
+def summary(results: List[dict]) -> List[str]:
+    """Souhrn po řešičích: dokončené úlohy, celkový čas, počet nejrychlejších"""
+    by_case = {}
+    for record in results:
+        if record.get("total_time") is not None and record["status"] not in (
+            "Error", "Timeout", "TimeLimit",
+        ):
+            by_case.setdefault(record["case"], []).append(record)
+    wins = {}
+    for records in by_case.values():
+        best = min(records, key=lambda r: r["total_time"])
+        wins[best["backend"]] = wins.get(best["backend"], 0) + 1
+
+    lines = []
+    for backend in dict.fromkeys(r["backend"] for r in results):
+        own = [
+            r for r in results
+            if r["backend"] == backend and r["status"] != "Skipped"
+        ]
+        done = [r for rs in by_case.values() for r in rs if r["backend"] == backend]
+        lines.append(
+            f"{backend:8s} dokončeno {len(done)}/{len(own)}, "
+            f"celkem {sum(r['total_time'] for r in done):.3f} s, "
+            f"nejrychlejší v {wins.get(backend, 0)} úlohách"
+        )
+    return lines
+
+
+def _phase_regressions(old: dict, new: dict, tolerance: float) -> List[str]:
+    found = []
+    for key, label in (
+        ("build_time", "sestavení"),
+        ("run_time", "řešení"),
+        ("extract_time", "převod"),
+    ):
+        a, b = old.get(key), new.get(key)
+        if a is None or b is None:
+            continue
+        if b > a * (1 + tolerance) and b - a > MIN_TIME_DIFF:
+            found.append(
+                f"{label} {a * 1000:.1f} ms -> {b * 1000:.1f} ms "
+                f"(+{(b / a - 1) * 100 if a > 0 else math.inf:.0f} %)"
+            )
+    a, b = old.get("memory_mb"), new.get("memory_mb")
+    if a is not None and b is not None:
+        if b > a * (1 + tolerance) and b - a > MIN_MEMORY_DIFF:
+            found.append(f"paměť {a:.1f} MB -> {b:.1f} MB")
+    return found
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Vrací seznam regresí oproti uloženému základu.
+
+    Regresí je změna stavu řešení, změna optimální hodnoty, zpomalení
+    některé fáze nebo nárůst paměti o víc než `tolerance` (relativně)
+    a zároveň o víc než šum (MIN_TIME_DIFF, MIN_MEMORY_DIFF).
+    """
+    old_records = {(r["case"], r["backend"]): r for r in baseline["results"]}
+    regressions = []
+    for new in current["results"]:
+        old = old_records.get((new["case"], new["backend"]))
+        if old is None:
+            continue
+        where = f"{new['case']} / {new['backend']}"
+        if new["status"] != old["status"]:
+            regressions.append(f"{where}: status {old['status']} -> {new['status']}")
+            continue
+        a, b = old.get("objective"), new.get("objective")
+        if a is not None and b is not None and not math.isclose(
+            a, b, rel_tol=1e-6, abs_tol=1e-6
+        ):
+            regressions.append(f"{where}: účelová funkce {a:.6g} -> {b:.6g}")
+        regressions.extend(
+            f"{where}: {line}" for line in _phase_regressions(old, new, tolerance)
+        )
+    return regressions
+
+
+def _split(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Srovnávací měření řešičů na reprodukovatelné sadě úloh"
+    )
+    parser.add_argument(
+        "--backends", type=_split, default=list(BACKENDS),
+        help=f"řešiče oddělené čárkou (výchozí {','.join(BACKENDS)})",
+    )
+    parser.add_argument(
+        "--sizes", type=_split, default=list(SIZES),
+        help=f"velikosti úloh oddělené čárkou (výchozí {','.join(SIZES)})",
+    )
+    parser.add_argument(
+        "--cases", type=_split, default=None,
+        help="vzory názvů úloh oddělené čárkou, např. 'sparse-lp-*,optimal*.json'",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="počet opakování")
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=60.0,
+        help="časový limit jednoho řešení v sekundách (výchozí 60)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="semínko generátoru")
+    parser.add_argument("--json", help="uložit výsledky do JSON souboru")
+    parser.add_argument("--compare", help="porovnat s dříve uloženými výsledky")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2,
+        help="povolené relativní zhoršení při porovnání (výchozí 0.2)",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="jen vypsat úlohy sady a skončit"
+    )
+    args = parser.parse_args(argv)
+
+    unknown = [s for s in args.sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"Neznámá velikost {', '.join(unknown)}")
+    cases = suite(args.sizes, args.cases)
+    if args.list:
+        for case in cases:
+            print(case["name"])
+        return 0
+
+    print(HEADER)
+    results = run(
+        cases,
+        args.backends,
+        args.repeat,
+        args.timeout,
+        args.seed,
+        report=lambda record: print(format_record(record), flush=True),
+    )
+    print()
+    for line in summary(results["results"]):
+        print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    status = 0
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESE {line}", file=sys.stderr)
+        if regressions:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
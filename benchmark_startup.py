@@ -0,0 +1,188 @@
+"""
+Měření doby importu jádra a GUI.
+
+Každé měření běží v novém interpretu, aby nezáviselo na již načtených
+modulech. Jádro (modely, řešiče, dávkové řešení) se měří zvlášť od GUI
+a zároveň se kontroluje, že import jádra nenačte PySide6 ani knihovny
+řešičů.
+
+Příklad:
+    python benchmark_startup.py --repeat 10 --json startup.json
+    python benchmark_startup.py --compare startup.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+CORE_MODULES = [
+    "models",
+    "solver_base",
+    "solver_pulp",
+    "solver_scipy",
+    "solver_ortools",
+    "solver_process",
+    "solver_portfolio",
+    "solver_auto",
+    "solver_cache",
+    "metrics",
+    "profiling",
+    "presolve",
+    "solve_session",
+    "scenarios",
+    "parametric",
+    "model_formats",
+    "binary_format",
+    "problem_io",
+    "batch_solve",
+    "benchmark",
+]
+GUI_MODULES = [
+    "table_models",
+    "loader_thread",
+    "parametric_dialog",
+    "solver_options_dialog",
+    "convergence_chart",
+    "main_window",
+]
+
+# Moduly, které jádro při importu načítat nesmí
+HEAVY_MODULES = ["PySide6", "pulp", "scipy", "ortools"]
+
+_MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"time": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure(modules, repeat: int = 5) -> dict:
+    """Změří dobu importu modulů v `repeat` nových interpretech"""
+    script = _MEASURE_SCRIPT.format(modules=modules, heavy=HEAVY_MODULES)
+    times = []
+    loaded = set()
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=HERE,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        sample = json.loads(out.stdout.strip().splitlines()[-1])
+        times.append(sample["time"])
+        loaded.update(sample["loaded"])
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "max": max(times),
+        "heavy_loaded": sorted(loaded),
+    }
+
+
+def top_imports(modules, count: int = 10):
+    """Nejdražší importy podle `python -X importtime` (kumulativně, v ms)"""
+    script = "".join(f"import {name}\n" for name in modules)
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=HERE,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us) / 1000, name.strip()))
+    rows.sort(reverse=True)
+    return rows[:count]
+
+
+def run(repeat: int) -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "core": measure(CORE_MODULES, repeat),
+        "gui": measure(GUI_MODULES, repeat),
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Vrací seznam regresí oproti uloženému měření"""
+    regressions = []
+    for part in ("core", "gui"):
+        old = baseline[part]["median"]
+        new = current[part]["median"]
+        if old > 0 and new > old * (1 + tolerance):
+            regressions.append(
+                f"{part}: {old * 1000:.1f} ms -> {new * 1000:.1f} ms "
+                f"(+{(new / old - 1) * 100:.0f} %)"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Měření doby importu jádra a GUI")
+    parser.add_argument("--repeat", type=int, default=5, help="počet opakování")
+    parser.add_argument("--json", help="uložit výsledky do JSON souboru")
+    parser.add_argument("--compare", help="porovnat s dříve uloženými výsledky")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2,
+        help="povolené relativní zpomalení při porovnání (výchozí 0.2)",
+    )
+    parser.add_argument(
+        "--detail", action="store_true", help="vypsat nejdražší importy"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    for part in ("core", "gui"):
+        r = results[part]
+        print(
+            f"{part:5s} median {r['median'] * 1000:7.1f} ms "
+            f"(min {r['min'] * 1000:.1f}, max {r['max'] * 1000:.1f})"
+        )
+
+    if args.detail:
+        for part, modules in (("core", CORE_MODULES), ("gui", GUI_MODULES)):
+            print(f"\nNejdražší importy ({part}):")
+            for ms, name in top_imports(modules):
+                print(f"  {ms:8.1f} ms  {name}")
+
+    status = 0
+    if results["core"]["heavy_loaded"]:
+        print(
+            "CHYBA: import jádra načetl "
+            + ", ".join(results["core"]["heavy_loaded"]),
+            file=sys.stderr,
+        )
+        status = 1
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESE {line}", file=sys.stderr)
+        if regressions:
+            status = 1
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Kompaktní binární formát problému (.lpb) s načítáním přes mapování do paměti.
+
+Rozložení souboru (verze 1):
+    MAGIC (6 B) | verze uint16 | délka hlavičky uint32 | hlavička JSON
+    | pole zarovnaná na 64 B ...
+
+Hlavička obsahuje smysl optimalizace, rozměry, volitelná doplňující data
+(např. zvolený řešič) a pro každé pole jeho typ, délku a pozici v souboru.
+Pole jsou uložena surově v little-endian (meze, typy proměnných, účelová
+funkce, CSR matice, relace, pravé strany), názvy proměnných jako tabulka
+řetězců UTF-8 oddělených nulovým bajtem.
+
+Při načtení se soubor namapuje do paměti a pole jsou jen pohledy do něj
+(pouze pro čtení), takže otevření i velkého modelu je téměř okamžité a data
+se čtou z disku až při prvním přístupu.
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from models import LPProblem, CSRMatrix
+
+MAGIC = b"LPBIN\x00"
+VERSION = 1
+ALIGNMENT = 64
+
+_PREFIX = struct.Struct("<6sHI")
+
+# Název pole -> (datový typ v souboru, funkce vracející pole z problému)
+_ARRAYS = {
+    "lower": ("<f8", lambda p: p.lower),
+    "upper": ("<f8", lambda p: p.upper),
+    "integer": ("|b1", lambda p: p.integer),
+    "objective": ("<f8", lambda p: p.obj_coeffs),
+    "indptr": ("<i8", lambda p: p.matrix.indptr),
+    "indices": ("<i4", lambda p: p.matrix.indices),
+    "data": ("<f8", lambda p: p.matrix.data),
+    "rel": ("|i1", lambda p: p.rel),
+    "rhs": ("<f8", lambda p: p.rhs),
+}
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_binary(
+    path: str, problem: LPProblem, extra: Optional[Dict[str, Any]] = None
+):
+    """Uloží problém do binárního souboru.
+
+    Zapisuje se do dočasného souboru, který pak nahradí cílový. Problém
+    načtený z téhož souboru (pole mapovaná do paměti) tak zůstane platný.
+    """
+    if any("\x00" in name for name in problem.names):
+        raise ValueError("Název proměnné nesmí obsahovat nulový znak")
+    names = "\x00".join(problem.names).encode("utf-8")
+    arrays = {
+        key: np.ascontiguousarray(get(problem), dtype=dtype)
+        for key, (dtype, get) in _ARRAYS.items()
+    }
+
+    def build_header(start: int) -> bytes:
+        layout = {}
+        offset = start
+        for key, a in arrays.items():
+            layout[key] = {"dtype": a.dtype.str, "count": len(a), "offset": offset}
+            offset = _aligned(offset + a.nbytes)
+        layout["names"] = {"dtype": "|u1", "count": len(names), "offset": offset}
+        header = {
+            "sense": problem.sense,
+            "n_vars": problem.n_vars,
+            "n_cons": problem.n_cons,
+            "n_cols": problem.matrix.n_cols,
+            "arrays": layout,
+            "extra": extra or {},
+        }
+        return json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+    # Pozice polí závisí na délce hlavičky a ta zase na pozicích
+    start = _aligned(_PREFIX.size + len(build_header(0)))
+    header = build_header(start)
+    while _PREFIX.size + len(header) > start:
+        start = _aligned(_PREFIX.size + len(header))
+        header = build_header(start)
+
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_PREFIX.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            for a in list(arrays.values()) + [np.frombuffer(names, dtype=np.uint8)]:
+                f.write(b"\x00" * (_aligned(f.tell()) - f.tell()))
+                f.write(memoryview(a).cast("B"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _read_header(f) -> dict:
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) < _PREFIX.size:
+        raise ValueError("Soubor není binární LP problém (příliš krátký)")
+    magic, version, length = _PREFIX.unpack(prefix)
+    if magic != MAGIC:
+        raise ValueError("Soubor není binární LP problém (chybná hlavička)")
+    if version > VERSION:
+        raise ValueError(
+            f"Nepodporovaná verze binárního formátu {version} "
+            f"(podporována nejvýše {VERSION})"
+        )
+    return json.loads(f.read(length).decode("utf-8"))
+
+
+def read_binary_extra(path: str) -> Dict[str, Any]:
+    """Doplňující data uložená s problémem (čte se jen hlavička)"""
+    with open(path, "rb") as f:
+        return _read_header(f)["extra"]
+
+
+def read_binary(path: str, memory_map: bool = True, progress=None) -> LPProblem:
+    """Načte problém z binárního souboru.
+
+    Při memory_map=True jsou pole pohledy do souboru namapovaného do paměti
+    (pouze pro čtení), jinak se soubor načte celý. `progress` se zavolá
+    jen jednou po načtení, mapování samo je okamžité.
+    """
+    with open(path, "rb") as f:
+        header = _read_header(f)
+        if memory_map:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            f.seek(0)
+            buffer = f.read()
+
+    layout = header["arrays"]
+
+    def array(key):
+        spec = layout[key]
+        dtype = np.dtype(spec["dtype"])
+        end = spec["offset"] + spec["count"] * dtype.itemsize
+        if end > len(buffer):
+            raise ValueError(f"Binární soubor je poškozený (pole {key})")
+        return np.frombuffer(
+            buffer, dtype=dtype, count=spec["count"], offset=spec["offset"]
+        )
+
+    n_vars = header["n_vars"]
+    names = bytes(array("names")).decode("utf-8").split("\x00") if n_vars else []
+    if len(names) != n_vars:
+        raise ValueError("Binární soubor je poškozený (názvy proměnných)")
+
+    matrix = CSRMatrix(
+        indptr=array("indptr"),
+        indices=array("indices"),
+        data=array("data"),
+        n_cols=header["n_cols"],
+    )
+    problem = LPProblem.from_arrays(
+        names=names,
+        lower=array("lower"),
+        upper=array("upper"),
+        integer=array("integer"),
+        sense=header["sense"],
+        objective=array("objective"),
+        matrix=matrix,
+        rel=array("rel"),
+        rhs=array("rhs"),
+    )
+    if progress is not None:
+        progress(1.0)
+    return problem
+
+
+def json_to_binary(src: str, dst: str):
+    """Převede JSON soubor na binární; doplňující klíče (např. řešič) zachová"""
+    from problem_io import load_problem_with_extra
+
+    problem, extra = load_problem_with_extra(src)
+    write_binary(dst, problem, extra=extra)
+
+
+def binary_to_json(src: str, dst: str):
+    """Převede binární soubor na JSON včetně doplňujících dat"""
+    from problem_io import save_json
+
+    save_json(dst, read_binary(src), extra=read_binary_extra(src))
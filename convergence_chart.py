@@ -0,0 +1,106 @@
+"""
+Malý graf konvergence řešení MIP.
+
+Zobrazuje v čase hodnotu nejlepšího nalezeného řešení a nejlepší mez
+účelové funkce, jak je řešič průběžně hlásí (SolveProgress). Z grafu je
+vidět, jak rychle se mezera zavírá a zda má smysl čekat na důkaz
+optimality.
+"""
+
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QWidget
+
+from models import SolveProgress
+
+INCUMBENT_COLOR = QColor("#1f77b4")
+BOUND_COLOR = QColor("#888888")
+MARGIN = 8
+
+
+class ConvergenceChart(QWidget):
+    """Graf nejlepšího řešení a meze účelové funkce v čase"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(110)
+        # (čas, nejlepší řešení, mez) při každé změně hodnot
+        self._points: List[Tuple[float, Optional[float], Optional[float]]] = []
+        self._end = 0.0
+
+    def clear(self):
+        self._points = []
+        self._end = 0.0
+        self.update()
+
+    def add_progress(self, progress: SolveProgress):
+        self._end = progress.elapsed
+        values = (progress.objective, progress.best_bound)
+        if values != (None, None) and (
+            not self._points or self._points[-1][1:] != values
+        ):
+            self._points.append((progress.elapsed, *values))
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), Qt.white)
+        painter.setPen(QColor("#cccccc"))
+        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+
+        values = [v for _, *pair in self._points for v in pair if v is not None]
+        if not values:
+            painter.setPen(QColor("#666666"))
+            painter.drawText(
+                self.rect(), Qt.AlignCenter, "Graf se zobrazí po nalezení prvního řešení"
+            )
+            return
+
+        low, high = min(values), max(values)
+        if high - low < 1e-9:
+            low, high = low - 1.0, high + 1.0
+        end = max(self._end, self._points[-1][0], 1e-9)
+        text_height = painter.fontMetrics().height()
+        # Nad a pod čarami je místo pro popisky
+        left, top = MARGIN, 2 * MARGIN + text_height
+        width = self.width() - 2 * MARGIN
+        height = self.height() - 4 * MARGIN - 2 * text_height
+
+        def point(t: float, value: float) -> QPointF:
+            return QPointF(
+                left + width * t / end, top + height * (high - value) / (high - low)
+            )
+
+        for column, color, style in (
+            (1, INCUMBENT_COLOR, Qt.SolidLine),
+            (2, BOUND_COLOR, Qt.DashLine),
+        ):
+            # Schodovitá čára: hodnota platí až do další změny
+            polygon = QPolygonF()
+            last = None
+            for t, *pair in self._points:
+                value = pair[column - 1]
+                if value is None:
+                    continue
+                if last is not None:
+                    polygon.append(point(t, last))
+                polygon.append(point(t, value))
+                last = value
+            if last is None:
+                continue
+            polygon.append(point(end, last))
+            painter.setPen(QPen(color, 2, style))
+            painter.drawPolyline(polygon)
+
+        painter.setPen(QColor("#444444"))
+        painter.drawText(MARGIN, MARGIN + text_height - 3, f"{high:.6g}")
+        painter.drawText(MARGIN, self.height() - MARGIN - 3, f"{low:.6g}")
+        legend = f"— nejlepší řešení   - - mez   {end:.1f} s"
+        painter.drawText(
+            self.rect().adjusted(0, MARGIN, -MARGIN, 0),
+            Qt.AlignRight | Qt.AlignTop,
+            legend,
+        )
@@ -0,0 +1,54 @@
+import time
+
+from PySide6.QtCore import QThread, Signal
+from problem_io import load_problem_with_extra
+
+
+class LoadCancelled(Exception):
+    """Načítání bylo zrušeno uživatelem"""
+
+
+class LoaderThread(QThread):
+    """Thread pro načtení, parsování a převod souboru s problémem mimo GUI.
+
+    Výsledný LPProblem se předá signálem `finished` a GUI ho do tabulek
+    vloží jednou hromadnou výměnou polí.
+    """
+
+    finished = Signal(object, dict, float)  # LPProblem, doplňující data, doba
+    error = Signal(str)
+    progress = Signal(int)  # procenta přečteného souboru
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._cancelled = False
+        self._percent = -1
+
+    def cancel(self):
+        """Zruší načítání; po zrušení už thread nevyšle žádný výsledek"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def _on_progress(self, fraction: float):
+        if self._cancelled:
+            raise LoadCancelled()
+        # Signál jen při změně o celé procento, aby se GUI nezahltilo
+        percent = int(fraction * 100)
+        if percent != self._percent:
+            self._percent = percent
+            self.progress.emit(percent)
+
+    def run(self):
+        try:
+            start_time = time.perf_counter()
+            problem, extra = load_problem_with_extra(self.path, self._on_progress)
+            if not self._cancelled:
+                self.finished.emit(problem, extra, time.perf_counter() - start_time)
+        except LoadCancelled:
+            pass
+        except Exception as e:
+            if not self._cancelled:
+                self.error.emit(str(e))
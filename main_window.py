@@ -1,4 +1,6 @@
-import json
+from dataclasses import asdict, replace
+from typing import Optional
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -8,20 +10,86 @@ from PySide6.QtWidgets import (
     QTabWidget,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
     QSpinBox,
+    QDoubleSpinBox,
     QLabel,
     QComboBox,
     QHeaderView,
     QMessageBox,
     QFileDialog,
+    QCheckBox,
+    QProgressBar,
 )
-from PySide6.QtCore import Qt
-from typing import List
-from models import Variable, Constraint, Objective, LPProblem, SolverResult
-from solver_pulp import PuLPSolver
-from solver_scipy import SciPySolver
-from solver_ortools import ORToolsSolver
+from models import (
+    LPProblem,
+    SolverResult,
+    SolverOptions,
+    SolveProgress,
+    RELATIONS,
+)
+from solver_base import create_solver
+from solver_auto import AutoSolver, SolveHistory, StatsSolver
 from solver_thread import SolverThread
+from solver_process import ProcessSolver
+from solver_portfolio import PortfolioSolver
+from solver_cache import CachedSolver, ResultCache, default_cache_dir
+from metrics import MetricsSolver, hook_from_env
+from profiling import default_profile_dir, profile_dir_from_env
+from presolve import PresolveSolver
+from solve_session import SolveSession
+from parametric_dialog import ParametricDialog
+from solver_options_dialog import SolverOptionsDialog
+from convergence_chart import ConvergenceChart
+from problem_io import save_json, save_problem_file, file_format
+from model_formats import peak_rss_mb
+from binary_format import write_binary
+from loader_thread import LoaderThread
+from table_models import (
+    VariablesModel,
+    ObjectiveModel,
+    ConstraintsModel,
+    ComboDelegate,
+    TYPE_LABELS,
+    build_problem,
+)
+
+# Nejvyšší počet sloupců, které se ještě roztáhnou na šířku okna
+STRETCH_COLUMNS = 20
+# Horní mez počtu proměnných a omezení v horním panelu
+MAX_TABLE_SIZE = 1_000_000
+# Nejvyšší počet chyb vstupu vypsaných v dialogu
+MAX_SHOWN_ERRORS = 20
+# Jak často okno obnovuje průběh řešení (v milisekundách)
+PROGRESS_INTERVAL_MS = 500
+# Nabídka řešičů: popisek -> název v SOLVER_REGISTRY
+SOLVER_CHOICES = {
+    "Automaticky (podle historie)": "auto",
+    "PuLP (CBC)": "pulp",
+    "SciPy (HiGHS)": "scipy",
+    "OR-Tools (Google)": "ortools",
+    "Portfolio (souběh všech)": "portfolio",
+}
+# Filtry souborových dialogů
+SAVE_FILTER = (
+    "JSON (*.json);;Binární (*.lpb);;MPS (*.mps *.mps.gz);;"
+    "CPLEX LP (*.lp *.lp.gz)"
+)
+LOAD_FILTER = "Všechny podporované (*.json *.lpb *.mps *.lp *.gz);;" + SAVE_FILTER
+
+
+def format_progress(progress: SolveProgress) -> str:
+    """Průběh řešení jako text (jen údaje, které řešič hlásí)"""
+    parts = [f"{progress.elapsed:.1f} s"]
+    if progress.objective is not None:
+        parts.append(f"nejlepší řešení {progress.objective:.6g}")
+    if progress.best_bound is not None:
+        parts.append(f"mez {progress.best_bound:.6g}")
+    if progress.gap is not None:
+        parts.append(f"mezera {progress.gap:.2%}")
+    if progress.nodes is not None:
+        parts.append(f"uzly {progress.nodes}")
+    return " | ".join(parts)
 
 
 class LPWindow(QMainWindow):
@@ -33,6 +101,15 @@ class LPWindow(QMainWindow):
         self.resize(1100, 700)
 
         self.solver_thread = None
+        self.loader_thread = None
+        self._stopped_threads = []
+        # Model OR-Tools otevřené úlohy pro opakovaná řešení s teplým startem
+        self.solve_session = SolveSession()
+        self.result_cache = ResultCache(cache_dir=default_cache_dir())
+        # Provozní metriky řešení (jen při nastavené LP_SOLVER_METRICS)
+        self.metrics_hook = hook_from_env()
+        # Historie dob řešení pro automatickou volbu řešiče
+        self.solve_history = SolveHistory()
 
         main = QWidget()
         main_layout = QVBoxLayout(main)
@@ -45,25 +122,87 @@ class LPWindow(QMainWindow):
         self.load_btn = QPushButton("📂 Načíst")
         self.save_btn = QPushButton("💾 Uložit")
         self.solve_btn = QPushButton("Řešit")
+        self.stop_btn = QPushButton("⏹ Zastavit")
+        self.stop_btn.setEnabled(False)
+        self.interrupt_btn = QPushButton("⏭ Ukončit s nejlepším")
+        self.interrupt_btn.setToolTip(
+            "Ukončí řešení předčasně a zobrazí nejlepší dosud nalezené řešení "
+            "(CBC, SCIP); řešič, který přerušení neumí, se zastaví bez výsledku"
+        )
+        self.interrupt_btn.setEnabled(False)
+        self.sweep_btn = QPushButton("📈 Parametrická analýza")
 
         self.new_btn.clicked.connect(self.new_problem)
         self.load_btn.clicked.connect(self.load_problem)
         self.save_btn.clicked.connect(self.save_problem)
         self.solve_btn.clicked.connect(self.solve_problem)
+        self.stop_btn.clicked.connect(self.stop_solving)
+        self.stop_btn.clicked.connect(self.stop_loading)
+        self.interrupt_btn.clicked.connect(self.interrupt_solving)
+        self.sweep_btn.clicked.connect(self.open_parametric)
 
         top_panel.addWidget(self.new_btn)
         top_panel.addWidget(self.load_btn)
         top_panel.addWidget(self.save_btn)
         top_panel.addWidget(self.solve_btn)
+        top_panel.addWidget(self.stop_btn)
+        top_panel.addWidget(self.interrupt_btn)
+        top_panel.addWidget(self.sweep_btn)
         top_panel.addStretch()
 
         # Výběr řešiče
         top_panel.addWidget(QLabel("Řešič:"))
         self.solver_combo = QComboBox()
-        self.solver_combo.addItems(["PuLP (CBC)", "SciPy (HiGHS)", "OR-Tools (Google)"])
+        self.solver_combo.addItems(list(SOLVER_CHOICES))
+        self.solver_combo.setToolTip(
+            "Automaticky: řešič se zvolí podle vlastností úlohy a doby řešení "
+            "podobných úloh v historii"
+        )
         self.solver_combo.setCurrentIndex(0)
         top_panel.addWidget(self.solver_combo)
 
+        # Nativní nastavení řešiče (vlákna, mezera MIP, presolve, algoritmus)
+        self.solver_options = SolverOptions()
+        self.options_btn = QPushButton("⚙")
+        self.options_btn.setToolTip("Nastavení řešiče")
+        self.options_btn.clicked.connect(self.open_solver_options)
+        top_panel.addWidget(self.options_btn)
+
+        # Časový limit řešení (0 = bez limitu)
+        top_panel.addWidget(QLabel("Limit [s]:"))
+        self.time_limit_spin = QDoubleSpinBox()
+        self.time_limit_spin.setRange(0, 86400)
+        self.time_limit_spin.setDecimals(1)
+        self.time_limit_spin.setSpecialValueText("bez limitu")
+        self.time_limit_spin.setValue(0)
+        top_panel.addWidget(self.time_limit_spin)
+
+        # Redukce problému před řešením
+        self.presolve_check = QCheckBox("Presolve")
+        self.presolve_check.setToolTip(
+            "Před řešením odstraní zafixované proměnné, prázdná, jednoprvková "
+            "a duplicitní omezení"
+        )
+        top_panel.addWidget(self.presolve_check)
+
+        # Opakované řešení z předchozí báze (jen OR-Tools)
+        self.warm_start_check = QCheckBox("Teplý start")
+        self.warm_start_check.setToolTip(
+            "OR-Tools: model zůstává mezi řešeními v paměti, promítnou se do něj "
+            "jen změny a řešení pokračuje z předchozí báze (u MIP z předchozího "
+            "řešení)"
+        )
+        top_panel.addWidget(self.warm_start_check)
+
+        # Profilování řešení (cProfile a tracemalloc)
+        self.profile_check = QCheckBox("Profilovat")
+        self.profile_check.setToolTip(
+            "Řešení proběhne pod cProfile a tracemalloc (bez cache), profil "
+            f"a snímek paměti se uloží do {default_profile_dir()}"
+        )
+        self.profile_check.setChecked(profile_dir_from_env() is not None)
+        top_panel.addWidget(self.profile_check)
+
         # Cílová funkce
         top_panel.addWidget(QLabel("Cíl:"))
         self.obj_sense = QComboBox()
@@ -73,7 +212,7 @@ class LPWindow(QMainWindow):
         # Počet proměnných
         top_panel.addWidget(QLabel("Proměnné:"))
         self.var_spin = QSpinBox()
-        self.var_spin.setRange(1, 100)
+        self.var_spin.setRange(1, MAX_TABLE_SIZE)
         self.var_spin.setValue(3)
         self.var_spin.valueChanged.connect(self.rebuild_tables)
         top_panel.addWidget(self.var_spin)
@@ -81,7 +220,7 @@ class LPWindow(QMainWindow):
         # Počet omezení
         top_panel.addWidget(QLabel("Omezení:"))
         self.con_spin = QSpinBox()
-        self.con_spin.setRange(1, 100)
+        self.con_spin.setRange(1, MAX_TABLE_SIZE)
         self.con_spin.setValue(3)
         self.con_spin.valueChanged.connect(self.rebuild_tables)
         top_panel.addWidget(self.con_spin)
@@ -92,13 +231,23 @@ class LPWindow(QMainWindow):
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs)
 
-        self.tab_vars = QTableWidget()
+        # Tabulky jsou pohledy nad modely s poli NumPy (viz table_models.py)
+        self.vars_model = VariablesModel()
+        self.obj_model = ObjectiveModel()
+        self.cons_model = ConstraintsModel()
+
+        self.tab_vars = self._make_table_view(self.vars_model)
+        self.tab_vars.setItemDelegateForColumn(
+            VariablesModel.TYPE_COLUMN, ComboDelegate(TYPE_LABELS, self.tab_vars)
+        )
+        self.tab_vars.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.tabs.addTab(self.tab_vars, "Proměnné")
 
-        self.tab_obj = QTableWidget()
+        self.tab_obj = self._make_table_view(self.obj_model)
         self.tabs.addTab(self.tab_obj, "Účelová funkce")
 
-        self.tab_cons = QTableWidget()
+        self.tab_cons = self._make_table_view(self.cons_model)
+        self.rel_delegate = ComboDelegate(RELATIONS, self.tab_cons)
         self.tabs.addTab(self.tab_cons, "Omezení")
 
         # Tab nápověda
@@ -114,7 +263,7 @@ class LPWindow(QMainWindow):
             "   • Omezení: koeficienty, relace (≤/≥/=), pravá strana\n"
             "4. Stav tabulek lze kdykoliv uložit\n"
             "5. Klikněte na 'Řešit'\n"
-            "6. V případě, že by řešení trvalo příliš dlouho, lze kliknout na tlačítko 'Nový' pro kompletní restart, nebo libovolně upravit hodnoty a zahájit řešení znovu\n"
+            "6. Řešení lze kdykoliv ukončit tlačítkem 'Zastavit' (případně 'Nový' pro kompletní restart) a poté libovolně upravit hodnoty a zahájit řešení znovu. Pole 'Limit [s]' nastaví časový limit řešení, volba 'Presolve' před řešením zjednoduší problém a volba 'Teplý start' (OR-Tools) při opakovaném řešení promítne do modelu jen změny\n"
             "7. Výsledky se zobrazí v samostatném novém tabu"
         )
         help_label.setWordWrap(True)
@@ -128,254 +277,325 @@ class LPWindow(QMainWindow):
         self.interpret_label.setWordWrap(True)
         main_layout.addWidget(self.interpret_label)
 
+        # Graf průběhu řešení MIP (nejlepší řešení a mez v čase)
+        self.convergence_chart = ConvergenceChart()
+        self.convergence_chart.hide()
+        main_layout.addWidget(self.convergence_chart)
+
+        # Průběh řešení se z threadu vyzvedává časovačem
+        self.solve_message = ""
+        # Poznámka k volbě řešiče, zobrazená ve stavovém řádku
+        self.solver_note = ""
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self.progress_timer.timeout.connect(self.update_solve_progress)
+
         # Status
+        status_bar = QHBoxLayout()
         self.status_label = QLabel("Status: Připraveno")
         self.status_label.setStyleSheet("color: #666; padding: 5px;")
-        main_layout.addWidget(self.status_label)
+        status_bar.addWidget(self.status_label)
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setMaximumWidth(200)
+        self.load_progress.hide()
+        status_bar.addWidget(self.load_progress)
+        self.chart_check = QCheckBox("Graf průběhu")
+        self.chart_check.setToolTip(
+            "Zobrazí vývoj nejlepšího nalezeného řešení a meze účelové funkce"
+        )
+        self.chart_check.toggled.connect(self.convergence_chart.setVisible)
+        status_bar.addWidget(self.chart_check)
+        status_bar.addStretch()
+        self.cache_label = QLabel(self.result_cache.stats_text())
+        self.cache_label.setStyleSheet("color: #666; padding: 5px;")
+        status_bar.addWidget(self.cache_label)
+        main_layout.addLayout(status_bar)
 
         self.rebuild_tables()
 
+    @staticmethod
+    def _make_table_view(model) -> QTableView:
+        view = QTableView()
+        view.setModel(model)
+        view.setEditTriggers(
+            QTableView.DoubleClicked
+            | QTableView.SelectedClicked
+            | QTableView.EditKeyPressed
+            | QTableView.AnyKeyPressed
+        )
+        # Pevná výška řádků - pohled nemusí měřit obsah každého řádku
+        view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        return view
+
+    @staticmethod
+    def _fit_columns(view: QTableView, n_cols: int):
+        """Malé tabulky se roztáhnou na šířku okna, velké se posouvají"""
+        header = view.horizontalHeader()
+        if n_cols <= STRETCH_COLUMNS:
+            header.setSectionResizeMode(QHeaderView.Stretch)
+        else:
+            header.setSectionResizeMode(QHeaderView.Interactive)
+
     def rebuild_tables(self):
         """Přestavení tabulek podle počtu proměnných a omezení"""
         n_vars = self.var_spin.value()
         n_cons = self.con_spin.value()
 
-        # ========== VARS ==========
-        self.tab_vars.setColumnCount(4)
-        self.tab_vars.setHorizontalHeaderLabels(
-            ["Název", "Dolní mez", "Horní mez", "Typ"]
-        )
-        self.tab_vars.setRowCount(n_vars)
-
-        for i in range(n_vars):
-            if self.tab_vars.item(i, 0) is None:
-                self.tab_vars.setItem(i, 0, QTableWidgetItem(f"x{i+1}"))
-            if self.tab_vars.item(i, 1) is None:
-                self.tab_vars.setItem(i, 1, QTableWidgetItem("0"))
-            if self.tab_vars.item(i, 2) is None:
-                self.tab_vars.setItem(i, 2, QTableWidgetItem(""))
-            if self.tab_vars.cellWidget(i, 3) is None:
-                combo = QComboBox()
-                combo.addItems(["Reálné", "Celočíselné"])
-                self.tab_vars.setCellWidget(i, 3, combo)
-
-        self.tab_vars.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-        # ========== OBJECTIVE ==========
-        self.tab_obj.setRowCount(1)
-        self.tab_obj.setColumnCount(n_vars)
-        self.tab_obj.setHorizontalHeaderLabels([f"x{i+1}" for i in range(n_vars)])
-        for j in range(n_vars):
-            if self.tab_obj.item(0, j) is None:
-                self.tab_obj.setItem(0, j, QTableWidgetItem("0"))
-        self.tab_obj.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-        # ========== CONSTRAINTS ==========
-        for r in range(self.tab_cons.rowCount()):
-            for c in range(self.tab_cons.columnCount()):
-                widget = self.tab_cons.cellWidget(r, c)
-                if widget is not None:
-                    self.tab_cons.removeCellWidget(r, c)
-
-        self.tab_cons.setRowCount(n_cons)
-        self.tab_cons.setColumnCount(n_vars + 2)
-        self.tab_cons.setHorizontalHeaderLabels(
-            [f"x{i+1}" for i in range(n_vars)] + ["Relace", "Pravá strana"]
+        # Modely jen přidají nebo odeberou řádky a sloupce na konci;
+        # pohledy se překreslí jednou až po všech změnách
+        views = (self.tab_vars, self.tab_obj, self.tab_cons)
+        for view in views:
+            view.setUpdatesEnabled(False)
+
+        old_rel_column = self.cons_model.rel_column
+        self.vars_model.resize(n_vars)
+        self.obj_model.resize(n_vars)
+        self.cons_model.resize(n_cons, n_vars)
+
+        # Sloupec relace se posouvá s počtem proměnných
+        self.tab_cons.setItemDelegateForColumn(old_rel_column, None)
+        self.tab_cons.setItemDelegateForColumn(
+            self.cons_model.rel_column, self.rel_delegate
         )
+        self._fit_columns(self.tab_obj, n_vars)
+        self._fit_columns(self.tab_cons, n_vars + 2)
 
-        for r in range(n_cons):
-            # Koeficienty proměnných
-            for c in range(n_vars):
-                self.tab_cons.setItem(r, c, QTableWidgetItem("0"))
-
-            # Předposlední sloupec = combobox pro relaci
-            combo_rel = QComboBox()
-            combo_rel.addItems(["≤", "≥", "="])
-            self.tab_cons.setCellWidget(r, n_vars, combo_rel)
+        for view in views:
+            view.setUpdatesEnabled(True)
+        self.status_label.setText("Status: Tabulky aktualizovány")
 
-            # Poslední sloupec = pravá strana
-            self.tab_cons.setItem(r, n_vars + 1, QTableWidgetItem("0"))
+    def read_problem(self) -> Optional[LPProblem]:
+        """Ověření tabulek a sestavení problému v jednom průchodu.
 
-        self.tab_cons.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.status_label.setText("Status: Tabulky aktualizovány")
+        Při chybách je zobrazí, přepne na první chybnou buňku a vrátí None.
+        """
+        problem, errors = build_problem(
+            self.vars_model,
+            self.obj_model,
+            self.cons_model,
+            self.obj_sense.currentText(),
+        )
+        if errors:
+            first = errors[0]
+            view = {
+                self.vars_model: self.tab_vars,
+                self.obj_model: self.tab_obj,
+                self.cons_model: self.tab_cons,
+            }[first.model]
+            self.tabs.setCurrentWidget(view)
+            view.scrollTo(first.model.index(first.row, first.col))
+
+            lines = [e.message for e in errors[:MAX_SHOWN_ERRORS]]
+            if len(errors) > MAX_SHOWN_ERRORS:
+                lines.append(f"... a dalších {len(errors) - MAX_SHOWN_ERRORS} chyb")
+            QMessageBox.critical(self, "Chyba vstupu", "\n".join(lines))
+        return problem
+
+    def set_problem(self, problem: LPProblem):
+        """Zobrazení problému v tabulkách jednou hromadnou výměnou polí"""
+        for spin, value in (
+            (self.var_spin, problem.n_vars),
+            (self.con_spin, problem.n_cons),
+        ):
+            spin.blockSignals(True)
+            spin.setValue(value)
+            spin.blockSignals(False)
+        self.obj_sense.setCurrentText(problem.sense)
+
+        old_rel_column = self.cons_model.rel_column
+        self.vars_model.set_arrays(
+            problem.names, problem.lower, problem.upper, problem.integer
+        )
+        self.obj_model.set_arrays(problem.obj_coeffs)
+        self.cons_model.set_arrays(problem.matrix, problem.rel, problem.rhs)
 
-    def validate_tables(self):
-        """Validace vstupních dat v tabulkách"""
-        errors = []
-
-        def reset_bg(table):
-            for r in range(table.rowCount()):
-                for c in range(table.columnCount()):
-                    item = table.item(r, c)
-                    if item:
-                        item.setBackground(Qt.white)
-
-        reset_bg(self.tab_vars)
-        reset_bg(self.tab_obj)
-        reset_bg(self.tab_cons)
-
-        # ========== VARS ==========
-        for r in range(self.tab_vars.rowCount()):
-            name = self.tab_vars.item(r, 0).text().strip()
-            if not name:
-                self.tab_vars.item(r, 0).setBackground(Qt.red)
-                errors.append(f"Proměnná {r+1}: prázdné jméno")
-
-            low_txt = self.tab_vars.item(r, 1).text().strip()
-            up_txt = self.tab_vars.item(r, 2).text().strip()
-
-            if low_txt:
-                try:
-                    float(low_txt)
-                except:
-                    self.tab_vars.item(r, 1).setBackground(Qt.red)
-                    errors.append(f"Proměnná {name}: chybná dolní mez")
-            if up_txt:
-                try:
-                    float(up_txt)
-                except:
-                    self.tab_vars.item(r, 2).setBackground(Qt.red)
-                    errors.append(f"Proměnná {name}: chybná horní mez")
-
-        # ========== OBJECTIVE ==========
-        for c in range(self.tab_obj.columnCount()):
-            txt = self.tab_obj.item(0, c).text().strip()
-            if txt:
-                try:
-                    float(txt)
-                except:
-                    self.tab_obj.item(0, c).setBackground(Qt.red)
-                    errors.append(f"Účelová funkce: neplatný koef. u x{c+1}")
-
-        # ========== CONSTRAINTS ==========
-        n_vars = self.var_spin.value()
-        for r in range(self.tab_cons.rowCount()):
-            for c in range(n_vars):
-                txt = self.tab_cons.item(r, c).text().strip()
-                if txt:
-                    try:
-                        float(txt)
-                    except:
-                        self.tab_cons.item(r, c).setBackground(Qt.red)
-                        errors.append(f"Omezení {r+1}: neplatný koef. u x{c+1}")
-
-            rhs_txt = self.tab_cons.item(r, n_vars + 1).text().strip()
-            if rhs_txt:
-                try:
-                    float(rhs_txt)
-                except:
-                    self.tab_cons.item(r, n_vars + 1).setBackground(Qt.red)
-                    errors.append(f"Omezení {r+1}: neplatná pravá strana")
-
-        return errors
-
-    def get_variables(self) -> List[Variable]:
-        """Získání proměnných z tabulky"""
-        data = []
-        for r in range(self.tab_vars.rowCount()):
-            name = self.tab_vars.item(r, 0).text()
-            low_txt = self.tab_vars.item(r, 1).text().strip()
-            up_txt = self.tab_vars.item(r, 2).text().strip()
-
-            low = float(low_txt) if low_txt != "" else None
-            up = float(up_txt) if up_txt != "" else None
-
-            combo = self.tab_vars.cellWidget(r, 3)
-            gui_type = combo.currentText()
-            vtype = "Continuous" if gui_type == "Reálné" else "Integer"
-
-            data.append(Variable(name, low, up, vtype))
-        return data
-
-    def get_objective(self) -> Objective:
-        """Získání účelové funkce z tabulky"""
-        coeffs = []
-        for c in range(self.tab_obj.columnCount()):
-            try:
-                coeffs.append(float(self.tab_obj.item(0, c).text()))
-            except:
-                coeffs.append(0.0)
-        return Objective(self.obj_sense.currentText(), coeffs)
-
-    def get_constraints(self) -> List[Constraint]:
-        """Získání omezení z tabulky"""
-        cons = []
-        n_vars = self.var_spin.value()
-        for r in range(self.tab_cons.rowCount()):
-            coeffs = [
-                float(self.tab_cons.item(r, c).text() or "0") for c in range(n_vars)
-            ]
-            rel = self.tab_cons.cellWidget(r, n_vars).currentText()
-            rhs = float(self.tab_cons.item(r, n_vars + 1).text() or "0")
-            cons.append(Constraint(coeffs, rel, rhs))
-        return cons
+        self.tab_cons.setItemDelegateForColumn(old_rel_column, None)
+        self.tab_cons.setItemDelegateForColumn(
+            self.cons_model.rel_column, self.rel_delegate
+        )
+        self._fit_columns(self.tab_obj, problem.n_vars)
+        self._fit_columns(self.tab_cons, problem.n_vars + 2)
 
     def solve_problem(self):
         """Řešení LP problému"""
-        errors = self.validate_tables()
-        if errors:
-            QMessageBox.critical(self, "Chyba vstupu", "\n".join(errors))
+        problem = self.read_problem()
+        if problem is None:
             return
 
         try:
-            variables = self.get_variables()
-            objective = self.get_objective()
-            constraints = self.get_constraints()
-
-            problem = LPProblem(
-                variables=variables, objective=objective, constraints=constraints
-            )
 
             # Výběr řešiče
-            solver_name = self.solver_combo.currentText()
-            if "SciPy" in solver_name:
-                solver = SciPySolver()
-                has_integer = any(v.vtype == "Integer" for v in variables)
-                if has_integer:
-                    QMessageBox.warning(
-                        self, "Upozornění", "SciPy nepodporuje celočíselné proměnné.\n"
-                    )
-            elif "OR-Tools" in solver_name:
-                solver = ORToolsSolver()
+            backend = SOLVER_CHOICES[self.solver_combo.currentText()]
+            if backend == "ortools" and self.warm_start_check.isChecked():
+                solver = self.solve_session
             else:
-                solver = PuLPSolver()
+                solver = create_solver(backend)
+            self.solver_note = ""
+            if problem.has_integers and not solver.supports_integers:
+                # Řešič celočíselné proměnné ignoruje, zvolí se jiný
+                self.solver_note = (
+                    f"{self.solver_combo.currentText()} neřeší celočíselné "
+                    "proměnné, řešič zvolen automaticky"
+                )
+                solver = AutoSolver()
 
             self.solve_btn.setEnabled(False)
-            self.status_label.setText("Status: Řešení probíhá...")
+            self.stop_btn.setEnabled(True)
+            self.status_label.setText(
+                f"Status: Řešení probíhá...{self.note_suffix()}"
+            )
 
-            self.solver_thread = SolverThread(problem, solver)
+            # Řešič běží v samostatném (opakovaně použitém) procesu, aby šel
+            # tvrdě zastavit
+            # (portfolio spouští své řešiče v procesech samo, relace teplého
+            # startu musí zůstat v tomto procesu a přerušuje se sama)
+            # Doba řešení se připíše do historie pro automatickou volbu
+            if not isinstance(solver, (PortfolioSolver, SolveSession)):
+                solver = StatsSolver(ProcessSolver(solver), self.solve_history)
+            solver = CachedSolver(PresolveSolver(solver), self.result_cache)
+            if self.metrics_hook is not None:
+                solver = MetricsSolver(solver, self.metrics_hook)
+            self.solver_thread = SolverThread(
+                problem,
+                solver,
+                self.current_options(),
+                default_profile_dir() if self.profile_check.isChecked() else None,
+            )
             self.solver_thread.finished.connect(self.on_solve_finished)
             self.solver_thread.error.connect(self.on_solve_error)
             self.solver_thread.progress.connect(self.on_solve_progress)
+            self.convergence_chart.clear()
             self.solver_thread.start()
+            self.progress_timer.start()
+            self.interrupt_btn.setEnabled(True)
 
         except Exception as e:
             QMessageBox.critical(self, "Chyba", str(e))
             self.solve_btn.setEnabled(True)
+            self.stop_btn.setEnabled(self.loader_thread is not None)
             self.status_label.setText("Status: Chyba")
 
+    def current_options(self) -> SolverOptions:
+        """Nastavení řešiče podle horního panelu a dialogu nastavení"""
+        time_limit = self.time_limit_spin.value()
+        return replace(
+            self.solver_options,
+            time_limit=time_limit if time_limit > 0 else None,
+            presolve=self.presolve_check.isChecked(),
+        )
+
+    def set_options(self, options: SolverOptions):
+        self.solver_options = options
+        self.time_limit_spin.setValue(options.time_limit or 0)
+        self.presolve_check.setChecked(options.presolve)
+
+    def open_solver_options(self):
+        """Dialog nativního nastavení řešiče"""
+        dialog = SolverOptionsDialog(self.current_options(), self)
+        if dialog.exec() == SolverOptionsDialog.Accepted:
+            self.solver_options = dialog.options()
+
+    def open_parametric(self):
+        """Parametrická analýza aktuálního problému v samostatném dialogu"""
+        problem = self.read_problem()
+        if problem is None:
+            return
+        time_limit = self.time_limit_spin.value()
+        dialog = ParametricDialog(problem, time_limit or None, self)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.show()
+
+    def stop_solving(self):
+        """Zastavení probíhajícího řešení"""
+        thread = self.solver_thread
+        if thread is None or not thread.isRunning():
+            return
+
+        # Odpojení signálů zaručí, že se výsledek zrušeného řešení už neobjeví
+        thread.finished.disconnect(self.on_solve_finished)
+        thread.error.disconnect(self.on_solve_error)
+        thread.progress.disconnect(self.on_solve_progress)
+        thread.cancel()
+
+        # Reference na thread se drží, dokud nedoběhne
+        self._stopped_threads = [t for t in self._stopped_threads if t.isRunning()]
+        self._stopped_threads.append(thread)
+        self.solver_thread = None
+        self.end_solve_progress()
+
+        self.solve_btn.setEnabled(True)
+        self.stop_btn.setEnabled(self.loader_thread is not None)
+        self.status_label.setText("Status: Řešení zastaveno")
+
+    def interrupt_solving(self):
+        """Předčasné ukončení řešení s nejlepším dosud nalezeným řešením"""
+        thread = self.solver_thread
+        if thread is None or not thread.isRunning():
+            return
+        thread.interrupt()
+        self.interrupt_btn.setEnabled(False)
+        self.solve_message = "Ukončování, řešič vrací nejlepší nalezené řešení..."
+        self.update_solve_progress()
+
+    def update_solve_progress(self):
+        """Obnoví průběh řešení ve stavovém řádku a v grafu"""
+        thread = self.solver_thread
+        if thread is None:
+            return
+        progress = thread.latest_progress()
+        self.convergence_chart.add_progress(progress)
+        self.status_label.setText(
+            f"Status: {self.solve_message} {format_progress(progress)}"
+            f"{self.note_suffix()}"
+        )
+
+    def note_suffix(self) -> str:
+        """Poznámka k volbě řešiče pro konec stavového řádku"""
+        return f" ({self.solver_note})" if self.solver_note else ""
+
+    def end_solve_progress(self):
+        self.progress_timer.stop()
+        self.interrupt_btn.setEnabled(False)
+
+    def closeEvent(self, event):
+        self.stop_solving()
+        self.stop_loading()
+        for thread in self._stopped_threads:
+            thread.wait()
+        super().closeEvent(event)
+
     def on_solve_progress(self, message: str):
         """Handler pro aktualizaci průběhu řešení"""
-        self.status_label.setText(f"Status: {message}")
+        self.solve_message = message
+        self.status_label.setText(f"Status: {message}{self.note_suffix()}")
 
     def on_solve_error(self, error_message: str):
         """Handler pro chyby při řešení"""
+        self.end_solve_progress()
         QMessageBox.critical(self, "Chyba při řešení", error_message)
         self.solve_btn.setEnabled(True)
+        self.stop_btn.setEnabled(self.loader_thread is not None)
         self.status_label.setText("Status: Chyba")
 
     def on_solve_finished(self, result: SolverResult):
         """Handler pro dokončení řešení"""
+        self.update_solve_progress()
+        self.end_solve_progress()
         self.solve_btn.setEnabled(True)
+        self.stop_btn.setEnabled(self.loader_thread is not None)
 
+        self.cache_label.setText(self.result_cache.stats_text())
         if result.error_message:
             QMessageBox.critical(self, "Chyba", result.error_message)
             self.status_label.setText("Status: Chyba při řešení")
             return
 
         self.display_results(result)
+        source = " z cache" if result.from_cache else ""
         self.status_label.setText(
-            f"Status: Hotovo ({result.solve_time:.3f}s) - {result.status}"
+            f"Status: Hotovo{source} ({result.solve_time:.3f}s) - {result.status}"
+            f"{self.note_suffix()}"
         )
 
     def display_results(self, result: SolverResult):
@@ -416,6 +636,28 @@ class LPWindow(QMainWindow):
         if result.status == "Optimal":
             interpretace += "Nalezeno optimální řešení\n"
             interpretace += f"Čas řešení: {result.solve_time:.3f} sekund\n"
+            timings = result.timings
+            if timings is not None:
+                interpretace += (
+                    f" Z toho import knihovny: {timings.import_time:.3f} s, "
+                    f"sestavení modelu: {timings.build_time:.3f} s, "
+                    f"běh řešiče: {timings.native_time:.3f} s, "
+                    f"převod výsledku: {timings.extract_time:.3f} s\n"
+                )
+            counters = result.counters
+            if counters is not None:
+                parts = [
+                    f"{label}: {value}"
+                    for label, value in (
+                        ("iterace", counters.iterations),
+                        ("uzly větvení", counters.nodes),
+                    )
+                    if value is not None
+                ]
+                if counters.gap is not None:
+                    parts.append(f"mezera: {counters.gap:.2%}")
+                if parts:
+                    interpretace += f" Řešič: {', '.join(parts)}\n"
             interpretace += f" Hodnota účelové funkce: {result.objective_value:.6f}\n"
         elif result.status == "Infeasible":
             interpretace += "Problém nemá přípustné řešení\n"
@@ -423,77 +665,169 @@ class LPWindow(QMainWindow):
         elif result.status == "Unbounded":
             interpretace += "Problém je neomezený\n"
             interpretace += "Přidejte další omezení pro ohraničení řešení\n"
+        elif result.status in ("TimeLimit", "Cancelled"):
+            if result.status == "TimeLimit":
+                interpretace += "Řešení bylo ukončeno po vypršení časového limitu\n"
+            else:
+                interpretace += "Řešení bylo zrušeno\n"
+            if result.objective_value is not None:
+                interpretace += (
+                    "Zobrazeno nejlepší nalezené (neověřené) řešení, "
+                    f"hodnota účelové funkce: {result.objective_value:.6f}\n"
+                )
+            else:
+                interpretace += "Do ukončení nebylo nalezeno žádné přípustné řešení\n"
         else:
             interpretace += f"Status: {result.status}\n"
 
+        if result.backend_choice:
+            interpretace += (
+                f"Automaticky zvolený řešič: {result.backend} "
+                f"({result.backend_choice})\n"
+            )
+        elif result.backend:
+            interpretace += f"Vítězný řešič: {result.backend}\n"
+        if result.backend_times:
+            interpretace += "Časy řešičů: " + ", ".join(
+                f"{name} {t:.3f} s" for name, t in result.backend_times.items()
+            ) + "\n"
+        stats = result.presolve_stats
+        if stats is not None:
+            interpretace += (
+                f"Presolve ({stats.time:.3f} s, {stats.passes} průchodů): "
+                f"odstraněno {stats.rows_removed} omezení, "
+                f"{stats.cols_removed} proměnných, {stats.nnz_removed} koeficientů\n"
+            )
+            if stats.infeasible:
+                interpretace += "Nepřípustnost odhalil již presolve\n"
+        if result.session_changes is not None:
+            interpretace += (
+                f"Teplý start: do modelu promítnuto {result.session_changes} změn\n"
+            )
+        profile = result.profile
+        if profile is not None:
+            # V panelu jen začátek souhrnu, celý profil je v uložených souborech
+            if profile.hotspots:
+                interpretace += "Profil - nejvíce času (vlastní čas, volání, funkce):\n"
+                interpretace += "".join(
+                    f" {line.strip()}\n" for line in profile.hotspots[:5]
+                )
+            if profile.memory_top:
+                interpretace += (
+                    f"Profil - paměť (špička {profile.peak_memory_mb:.1f} MB), "
+                    "největší alokace:\n"
+                )
+                interpretace += "".join(
+                    f" {line.strip()}\n" for line in profile.memory_top[:5]
+                )
+            interpretace += "Uloženo: " + ", ".join(
+                path
+                for path in (profile.profile_path, profile.snapshot_path)
+                if path is not None
+            ) + "\n"
+
         self.interpret_label.setText(interpretace)
 
     def save_problem(self):
-        """Uložení problému do JSON souboru"""
-        fname, _ = QFileDialog.getSaveFileName(self, "Uložit", "", "JSON (*.json)")
+        """Uložení problému do souboru (JSON, binární, MPS nebo CPLEX LP)"""
+        fname, _ = QFileDialog.getSaveFileName(self, "Uložit", "", SAVE_FILTER)
         if not fname:
             return
+        problem = self.read_problem()
+        if problem is None:
+            return
         try:
-            data = {
-                "n_vars": self.var_spin.value(),
-                "n_cons": self.con_spin.value(),
-                "obj_sense": self.obj_sense.currentText(),
+            extra = {
                 "solver": self.solver_combo.currentText(),
-                "variables": [v.__dict__ for v in self.get_variables()],
-                "objective": self.get_objective().__dict__,
-                "constraints": [c.__dict__ for c in self.get_constraints()],
+                "solver_options": asdict(self.current_options()),
             }
-            with open(fname, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            fmt = file_format(fname)
+            if fmt == ".json":
+                save_json(fname, problem, extra=extra)
+            elif fmt == ".lpb":
+                write_binary(fname, problem, extra=extra)
+            else:
+                save_problem_file(fname, problem)
             QMessageBox.information(self, "Hotovo", "Úloha uložena.")
         except Exception as e:
             QMessageBox.critical(self, "Chyba", str(e))
 
     def load_problem(self):
-        """Načtení problému z JSON souboru"""
-        fname, _ = QFileDialog.getOpenFileName(self, "Načíst", "", "JSON (*.json)")
+        """Načtení problému ze souboru (JSON, binární, MPS nebo CPLEX LP).
+
+        Soubor se čte a převádí v LoaderThread, GUI mezitím zůstává
+        responzivní a načítání lze zrušit tlačítkem 'Zastavit'.
+        """
+        if self.loader_thread is not None:
+            return
+        fname, _ = QFileDialog.getOpenFileName(self, "Načíst", "", LOAD_FILTER)
         if not fname:
             return
-        try:
-            with open(fname, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            self.var_spin.setValue(data["n_vars"])
-            self.con_spin.setValue(data["n_cons"])
-            self.obj_sense.setCurrentText(data["obj_sense"])
-
-            if "solver" in data:
-                self.solver_combo.setCurrentText(data["solver"])
 
-            self.rebuild_tables()
+        self.loader_thread = LoaderThread(fname)
+        self.loader_thread.finished.connect(self.on_load_finished)
+        self.loader_thread.error.connect(self.on_load_error)
+        self.loader_thread.progress.connect(self.load_progress.setValue)
+        self.loader_thread.start()
+
+        self.load_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.load_progress.setValue(0)
+        self.load_progress.show()
+        self.status_label.setText("Status: Načítání...")
+
+    def stop_loading(self):
+        """Zrušení probíhajícího načítání"""
+        thread = self.loader_thread
+        if thread is None:
+            return
 
-            for i, v in enumerate(data["variables"]):
-                self.tab_vars.item(i, 0).setText(v["name"])
-                self.tab_vars.item(i, 1).setText(
-                    "" if v["low"] is None else str(v["low"])
-                )
-                self.tab_vars.item(i, 2).setText(
-                    "" if v["up"] is None else str(v["up"])
-                )
-                combo = self.tab_vars.cellWidget(i, 3)
-                combo.setCurrentText(
-                    "Reálné" if v["vtype"] == "Continuous" else "Celočíselné"
+        thread.finished.disconnect(self.on_load_finished)
+        thread.error.disconnect(self.on_load_error)
+        thread.progress.disconnect(self.load_progress.setValue)
+        thread.cancel()
+
+        self._stopped_threads = [t for t in self._stopped_threads if t.isRunning()]
+        self._stopped_threads.append(thread)
+        self._load_done()
+        self.status_label.setText("Status: Načítání zrušeno")
+
+    def _load_done(self):
+        self.loader_thread = None
+        self.load_btn.setEnabled(True)
+        self.stop_btn.setEnabled(self.solver_thread is not None)
+        self.load_progress.hide()
+
+    def on_load_finished(self, problem: LPProblem, extra: dict, load_time: float):
+        """Handler pro dokončení načítání: hromadné vložení do tabulek"""
+        self._load_done()
+        self.solve_session = SolveSession()
+        self.set_problem(problem)
+        if "solver" in extra:
+            self.solver_combo.setCurrentText(extra["solver"])
+        if "solver_options" in extra:
+            try:
+                self.set_options(SolverOptions.from_dict(extra["solver_options"]))
+            except (TypeError, ValueError) as e:
+                QMessageBox.warning(
+                    self, "Upozornění", f"Nastavení řešiče nelze obnovit: {e}"
                 )
 
-            for i, coef in enumerate(data["objective"]["coeffs"]):
-                self.tab_obj.item(0, i).setText(str(coef))
-
-            for r, c in enumerate(data["constraints"]):
-                for j, coef in enumerate(c["coeffs"]):
-                    self.tab_cons.item(r, j).setText(str(coef))
-                rel_combo = self.tab_cons.cellWidget(r, len(c["coeffs"]))
-                rel_combo.setCurrentText(c["rel"])
-                self.tab_cons.item(r, len(c["coeffs"]) + 1).setText(str(c["rhs"]))
-
-            QMessageBox.information(self, "Hotovo", "Úloha načtena.")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Chyba", str(e))
+        message = (
+            f"Status: Načteno {problem.n_vars} proměnných, "
+            f"{problem.n_cons} omezení za {load_time:.2f} s"
+        )
+        rss = peak_rss_mb()
+        if rss is not None:
+            message += f" (paměť max. {rss:.0f} MB)"
+        self.status_label.setText(message)
+        QMessageBox.information(self, "Hotovo", "Úloha načtena.")
+
+    def on_load_error(self, error_message: str):
+        """Handler pro chyby při načítání"""
+        self._load_done()
+        self.status_label.setText("Status: Chyba při načítání")
+        QMessageBox.critical(self, "Chyba", error_message)
 
     def new_problem(self):
         """Vytvoření nového prázdného problému"""
@@ -506,6 +840,13 @@ class LPWindow(QMainWindow):
             )
             == QMessageBox.Yes
         ):
+            self.stop_solving()
+            self.stop_loading()
+            self.solve_session = SolveSession()
+            # Vyprázdnění modelů, aby se nepřevzaly hodnoty staré úlohy
+            self.vars_model.resize(0)
+            self.obj_model.resize(0)
+            self.cons_model.resize(0, 0)
             self.var_spin.setValue(3)
             self.con_spin.setValue(3)
             self.obj_sense.setCurrentIndex(0)
@@ -0,0 +1,120 @@
+"""
+Metriky řešení pro provozní sledování.
+
+MetricsSolver je obálka, která po každém řešení předá háčku (hook) plochý
+záznam s fázemi běhu řešiče, rozměry modelu a čítači nativního řešiče.
+Háček je libovolná funkce přijímající slovník; JsonLinesHook záznamy
+připisuje do souboru ve formátu JSON Lines.
+
+Aplikace (GUI i dávkové řešení) zapisuje metriky do souboru zadaného
+proměnnou prostředí LP_SOLVER_METRICS, pokud je nastavená:
+
+    LP_SOLVER_METRICS=metriky.jsonl python main.py
+"""
+
+import dataclasses
+import json
+import os
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+from models import LPProblem, ModelStats, SolverResult, SolverOptions
+from solver_base import AbstractLPSolver
+
+METRICS_ENV = "LP_SOLVER_METRICS"
+
+MetricsHook = Callable[[dict], None]
+
+
+def metrics_record(
+    problem: LPProblem, result: SolverResult, backend: Optional[str] = None
+) -> dict:
+    """Plochý záznam metrik jednoho řešení (vhodný pro JSON).
+
+    `backend` se použije, pokud řešič neuvedl, kdo výsledek vypočítal.
+    """
+    record = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "backend": result.backend or backend,
+        "status": result.status,
+        "solve_time": result.solve_time,
+        "from_cache": result.from_cache,
+        "problem": dataclasses.asdict(ModelStats.from_problem(problem)),
+    }
+    if result.timings is not None:
+        record.update(dataclasses.asdict(result.timings))
+    if result.model_stats is not None:
+        record["model"] = dataclasses.asdict(result.model_stats)
+    if result.counters is not None:
+        record.update(
+            (name, value)
+            for name, value in dataclasses.asdict(result.counters).items()
+            if value is not None
+        )
+    if result.presolve_stats is not None:
+        record["presolve_time"] = result.presolve_stats.time
+    if result.error_message:
+        record["error"] = result.error_message
+    return record
+
+
+class JsonLinesHook:
+    """Háček, který připisuje záznamy do souboru JSON Lines"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def hook_from_env() -> Optional[MetricsHook]:
+    """Háček podle proměnné LP_SOLVER_METRICS (None, pokud není nastavená)"""
+    path = os.environ.get(METRICS_ENV)
+    return JsonLinesHook(path) if path else None
+
+
+class MetricsSolver(AbstractLPSolver):
+    """Obálka, která po každém řešení předá záznam metrik háčku.
+
+    Chyba háčku řešení neovlivní, jen se vypíše na standardní chybový výstup.
+    """
+
+    def __init__(self, solver: AbstractLPSolver, hook: MetricsHook):
+        self.solver = solver
+        self.hook = hook
+
+    @property
+    def supports_integers(self):
+        return self.solver.supports_integers
+
+    def config(self) -> dict:
+        return self.solver.config()
+
+    def profiled(self, directory: Optional[str] = None, **kwargs) -> AbstractLPSolver:
+        return MetricsSolver(self.solver.profiled(directory, **kwargs), self.hook)
+
+    def cancel(self):
+        self.solver.cancel()
+
+    def interrupt(self):
+        self.solver.interrupt()
+
+    def set_progress_callback(self, callback):
+        self.solver.set_progress_callback(callback)
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        result = self.solver.solve(problem, options)
+        try:
+            backend = self.solver.config().get("backend")
+            self.hook(metrics_record(problem, result, backend))
+        except Exception as e:
+            print(f"Zápis metrik selhal: {e}", file=sys.stderr)
+        return result
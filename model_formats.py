@@ -0,0 +1,863 @@
+"""
+Import a export problémů ve formátech MPS (volný i pevný) a CPLEX LP.
+
+Soubory se čtou i zapisují proudově po řádcích: nenulové prvky matice se při
+čtení ukládají do kompaktních bufferů array.array (trojice řádek, sloupec,
+hodnota) a řídká matice se z nich sestaví až na konci. Paměť tak roste
+s velikostí modelu, ne s velikostí textu souboru. Soubory s příponou .gz
+se (de)komprimují průběžně.
+
+Příklad (převod a změření doby importu a špičkové paměti):
+    python model_formats.py velka_uloha.mps.gz velka_uloha.lp
+"""
+
+import argparse
+import gzip
+import io
+import math
+import os
+import re
+import sys
+import time
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from models import LPProblem, CSRMatrix, REL_LE, REL_GE, REL_EQ
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MAX_SENSE = "Maximalizovat"
+MIN_SENSE = "Minimalizovat"
+
+# Počet členů výrazu na jeden řádek LP souboru
+LP_TERMS_PER_LINE = 8
+# Úroveň komprese .gz: zápis je výrazně rychlejší než u výchozí 9,
+# soubor jen o málo větší
+GZIP_LEVEL = 6
+# Po kolika řádcích se při čtení hlásí průběh
+PROGRESS_LINES = 5000
+
+# Funkce volaná při čtení s podílem již přečtené části souboru (0 až 1)
+ProgressCallback = Callable[[float], None]
+
+
+def _open_text(path: str):
+    """Otevře textový soubor pro zápis, soubory .gz průběžně komprimuje"""
+    if path.lower().endswith(".gz"):
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=GZIP_LEVEL)
+    return open(path, "w", encoding="utf-8")
+
+
+def _read_lines(
+    path: str, progress: Optional[ProgressCallback] = None
+) -> Iterator[str]:
+    """Řádky textového souboru (.gz průběžně dekomprimuje).
+
+    Průběh se počítá z pozice v souboru na disku, u .gz tedy
+    z komprimovaných dat.
+    """
+    total = os.path.getsize(path) or 1
+    with open(path, "rb") as raw:
+        stream = gzip.GzipFile(fileobj=raw) if path.lower().endswith(".gz") else raw
+        with io.TextIOWrapper(stream, encoding="utf-8") as f:
+            for i, line in enumerate(f):
+                if progress is not None and i % PROGRESS_LINES == 0:
+                    progress(min(raw.tell() / total, 1.0))
+                yield line
+    if progress is not None:
+        progress(1.0)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Špičková paměť (RSS) procesu v MB, pokud ji systém umí zjistit"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux udává kB, macOS bajty
+    return rss / 1024**2 if sys.platform == "darwin" else rss / 1024
+
+
+def _fmt(value: float) -> str:
+    return repr(float(value))
+
+
+class _Columns:
+    """Společné buffery proměnných a nenulových prvků pro čtečky"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.lower = array("d")
+        self.upper = array("d")
+        self.integer = array("b")
+        self.obj = array("d")
+        # Nenulové prvky matice v COO tvaru
+        self.rows = array("q")
+        self.cols = array("q")
+        self.vals = array("d")
+
+    def add(self, name: str) -> int:
+        j = self.index.get(name)
+        if j is None:
+            j = len(self.names)
+            self.index[name] = j
+            self.names.append(name)
+            self.lower.append(0.0)
+            self.upper.append(math.inf)
+            self.integer.append(0)
+            self.obj.append(0.0)
+        return j
+
+    def build(self, sense: str, rel, rhs) -> LPProblem:
+        n_rows = len(rhs)
+        matrix = CSRMatrix.from_coo(
+            np.frombuffer(self.rows, dtype=np.int64),
+            np.frombuffer(self.cols, dtype=np.int64),
+            np.frombuffer(self.vals, dtype=np.float64),
+            (n_rows, len(self.names)),
+        )
+        return LPProblem.from_arrays(
+            names=self.names,
+            lower=np.frombuffer(self.lower, dtype=np.float64),
+            upper=np.frombuffer(self.upper, dtype=np.float64),
+            integer=np.frombuffer(self.integer, dtype=np.int8).astype(bool),
+            sense=sense,
+            objective=np.frombuffer(self.obj, dtype=np.float64),
+            matrix=matrix,
+            rel=np.frombuffer(rel, dtype=np.int8),
+            rhs=np.frombuffer(rhs, dtype=np.float64),
+        )
+
+
+# =====================================================================
+# MPS
+# =====================================================================
+
+_MPS_RELATIONS = {"L": REL_LE, "G": REL_GE, "E": REL_EQ}
+_OBJ_ROW = -1
+_FREE_ROW = -2
+_BOUND_WITH_VALUE = {"UP", "LO", "FX", "LI", "UI"}
+_MPS_SECTIONS = ("ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "OBJSENSE", "OBJNAME")
+
+
+class _MPSReader:
+    """Proudová čtečka MPS; řádky souboru se předávají metodě feed()"""
+
+    def __init__(self, fixed: bool):
+        self.fixed = fixed
+        self.section = None
+        self.handler = None
+        self.sense = MIN_SENSE
+        self.obj_name = None
+        self.has_objective = False
+        self.row_index: Dict[str, int] = {}
+        self.rel = array("b")
+        self.rhs = array("d")
+        self.ranges: Dict[int, float] = {}
+        self.columns = _Columns()
+        self.in_integer = False
+        self.current_name = None
+        self.current_col = -1
+        self.line_no = 0
+
+    # ========== ČLENĚNÍ ŘÁDKU ==========
+    def _fields(self, line: str) -> List[str]:
+        """Pole datového řádku v pozičním tvaru podle aktuální sekce"""
+        if self.fixed:
+            f = [
+                line[1:3], line[4:12], line[14:22],
+                line[24:36], line[39:47], line[49:61],
+            ]
+            f = [x.strip() for x in f]
+            if self.section == "ROWS":
+                return f[:2]
+            if self.section == "BOUNDS":
+                return f[:4] if f[3] else f[:3]
+            fields = f[1:]
+            while fields and not fields[-1]:
+                fields.pop()
+            return fields
+
+        f = line.split()
+        if self.section in ("RHS", "RANGES") and len(f) % 2 == 0:
+            # Chybí název sady pravých stran
+            f.insert(0, "")
+        elif self.section == "BOUNDS":
+            with_value = f[0].upper() in _BOUND_WITH_VALUE
+            if len(f) == (3 if with_value else 2):
+                f.insert(1, "")
+        return f
+
+    # ========== ZPRACOVÁNÍ ==========
+    def feed(self, line: str):
+        self.line_no += 1
+        if not line.strip() or line[0] == "*":
+            # PuLP zapisuje smysl optimalizace do komentáře "*SENSE:Maximize"
+            if line.startswith("*SENSE:"):
+                self._objsense([line[7:].strip()])
+            return
+        if line[0] not in " \t":
+            self._header(line.split())
+            return
+        if self.handler is None:
+            raise self._error("data mimo sekci")
+        try:
+            self.handler(self._fields(line))
+        except (ValueError, IndexError, KeyError) as e:
+            raise self._error(str(e)) from None
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"MPS, řádek {self.line_no}: {message}")
+
+    def _header(self, tokens: List[str]):
+        section = tokens[0].upper()
+        self.section, self.handler = None, None
+        if section in ("NAME", "ENDATA"):
+            return
+        if section not in _MPS_SECTIONS:
+            raise self._error(f"nepodporovaná sekce {section}")
+        if section in ("OBJSENSE", "OBJNAME") and len(tokens) > 1:
+            # Volný formát dovoluje hodnotu přímo na řádku se sekcí
+            getattr(self, "_" + section.lower())(tokens[1:])
+            return
+        self.section = section
+        self.handler = getattr(self, "_" + section.lower())
+
+    def _objsense(self, f):
+        value = f[0].upper()
+        if value in ("MAX", "MAXIMIZE"):
+            self.sense = MAX_SENSE
+        elif value in ("MIN", "MINIMIZE"):
+            self.sense = MIN_SENSE
+        else:
+            raise ValueError(f"neznámý smysl optimalizace {f[0]}")
+
+    def _objname(self, f):
+        self.obj_name = f[0]
+
+    def _rows(self, f):
+        kind, name = f[0].upper(), f[1]
+        if kind == "N":
+            # Účelovou funkcí je první řádek typu N (nebo řádek z OBJNAME)
+            if self.obj_name == name or (self.obj_name is None and not self.has_objective):
+                self.row_index[name] = _OBJ_ROW
+                self.has_objective = True
+            else:
+                self.row_index[name] = _FREE_ROW
+            return
+        self.row_index[name] = len(self.rel)
+        self.rel.append(_MPS_RELATIONS[kind])
+        self.rhs.append(0.0)
+
+    def _columns(self, f):
+        if len(f) >= 3 and "'MARKER'" in f:
+            self.in_integer = "'INTORG'" in f
+            return
+        columns = self.columns
+        if f[0] != self.current_name:
+            self.current_name = f[0]
+            self.current_col = columns.add(f[0])
+            if self.in_integer:
+                columns.integer[self.current_col] = 1
+        j = self.current_col
+        for k in range(1, len(f) - 1, 2):
+            r = self.row_index[f[k]]
+            value = float(f[k + 1])
+            if r >= 0:
+                columns.rows.append(r)
+                columns.cols.append(j)
+                columns.vals.append(value)
+            elif r == _OBJ_ROW:
+                columns.obj[j] += value
+
+    def _rhs(self, f):
+        for k in range(1, len(f) - 1, 2):
+            r = self.row_index[f[k]]
+            # Pravá strana účelové funkce (konstanta) se nepodporuje
+            if r >= 0:
+                self.rhs[r] = float(f[k + 1])
+
+    def _ranges(self, f):
+        for k in range(1, len(f) - 1, 2):
+            r = self.row_index[f[k]]
+            if r >= 0:
+                self.ranges[r] = float(f[k + 1])
+
+    def _bounds(self, f):
+        kind = f[0].upper()
+        j = self.columns.add(f[2])
+        value = float(f[3]) if len(f) > 3 and f[3] else 0.0
+        lower, upper = self.columns.lower, self.columns.upper
+        if kind in ("UP", "UI"):
+            # Záporná horní mez bez dolní meze ruší výchozí dolní mez 0
+            if value < 0 and lower[j] == 0.0:
+                lower[j] = -math.inf
+            upper[j] = value
+        elif kind in ("LO", "LI"):
+            lower[j] = value
+        elif kind == "FX":
+            lower[j] = upper[j] = value
+        elif kind == "FR":
+            lower[j], upper[j] = -math.inf, math.inf
+        elif kind == "MI":
+            lower[j] = -math.inf
+        elif kind == "PL":
+            upper[j] = math.inf
+        elif kind == "BV":
+            lower[j], upper[j] = 0.0, 1.0
+        else:
+            raise ValueError(f"nepodporovaný typ meze {kind}")
+        if kind in ("UI", "LI", "BV"):
+            self.columns.integer[j] = 1
+
+    # ========== SESTAVENÍ ==========
+    def finish(self) -> LPProblem:
+        if self.ranges:
+            self._split_ranges()
+        return self.columns.build(self.sense, self.rel, self.rhs)
+
+    def _split_ranges(self):
+        """Omezení s rozsahem (RANGES) se rozdělí na dvě jednostranná"""
+        columns = self.columns
+        ranged = np.array(sorted(self.ranges), dtype=np.int64)
+        new_index = np.full(len(self.rel), -1, dtype=np.int64)
+        new_index[ranged] = len(self.rel) + np.arange(len(ranged))
+
+        for r in ranged.tolist():
+            value, rhs, kind = self.ranges[r], self.rhs[r], self.rel[r]
+            if kind == REL_LE:
+                low, high = rhs - abs(value), rhs
+            elif kind == REL_GE:
+                low, high = rhs, rhs + abs(value)
+            elif value >= 0:
+                low, high = rhs, rhs + value
+            else:
+                low, high = rhs + value, rhs
+            self.rel[r], self.rhs[r] = REL_GE, low
+            self.rel.append(REL_LE)
+            self.rhs.append(high)
+
+        rows = np.frombuffer(columns.rows, dtype=np.int64)
+        mask = new_index[rows] >= 0
+        extra_rows = new_index[rows[mask]]
+        extra_cols = np.frombuffer(columns.cols, dtype=np.int64)[mask]
+        extra_vals = np.frombuffer(columns.vals, dtype=np.float64)[mask]
+        del rows
+        columns.rows.extend(array("q", extra_rows.tobytes()))
+        columns.cols.extend(array("q", extra_cols.tobytes()))
+        columns.vals.extend(array("d", extra_vals.tobytes()))
+
+
+def read_mps(
+    path: str, fixed: bool = False, progress: Optional[ProgressCallback] = None
+) -> LPProblem:
+    """Načte problém z MPS souboru (volný formát, nebo pevný při fixed=True)"""
+    reader = _MPSReader(fixed)
+    for line in _read_lines(path, progress):
+        reader.feed(line)
+    return reader.finish()
+
+
+def _check_names(names: List[str], pattern, fmt: str):
+    for name in names:
+        if not pattern.fullmatch(name):
+            raise ValueError(f"Název proměnné '{name}' nelze zapsat ve formátu {fmt}")
+
+
+def _column_major(problem: LPProblem):
+    """Nenulové prvky seřazené po sloupcích (indptr sloupců, řádky, hodnoty)"""
+    matrix = problem.matrix
+    order = np.argsort(matrix.indices, kind="stable")
+    col_ptr = np.zeros(problem.n_vars + 1, dtype=np.int64)
+    np.cumsum(np.bincount(matrix.indices, minlength=problem.n_vars), out=col_ptr[1:])
+    return col_ptr, matrix.row_indices()[order], matrix.data[order]
+
+
+_MPS_NAME = re.compile(r"\S+")
+
+
+def write_mps(path: str, problem: LPProblem, name: str = "LP"):
+    """Uloží problém do MPS souboru ve volném formátu"""
+    _check_names(problem.names, _MPS_NAME, "MPS")
+    col_ptr, col_rows, col_vals = _column_major(problem)
+    names = problem.names
+    obj = problem.obj_coeffs.tolist()
+
+    with _open_text(path) as f:
+        f.write(f"NAME          {name}\n")
+        if problem.maximize:
+            f.write("OBJSENSE\n    MAX\n")
+        f.write("ROWS\n N  OBJ\n")
+        codes = "LGE"
+        f.writelines(
+            f" {codes[code]}  R{i + 1}\n" for i, code in enumerate(problem.rel.tolist())
+        )
+
+        f.write("COLUMNS\n")
+        in_integer = False
+        for j, is_integer in enumerate(problem.integer.tolist()):
+            if is_integer != in_integer:
+                marker = "INTORG" if is_integer else "INTEND"
+                f.write(f"    MARKER                 'MARKER'                 '{marker}'\n")
+                in_integer = is_integer
+            start, end = col_ptr[j], col_ptr[j + 1]
+            # Proměnná bez koeficientů se musí objevit alespoň u účelové funkce
+            if obj[j] != 0 or start == end:
+                f.write(f"    {names[j]}  OBJ  {_fmt(obj[j])}\n")
+            f.writelines(
+                f"    {names[j]}  R{r + 1}  {_fmt(v)}\n"
+                for r, v in zip(
+                    col_rows[start:end].tolist(), col_vals[start:end].tolist()
+                )
+            )
+        if in_integer:
+            f.write("    MARKER                 'MARKER'                 'INTEND'\n")
+
+        f.write("RHS\n")
+        f.writelines(
+            f"    RHS  R{i + 1}  {_fmt(v)}\n"
+            for i, v in enumerate(problem.rhs.tolist())
+            if v != 0
+        )
+
+        f.write("BOUNDS\n")
+        for j, (low, up, is_integer) in enumerate(
+            zip(problem.lower.tolist(), problem.upper.tolist(), problem.integer.tolist())
+        ):
+            f.writelines(_mps_bounds(names[j], low, up, is_integer))
+        f.write("ENDATA\n")
+
+
+def _mps_bounds(name: str, low: float, up: float, is_integer: bool):
+    if low == up:
+        yield f" FX BND  {name}  {_fmt(low)}\n"
+        return
+    if low == -math.inf and up == math.inf:
+        yield f" FR BND  {name}\n"
+        return
+    if low == -math.inf:
+        yield f" MI BND  {name}\n"
+    elif low != 0:
+        yield f" LO BND  {name}  {_fmt(low)}\n"
+    if up != math.inf:
+        yield f" UP BND  {name}  {_fmt(up)}\n"
+    elif is_integer:
+        # Některé čtečky dávají celočíselným proměnným bez mezí horní mez 1
+        yield f" PL BND  {name}\n"
+
+
+# =====================================================================
+# CPLEX LP
+# =====================================================================
+
+_LP_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<rel><=|=<|>=|=>|<|>|=)
+      | (?P<sign>[+-])
+      | (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_!"\#$%&()/,;?@`'{}|~][\w!"\#$%&()/,.;?@`'{}|~\[\]]*)
+        \s*(?P<colon>:)?
+    )""",
+    re.VERBOSE,
+)
+
+_LP_SECTIONS = [
+    (re.compile(r"(?:maximi[sz]e|maximum|max)(?=\s|$)", re.I), "MAX"),
+    (re.compile(r"(?:minimi[sz]e|minimum|min)(?=\s|$)", re.I), "MIN"),
+    (re.compile(r"(?:subject\s+to|such\s+that|s\.t\.|st)(?=\s|$)", re.I), "ROWS"),
+    (re.compile(r"bounds?(?=\s|$)", re.I), "BOUNDS"),
+    (re.compile(r"(?:generals?|gen|integers?)(?=\s|$)", re.I), "GENERAL"),
+    (re.compile(r"(?:binary|binaries|bin)(?=\s|$)", re.I), "BINARY"),
+    (re.compile(r"(?:semi-continuous|semis?)(?=\s|$)", re.I), "SEMI"),
+    (re.compile(r"end(?=\s|$)", re.I), "END"),
+]
+
+_LP_RELATIONS = {
+    "<=": REL_LE, "=<": REL_LE, "<": REL_LE,
+    ">=": REL_GE, "=>": REL_GE, ">": REL_GE,
+    "=": REL_EQ,
+}
+_INFINITY = {"inf", "infinity"}
+
+
+class _Expression:
+    """Proudové čtení lineárního výrazu po tokenech"""
+
+    def __init__(self):
+        self.sign = 1.0
+        self.coef = None
+        self.constant = 0.0
+        self.n_terms = 0
+
+    def number(self, value: float):
+        if self.coef is not None:
+            raise ValueError("dvě čísla za sebou")
+        self.coef = value
+
+    def sign_token(self, token: str):
+        self._flush_constant()
+        if token == "-":
+            self.sign = -self.sign
+
+    def term(self):
+        """Vrací koeficient proměnné, která právě následuje"""
+        coef = self.sign * (1.0 if self.coef is None else self.coef)
+        self.sign, self.coef = 1.0, None
+        self.n_terms += 1
+        return coef
+
+    def _flush_constant(self):
+        if self.coef is not None:
+            self.constant += self.sign * self.coef
+            self.sign, self.coef = 1.0, None
+
+    def finish(self) -> float:
+        self._flush_constant()
+        return self.constant
+
+
+class _LPReader:
+    """Proudová čtečka formátu CPLEX LP"""
+
+    def __init__(self):
+        self.section = None
+        self.sense = MIN_SENSE
+        self.columns = _Columns()
+        self.rel = array("b")
+        self.rhs = array("d")
+        self.line_no = 0
+        self.objective = _Expression()
+        self._new_statement()
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"LP, řádek {self.line_no}: {message}")
+
+    # ========== ŘÁDKY A SEKCE ==========
+    def feed(self, line: str):
+        self.line_no += 1
+        line = line.split("\\", 1)[0]
+        text = line.strip()
+        if not text:
+            return
+        # Klíčová slova sekcí začínají jedním z těchto písmen
+        if text[0] in "mMsSbBgGiIeE":
+            for pattern, section in _LP_SECTIONS:
+                match = pattern.match(text)
+                if match:
+                    self._set_section(section)
+                    text = text[match.end():]
+                    break
+        if self.section is None:
+            raise self._error("chybí sekce Minimize/Maximize")
+        if self.section == "END" and text.strip():
+            raise self._error("obsah za End")
+        try:
+            if self.section == "BOUNDS":
+                if text.strip():
+                    self._bound(list(self._tokens(text)))
+            elif self.section in ("GENERAL", "BINARY"):
+                for kind, value in self._tokens(text):
+                    if kind != "name":
+                        raise ValueError(f"očekáván název proměnné, nalezeno '{value}'")
+                    j = self.columns.add(value)
+                    self.columns.integer[j] = 1
+                    if self.section == "BINARY":
+                        self.columns.lower[j], self.columns.upper[j] = 0.0, 1.0
+            elif self.section == "SEMI":
+                raise ValueError("semi-spojité proměnné nejsou podporovány")
+            else:
+                handler = self._objective_token if self.section in ("MAX", "MIN") else self._row_token
+                for kind, value in self._tokens(text):
+                    handler(kind, value)
+        except (ValueError, KeyError) as e:
+            raise self._error(str(e)) from None
+
+    def _tokens(self, text: str):
+        pos, end = 0, len(text)
+        while pos < end:
+            match = _LP_TOKEN.match(text, pos)
+            if match is None:
+                if text[pos:].strip():
+                    raise ValueError(f"neočekávaný text '{text[pos:].strip()[:20]}'")
+                return
+            pos = match.end()
+            kind = match.lastgroup
+            if kind == "colon":
+                yield "label", match.group("name")
+            elif kind == "name" and match.group("name").lower() in _INFINITY:
+                yield "num", match.group("name")
+            else:
+                yield kind, match.group(kind)
+
+    def _set_section(self, section: str):
+        if self.section == "ROWS":
+            self._end_statement()
+        if section in ("MAX", "MIN"):
+            self.sense = MAX_SENSE if section == "MAX" else MIN_SENSE
+        self.section = section
+
+    # ========== ÚČELOVÁ FUNKCE ==========
+    def _objective_token(self, kind: str, value: str):
+        expr = self.objective
+        if kind == "num":
+            expr.number(float(value))
+        elif kind == "sign":
+            expr.sign_token(value)
+        elif kind == "name":
+            coef = expr.term()
+            self.columns.obj[self.columns.add(value)] += coef
+        elif kind == "rel":
+            raise ValueError("relace v účelové funkci")
+        # Název účelové funkce ("obj:") se ignoruje
+
+    # ========== OMEZENÍ ==========
+    def _new_statement(self):
+        self.segments = []  # (relace, konstanta, počet členů) uzavřených úseků
+        self.expr = _Expression()
+        self.row_cols: List[int] = []
+        self.row_vals: List[float] = []
+        self.pending = False
+
+    def _row_token(self, kind: str, value: str):
+        if kind == "label":
+            self._end_statement()
+            return
+        self.pending = True
+        expr = self.expr
+        if kind == "num":
+            expr.number(float(value))
+            # Omezení je úplné, jakmile za relací přijde konstanta a výraz
+            # s proměnnými už byl (jinak jde o tvar "dolní <= výraz <= horní")
+            terms = sum(s[2] for s in self.segments)
+            if self.segments and expr.n_terms == 0 and terms > 0:
+                if len(self.segments) == 2 or self.segments[0][2] > 0:
+                    self._end_statement()
+        elif kind == "sign":
+            expr.sign_token(value)
+        elif kind == "name":
+            self.row_vals.append(expr.term())
+            self.row_cols.append(self.columns.add(value))
+        elif kind == "rel":
+            self.segments.append((value, expr.finish(), expr.n_terms))
+            self.expr = _Expression()
+
+    def _end_statement(self):
+        if not self.pending:
+            return
+        segments = self.segments + [(None, self.expr.finish(), self.expr.n_terms)]
+        cols, vals = self.row_cols, self.row_vals
+        self._new_statement()
+
+        with_terms = [i for i, s in enumerate(segments) if s[2] > 0]
+        if len(segments) < 2 or len(with_terms) != 1:
+            raise ValueError("neúplné nebo neplatné omezení")
+        k = with_terms[0]
+        const = segments[k][1]
+
+        if len(segments) == 2:
+            rel = _LP_RELATIONS[segments[0][0]]
+            if k == 0:
+                self._add_row(cols, vals, rel, segments[1][1] - const)
+            else:
+                # Tvar "konstanta relace výraz"
+                flipped = {REL_LE: REL_GE, REL_GE: REL_LE, REL_EQ: REL_EQ}[rel]
+                self._add_row(cols, vals, flipped, segments[0][1] - const)
+            return
+
+        if len(segments) != 3 or k != 1:
+            raise ValueError("neplatné omezení s rozsahem")
+        first, second = (_LP_RELATIONS[s[0]] for s in segments[:2])
+        if first != second or first == REL_EQ:
+            raise ValueError("neplatné omezení s rozsahem")
+        low, high = segments[0][1] - const, segments[2][1] - const
+        if first == REL_GE:
+            low, high = high, low
+        self._add_row(cols, vals, REL_GE, low)
+        self._add_row(cols, vals, REL_LE, high)
+
+    def _add_row(self, cols, vals, rel: int, rhs: float):
+        r = len(self.rel)
+        self.rel.append(rel)
+        self.rhs.append(rhs)
+        self.columns.rows.extend([r] * len(cols))
+        self.columns.cols.extend(cols)
+        self.columns.vals.extend(vals)
+
+    # ========== MEZE ==========
+    def _bound(self, tokens):
+        if len(tokens) == 2 and tokens[1][1].lower() == "free":
+            j = self.columns.add(tokens[0][1])
+            self.columns.lower[j], self.columns.upper[j] = -math.inf, math.inf
+            return
+
+        # Rozdělení na úseky podle relací: [hodnota|proměnná, relace, ...]
+        parts, current = [], []
+        for kind, value in tokens:
+            if kind == "rel":
+                parts.append(current)
+                parts.append(_LP_RELATIONS[value])
+                current = []
+            else:
+                current.append((kind, value))
+        parts.append(current)
+
+        if len(parts) == 3:
+            left, rel, right = parts
+            if len(left) == 1 and left[0][0] == "name":
+                self._set_bound(left[0][1], rel, self._value(right))
+            else:
+                flipped = {REL_LE: REL_GE, REL_GE: REL_LE, REL_EQ: REL_EQ}[rel]
+                self._set_bound(self._name(right), flipped, self._value(left))
+        elif len(parts) == 5 and parts[1] == parts[3] and parts[1] != REL_EQ:
+            name = self._name(parts[2])
+            low, high = self._value(parts[0]), self._value(parts[4])
+            if parts[1] == REL_GE:
+                low, high = high, low
+            self._set_bound(name, REL_GE, low)
+            self._set_bound(name, REL_LE, high)
+        else:
+            raise ValueError("neplatná mez")
+
+    @staticmethod
+    def _name(tokens) -> str:
+        if len(tokens) != 1 or tokens[0][0] != "name":
+            raise ValueError("neplatná mez")
+        return tokens[0][1]
+
+    @staticmethod
+    def _value(tokens) -> float:
+        sign = 1.0
+        for kind, value in tokens[:-1]:
+            if kind != "sign":
+                raise ValueError("neplatná hodnota meze")
+            if value == "-":
+                sign = -sign
+        if not tokens or tokens[-1][0] != "num":
+            raise ValueError("neplatná hodnota meze")
+        return sign * float(tokens[-1][1])
+
+    def _set_bound(self, name: str, rel: int, value: float):
+        j = self.columns.add(name)
+        if rel in (REL_GE, REL_EQ):
+            self.columns.lower[j] = value
+        if rel in (REL_LE, REL_EQ):
+            self.columns.upper[j] = value
+
+    def finish(self) -> LPProblem:
+        self._end_statement()
+        return self.columns.build(self.sense, self.rel, self.rhs)
+
+
+def read_lp(path: str, progress: Optional[ProgressCallback] = None) -> LPProblem:
+    """Načte problém ze souboru ve formátu CPLEX LP"""
+    reader = _LPReader()
+    for line in _read_lines(path, progress):
+        reader.feed(line)
+    return reader.finish()
+
+
+_LP_NAME = re.compile(r"[A-Za-z_!\"#$%&()/,;?@`'{}|~][\w!\"#$%&()/,.;?@`'{}|~\[\]]*")
+
+
+def _lp_expression(prefix: str, cols, vals, names) -> str:
+    """Lineární výraz rozdělený na řádky po LP_TERMS_PER_LINE členech"""
+    terms = [
+        f"{'-' if v < 0 else '+'} {_fmt(abs(v))} {names[j]}" for j, v in zip(cols, vals)
+    ]
+    if not terms:
+        # Prázdný výraz musí obsahovat alespoň jednu proměnnou
+        terms = [f"0 {names[0]}"] if names else []
+    lines = [
+        " ".join(terms[i:i + LP_TERMS_PER_LINE])
+        for i in range(0, len(terms), LP_TERMS_PER_LINE)
+    ]
+    return prefix + "\n   ".join(lines)
+
+
+def write_lp(path: str, problem: LPProblem):
+    """Uloží problém do souboru ve formátu CPLEX LP"""
+    _check_names(problem.names, _LP_NAME, "LP")
+    for name in problem.names:
+        # Názvy shodné s klíčovými slovy by se při čtení špatně vyložily
+        reserved = name.lower() in _INFINITY or name.lower() == "free"
+        if reserved or any(p.fullmatch(name) for p, _ in _LP_SECTIONS):
+            raise ValueError(f"Název proměnné '{name}' nelze zapsat ve formátu LP")
+    names = problem.names
+    matrix = problem.matrix
+    symbols = ("<=", ">=", "=")
+
+    with _open_text(path) as f:
+        f.write("Maximize\n" if problem.maximize else "Minimize\n")
+        # Účelová funkce obsahuje všechny proměnné (i s nulovým koeficientem),
+        # aby se při čtení zachovalo jejich pořadí
+        obj = problem.obj_coeffs.tolist()
+        f.write(_lp_expression(" obj: ", range(len(obj)), obj, names) + "\n")
+
+        f.write("Subject To\n")
+        for i, (code, rhs) in enumerate(zip(problem.rel.tolist(), problem.rhs.tolist())):
+            cols, vals = matrix.row(i)
+            expr = _lp_expression(f" R{i + 1}: ", cols.tolist(), vals.tolist(), names)
+            f.write(f"{expr} {symbols[code]} {_fmt(rhs)}\n")
+
+        f.write("Bounds\n")
+        for name, low, up in zip(names, problem.lower.tolist(), problem.upper.tolist()):
+            if low == up:
+                f.write(f" {name} = {_fmt(low)}\n")
+            elif low == -math.inf and up == math.inf:
+                f.write(f" {name} free\n")
+            elif low == -math.inf:
+                f.write(f" -inf <= {name} <= {_fmt(up)}\n")
+            elif up == math.inf:
+                if low != 0:
+                    f.write(f" {name} >= {_fmt(low)}\n")
+            else:
+                f.write(f" {_fmt(low)} <= {name} <= {_fmt(up)}\n")
+
+        integers = [names[j] for j in np.flatnonzero(problem.integer).tolist()]
+        if integers:
+            f.write("Generals\n")
+            for i in range(0, len(integers), LP_TERMS_PER_LINE):
+                f.write(" " + " ".join(integers[i:i + LP_TERMS_PER_LINE]) + "\n")
+        f.write("End\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Načtení (a případně převod) problému ve formátu MPS/LP/JSON"
+    )
+    parser.add_argument("input", help="vstupní soubor")
+    parser.add_argument("output", nargs="?", help="výstupní soubor (převod formátu)")
+    parser.add_argument(
+        "--fixed", action="store_true", help="vstupní MPS je v pevném formátu"
+    )
+    args = parser.parse_args(argv)
+
+    from problem_io import load_problem_file, save_problem_file
+
+    start_time = time.perf_counter()
+    if args.fixed:
+        problem = read_mps(args.input, fixed=True)
+    else:
+        problem = load_problem_file(args.input)
+    load_time = time.perf_counter() - start_time
+    print(
+        f"Načteno {problem.n_cons} omezení, {problem.n_vars} proměnných, "
+        f"{problem.nnz} nenulových prvků za {load_time:.2f} s"
+    )
+    if args.output:
+        start_time = time.perf_counter()
+        save_problem_file(args.output, problem)
+        print(f"Uloženo do {args.output} za {time.perf_counter() - start_time:.2f} s")
+    rss = peak_rss_mb()
+    if rss is not None:
+        print(f"Špičková paměť procesu: {rss:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
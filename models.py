@@ -1,8 +1,17 @@
 """
 Datové třídy pro reprezentaci LP problému a výsledků.
 """
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Dict, Sequence, Tuple
+
+import numpy as np
+
+
+# Kódy relací v poli LPProblem.rel (index do RELATIONS)
+REL_LE = 0
+REL_GE = 1
+REL_EQ = 2
+RELATIONS = ("≤", "≥", "=")
 
 
 @dataclass
@@ -30,11 +39,389 @@ class Objective:
 
 
 @dataclass
+class CSRMatrix:
+    """Řídká matice omezení ve formátu CSR (compressed sparse row)"""
+    indptr: np.ndarray  # int64, délka n_rows + 1
+    indices: np.ndarray  # int32, sloupcové indexy nenulových prvků
+    data: np.ndarray  # float64, hodnoty nenulových prvků
+    n_cols: int
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def nnz(self) -> int:
+        return int(self.indptr[-1])
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.n_rows, self.n_cols
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Vrací (indexy, hodnoty) nenulových prvků i-tého řádku"""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def row_indices(self) -> np.ndarray:
+        """Řádkový index každého nenulového prvku (COO reprezentace)"""
+        return np.repeat(
+            np.arange(self.n_rows, dtype=np.int32), np.diff(self.indptr)
+        )
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=np.float64)
+        dense[self.row_indices(), self.indices] = self.data
+        return dense
+
+    def to_scipy(self):
+        """Převod na scipy.sparse.csr_matrix (SciPy se importuje až zde)"""
+        from scipy.sparse import csr_matrix
+
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+    @classmethod
+    def empty(cls, n_rows: int, n_cols: int) -> "CSRMatrix":
+        return cls(
+            indptr=np.zeros(n_rows + 1, dtype=np.int64),
+            indices=np.zeros(0, dtype=np.int32),
+            data=np.zeros(0, dtype=np.float64),
+            n_cols=n_cols,
+        )
+
+    @classmethod
+    def from_dense(cls, dense) -> "CSRMatrix":
+        """Vytvoří CSR matici z husté 2D matice (nuly se vynechají)"""
+        dense = np.asarray(dense, dtype=np.float64)
+        rows, cols = np.nonzero(dense)
+        indptr = np.zeros(dense.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=dense.shape[0]), out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            indices=cols.astype(np.int32),
+            data=dense[rows, cols],
+            n_cols=dense.shape[1],
+        )
+
+    @classmethod
+    def from_coo(
+        cls, rows, cols, values, shape: Tuple[int, int]
+    ) -> "CSRMatrix":
+        """Vytvoří CSR matici z trojic (řádek, sloupec, hodnota).
+
+        Duplicitní pozice se sečtou a nulové hodnoty se vynechají.
+        """
+        n_rows, n_cols = shape
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+
+        if len(rows) > 1:
+            key = rows * n_cols + cols
+            first = np.concatenate(([True], key[1:] != key[:-1]))
+            if not first.all():
+                starts = np.flatnonzero(first)
+                values = np.add.reduceat(values, starts)
+                rows, cols = rows[starts], cols[starts]
+
+        keep = values != 0
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            indices=cols.astype(np.int32),
+            data=values,
+            n_cols=n_cols,
+        )
+
+
 class LPProblem:
-    """Kontejner pro kompletní LP problém"""
-    variables: List[Variable]
-    objective: Objective
-    constraints: List[Constraint]
+    """Kontejner pro kompletní LP problém.
+
+    Problém je uložen sloupcově: meze, typy proměnných, účelová funkce,
+    relace a pravé strany jako typovaná pole NumPy, matice omezení jako
+    řídká CSR matice. Chybějící meze jsou uloženy jako -inf / +inf.
+
+    Pro zpětnou kompatibilitu lze problém vytvořit ze seznamů Variable /
+    Constraint a stejné seznamy jsou dostupné přes atributy `variables`,
+    `objective` a `constraints` (vytvoří se až při prvním přístupu).
+    """
+
+    def __init__(
+        self,
+        variables: List[Variable],
+        objective: Objective,
+        constraints: List[Constraint],
+    ):
+        n_vars = len(variables)
+        coeffs = np.zeros((len(constraints), n_vars), dtype=np.float64)
+        for r, c in enumerate(constraints):
+            if len(c.coeffs) != n_vars:
+                raise ValueError(
+                    f"Omezení {r+1}: počet koeficientů ({len(c.coeffs)}) "
+                    f"neodpovídá počtu proměnných ({n_vars})"
+                )
+            coeffs[r] = c.coeffs
+
+        self._init_arrays(
+            names=[v.name for v in variables],
+            lower=[-np.inf if v.low is None else v.low for v in variables],
+            upper=[np.inf if v.up is None else v.up for v in variables],
+            integer=[v.vtype == "Integer" for v in variables],
+            sense=objective.sense,
+            objective=objective.coeffs,
+            matrix=CSRMatrix.from_dense(coeffs.reshape(len(constraints), n_vars)),
+            rel=[RELATIONS.index(c.rel) for c in constraints],
+            rhs=[c.rhs for c in constraints],
+        )
+        self._variables = list(variables)
+        self._objective = objective
+        self._constraints = list(constraints)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        names: Sequence[str],
+        lower,
+        upper,
+        integer,
+        sense: str,
+        objective,
+        matrix: CSRMatrix,
+        rel,
+        rhs,
+    ) -> "LPProblem":
+        """Vytvoří problém přímo z polí bez mezikroku přes Variable/Constraint"""
+        problem = cls.__new__(cls)
+        problem._init_arrays(
+            names, lower, upper, integer, sense, objective, matrix, rel, rhs
+        )
+        return problem
+
+    def _init_arrays(
+        self, names, lower, upper, integer, sense, objective, matrix, rel, rhs
+    ):
+        self.names = list(names)
+        self.lower = np.asarray(lower, dtype=np.float64)
+        self.upper = np.asarray(upper, dtype=np.float64)
+        self.integer = np.asarray(integer, dtype=bool)
+        self.sense = sense
+        self.obj_coeffs = np.asarray(objective, dtype=np.float64)
+        self.matrix = matrix
+        self.rel = np.asarray(rel, dtype=np.int8)
+        self.rhs = np.asarray(rhs, dtype=np.float64)
+
+        n_vars = len(self.names)
+        if not (
+            len(self.lower) == len(self.upper) == len(self.integer)
+            == len(self.obj_coeffs) == matrix.n_cols == n_vars
+        ):
+            raise ValueError("Rozměry polí proměnných si neodpovídají")
+        if not len(self.rel) == len(self.rhs) == matrix.n_rows:
+            raise ValueError("Rozměry polí omezení si neodpovídají")
+
+        self._variables = None
+        self._objective = None
+        self._constraints = None
+
+    # ========== ROZMĚRY ==========
+    @property
+    def n_vars(self) -> int:
+        return len(self.names)
+
+    @property
+    def n_cons(self) -> int:
+        return self.matrix.n_rows
+
+    @property
+    def nnz(self) -> int:
+        return self.matrix.nnz
+
+    @property
+    def has_integers(self) -> bool:
+        return bool(self.integer.any())
+
+    @property
+    def maximize(self) -> bool:
+        return self.sense == "Maximalizovat"
+
+    # ========== KOMPATIBILNÍ POHLED ==========
+    @property
+    def variables(self) -> List[Variable]:
+        if self._variables is None:
+            self._variables = [
+                Variable(
+                    name,
+                    None if np.isneginf(lo) else float(lo),
+                    None if np.isposinf(up) else float(up),
+                    "Integer" if is_int else "Continuous",
+                )
+                for name, lo, up, is_int in zip(
+                    self.names, self.lower, self.upper, self.integer
+                )
+            ]
+        return self._variables
+
+    @property
+    def objective(self) -> Objective:
+        if self._objective is None:
+            self._objective = Objective(self.sense, self.obj_coeffs.tolist())
+        return self._objective
+
+    @property
+    def constraints(self) -> List[Constraint]:
+        if self._constraints is None:
+            dense = self.matrix.to_dense()
+            self._constraints = [
+                Constraint(dense[r].tolist(), RELATIONS[code], float(rhs))
+                for r, (code, rhs) in enumerate(zip(self.rel, self.rhs))
+            ]
+        return self._constraints
+
+
+# Algoritmus řešení LP (u MIP pro LP relaxace): volba řešiče, simplex, bariéra
+ALGORITHM_AUTO = "auto"
+ALGORITHM_SIMPLEX = "simplex"
+ALGORITHM_BARRIER = "barrier"
+ALGORITHMS = (ALGORITHM_AUTO, ALGORITHM_SIMPLEX, ALGORITHM_BARRIER)
+
+
+@dataclass
+class SolverOptions:
+    """Nastavení běhu řešiče.
+
+    Nativní nastavení (vlákna, mezera, presolve a algoritmus řešiče) si
+    každý řešič převede na vlastní parametry; co řešič neumí, ignoruje.
+    """
+    time_limit: Optional[float] = None  # v sekundách, None = bez limitu
+    presolve: bool = False  # redukce problému (presolve.py) před řešičem
+    threads: Optional[int] = None  # vlákna nativního řešiče, None = výchozí
+    mip_gap: Optional[float] = None  # relativní mezera pro ukončení MIP
+    native_presolve: bool = True  # presolve nativního řešiče
+    algorithm: str = ALGORITHM_AUTO
+
+    def __post_init__(self):
+        if self.threads is not None and self.threads < 1:
+            raise ValueError("Počet vláken musí být alespoň 1")
+        if self.mip_gap is not None and self.mip_gap < 0:
+            raise ValueError("Mezera MIP nesmí být záporná")
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Neznámý algoritmus '{self.algorithm}' "
+                f"(možnosti: {', '.join(ALGORITHMS)})"
+            )
+
+    @property
+    def native_defaults(self) -> bool:
+        """Zda se nativní řešič spouští s výchozím nastavením"""
+        return (
+            self.threads is None
+            and self.mip_gap is None
+            and self.native_presolve
+            and self.algorithm == ALGORITHM_AUTO
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SolverOptions":
+        """Vytvoří nastavení ze slovníku (neznámé klíče se ignorují)"""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+@dataclass
+class PresolveStats:
+    """Souhrn redukcí provedených v presolve"""
+    rows_removed: int = 0
+    cols_removed: int = 0
+    nnz_removed: int = 0
+    passes: int = 0
+    infeasible: bool = False  # nepřípustnost odhalená už v presolve
+    time: float = 0.0
+
+
+@dataclass
+class PhaseTimings:
+    """Doby fází jednoho běhu řešiče v sekundách (měřeno time.perf_counter)"""
+    import_time: float = 0.0  # líný import knihovny řešiče
+    build_time: float = 0.0  # sestavení modelu
+    native_time: float = 0.0  # běh nativního řešiče
+    extract_time: float = 0.0  # převod výsledku
+
+    @property
+    def total(self) -> float:
+        return self.import_time + self.build_time + self.native_time + self.extract_time
+
+
+@dataclass
+class ModelStats:
+    """Rozměry modelu předaného řešiči (po případném presolve)"""
+    rows: int
+    cols: int
+    nonzeros: int
+    integers: int
+
+    @classmethod
+    def from_problem(cls, problem: "LPProblem") -> "ModelStats":
+        return cls(
+            rows=problem.n_cons,
+            cols=problem.n_vars,
+            nonzeros=problem.matrix.nnz,
+            integers=int(np.count_nonzero(problem.integer)),
+        )
+
+
+@dataclass
+class SolverCounters:
+    """Čítače nativního řešiče (None = řešič údaj neposkytuje)"""
+    iterations: Optional[int] = None  # iterace simplexu / vnitřních bodů
+    nodes: Optional[int] = None  # prozkoumané uzly větvení (MIP)
+    gap: Optional[float] = None  # relativní mezera mezi řešením a mezí (MIP)
+    best_bound: Optional[float] = None  # nejlepší mez účelové funkce (MIP)
+
+
+@dataclass
+class SolveProgress:
+    """Průběžný stav řešení hlášený řešičem (None = údaj zatím není znám)"""
+    elapsed: float = 0.0  # doba od začátku řešení v sekundách
+    objective: Optional[float] = None  # hodnota nejlepšího nalezeného řešení
+    best_bound: Optional[float] = None  # nejlepší mez účelové funkce (MIP)
+    gap: Optional[float] = None  # relativní mezera mezi řešením a mezí
+    nodes: Optional[int] = None  # prozkoumané uzly větvení
+    backend: Optional[str] = None  # řešič, který stav hlásí
+
+    def merged(self, newer: "SolveProgress") -> "SolveProgress":
+        """Stav doplněný o známé údaje z novějšího hlášení.
+
+        Mezera se přepočítá z výsledného řešení a meze, které mohly přijít
+        v různých hlášeních.
+        """
+        progress = SolveProgress(
+            **{
+                f.name: getattr(newer, f.name)
+                if getattr(newer, f.name) is not None
+                else getattr(self, f.name)
+                for f in fields(self)
+            }
+        )
+        if progress.objective is not None and progress.best_bound is not None:
+            progress.gap = abs(progress.objective - progress.best_bound) / max(
+                abs(progress.objective), 1e-9
+            )
+        return progress
+
+
+@dataclass
+class ProfileReport:
+    """Souhrn profilování jednoho řešení (viz profiling.py)"""
+    profile_path: Optional[str] = None  # profil cProfile (.prof, čte pstats)
+    snapshot_path: Optional[str] = None  # snímek tracemalloc (.tracemalloc)
+    hotspots: List[str] = field(default_factory=list)  # nejdražší funkce
+    memory_top: List[str] = field(default_factory=list)  # největší alokace
+    peak_memory_mb: Optional[float] = None  # špička alokací Pythonu
 
 
 @dataclass
@@ -43,5 +430,41 @@ class SolverResult:
     status: str
     objective_value: Optional[float]
     variable_values: Dict[str, float]
-    solve_time: float = 0.0
+    solve_time: float = 0.0  # celková doba řešení včetně obálek (presolve, procesy)
     error_message: Optional[str] = None
+    from_cache: bool = False
+    backend: Optional[str] = None  # řešič, který výsledek vypočítal
+    backend_choice: Optional[str] = None  # zdůvodnění automatické volby řešiče
+    backend_times: Dict[str, float] = field(default_factory=dict)
+    presolve_stats: Optional[PresolveStats] = None
+    # Počet změn modelu při přepočtu v SolveSession (None = model sestaven znovu)
+    session_changes: Optional[int] = None
+    timings: Optional[PhaseTimings] = None  # fáze běhu řešiče
+    model_stats: Optional[ModelStats] = None
+    counters: Optional[SolverCounters] = None
+    profile: Optional[ProfileReport] = None  # jen při profilování
+
+    @property
+    def build_time(self) -> float:
+        """Část solve_time strávená sestavením modelu"""
+        return self.timings.build_time if self.timings is not None else 0.0
+
+    @property
+    def extract_time(self) -> float:
+        """Část solve_time strávená převodem výsledku"""
+        return self.timings.extract_time if self.timings is not None else 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SolverResult":
+        """Vytvoří výsledek ze slovníku (např. z dataclasses.asdict)"""
+        data = dict(data)
+        for key, nested in (
+            ("presolve_stats", PresolveStats),
+            ("timings", PhaseTimings),
+            ("model_stats", ModelStats),
+            ("counters", SolverCounters),
+            ("profile", ProfileReport),
+        ):
+            if data.get(key) is not None:
+                data[key] = nested(**data[key])
+        return cls(**data)
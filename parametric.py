@@ -0,0 +1,175 @@
+"""
+Parametrická analýza - opakované řešení pro řadu hodnot jednoho parametru.
+
+Parametrem je pravá strana vybraného omezení nebo koeficient účelové
+funkce u vybrané proměnné. Každá hodnota je jeden scénář pro
+scenarios.solve_many: body se rozdělí na souvislé úseky, které se řeší
+v pracovních procesech, a uvnitř úseku se sousední body řeší s teplým
+startem (SolveSession u OR-Tools), protože se problém mění jen v jednom čísle.
+
+Výsledkem je křivka: optimální hodnota účelové funkce a hodnoty proměnných
+pro každou hodnotu parametru, exportovatelná do CSV.
+
+Příklad:
+    python parametric.py optimal.json --rhs 1 --start 0 --stop 100 --steps 51 -o krivka.csv
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass, fields
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from models import LPProblem, SolverOptions
+from scenarios import Scenario, ScenarioResults, solve_many
+from solver_base import SOLVER_REGISTRY
+
+# Parametr: pravá strana omezení, nebo koeficient účelové funkce
+PARAM_RHS = "rhs"
+PARAM_OBJECTIVE = "objective"
+
+
+@dataclass
+class SweepResult(ScenarioResults):
+    """Výsledek parametrické analýzy (jeden řádek = jedna hodnota parametru)"""
+    kind: str
+    index: int
+    values: np.ndarray  # hodnoty parametru
+
+    @property
+    def label(self) -> str:
+        return parameter_label(self.kind, self.index, self.names)
+
+    def _row_labels(self) -> list:
+        return self.values.tolist()
+
+    def _label_header(self) -> str:
+        return self.label
+
+
+def parameter_label(kind: str, index: int, names: List[str]) -> str:
+    if kind == PARAM_RHS:
+        return f"pravá strana omezení {index + 1}"
+    return f"koeficient účelové funkce u {names[index]}"
+
+
+def sweep_scenarios(kind: str, index: int, values) -> List[Scenario]:
+    """Scénáře měnící jeden parametr (jeden scénář na hodnotu)"""
+    if kind not in (PARAM_RHS, PARAM_OBJECTIVE):
+        raise ValueError(f"Neznámý druh parametru '{kind}'")
+    return [
+        Scenario(name=str(value), **{kind: {index: value}})
+        for value in np.asarray(values, dtype=np.float64).tolist()
+    ]
+
+
+def run_sweep(
+    problem: LPProblem,
+    kind: str,
+    index: int,
+    values,
+    backend: str = "ortools",
+    jobs: Optional[int] = None,
+    options: Optional[SolverOptions] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> SweepResult:
+    """Vyřeší problém pro všechny hodnoty parametru (viz scenarios.solve_many).
+
+    `progress(hotovo, celkem)` hlásí počet vyřešených bodů, `cancelled()`
+    se kontroluje mezi body (úseky); nedořešené body mají stav "Cancelled".
+    """
+    values = np.asarray(values, dtype=np.float64)
+    limit = problem.n_cons if kind == PARAM_RHS else problem.n_vars
+    if not 0 <= index < limit:
+        raise ValueError(f"Index parametru {index + 1} je mimo rozsah 1..{limit}")
+
+    results = solve_many(
+        problem,
+        sweep_scenarios(kind, index, values),
+        backend=backend,
+        jobs=jobs,
+        options=options,
+        progress=progress,
+        cancelled=cancelled,
+    )
+    return SweepResult(
+        **{f.name: getattr(results, f.name) for f in fields(ScenarioResults)},
+        kind=kind,
+        index=index,
+        values=values,
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Parametrická analýza pravé strany nebo koeficientu účelové funkce"
+    )
+    parser.add_argument("problem", help="soubor s úlohou")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--rhs", type=int, metavar="OMEZENÍ",
+        help="měnit pravou stranu omezení (číslováno od 1)",
+    )
+    target.add_argument(
+        "--objective", metavar="PROMĚNNÁ",
+        help="měnit koeficient účelové funkce u proměnné (název nebo pořadí od 1)",
+    )
+    parser.add_argument("--start", type=float, required=True, help="první hodnota")
+    parser.add_argument("--stop", type=float, required=True, help="poslední hodnota")
+    parser.add_argument("--steps", type=int, default=11, help="počet hodnot (výchozí 11)")
+    parser.add_argument(
+        "-b", "--backend", default="ortools", choices=sorted(SOLVER_REGISTRY),
+        help="použitý řešič (výchozí: ortools, s teplým startem)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="počet pracovních procesů (výchozí: počet CPU)",
+    )
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=None,
+        help="časový limit na jedno řešení v sekundách",
+    )
+    parser.add_argument("-o", "--output", help="výstupní CSV soubor")
+    args = parser.parse_args(argv)
+
+    from problem_io import load_problem_file
+
+    problem = load_problem_file(args.problem)
+    if args.rhs is not None:
+        kind, index = PARAM_RHS, args.rhs - 1
+    else:
+        kind = PARAM_OBJECTIVE
+        if args.objective in problem.names:
+            index = problem.names.index(args.objective)
+        elif args.objective.isdigit():
+            index = int(args.objective) - 1
+        else:
+            parser.error(f"Neznámá proměnná '{args.objective}'")
+
+    result = run_sweep(
+        problem,
+        kind,
+        index,
+        np.linspace(args.start, args.stop, args.steps),
+        backend=args.backend,
+        jobs=args.jobs,
+        options=SolverOptions(time_limit=args.timeout),
+    )
+
+    print(f"{result.label:>30s}  {'status':12s}  účelová funkce")
+    for value, status, objective in zip(
+        result.values.tolist(), result.status, result.objective.tolist()
+    ):
+        print(f"{value:30.6g}  {status:12s}  {objective:.6f}")
+    print(
+        f"{len(result.values)} řešení za {result.wall_time:.2f} s", file=sys.stderr
+    )
+    if args.output:
+        result.to_csv(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
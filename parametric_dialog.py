@@ -0,0 +1,305 @@
+"""
+Dialog parametrické analýzy pro LPWindow (viz parametric.py).
+"""
+
+import os
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QThread, Signal
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QComboBox,
+    QDoubleSpinBox,
+    QSpinBox,
+    QPushButton,
+    QProgressBar,
+    QLabel,
+    QTableView,
+    QFileDialog,
+    QMessageBox,
+)
+
+from models import LPProblem, SolverOptions
+from parametric import PARAM_RHS, PARAM_OBJECTIVE, SweepResult, run_sweep
+from table_models import format_number
+
+# Řešiče nabízené v dialogu (OR-Tools řeší sousední body s teplým startem)
+SWEEP_BACKENDS = {
+    "OR-Tools (teplý start)": "ortools",
+    "SciPy (HiGHS)": "scipy",
+    "PuLP (CBC)": "pulp",
+}
+
+# Mez hodnot parametru v polích dialogu
+PARAM_LIMIT = 1e12
+
+
+class SweepThread(QThread):
+    """Thread pro běh parametrické analýzy mimo GUI"""
+
+    finished = Signal(object)  # SweepResult
+    error = Signal(str)
+    progress = Signal(int)  # procenta vyřešených bodů
+
+    def __init__(
+        self, problem: LPProblem, kind, index, values, backend, jobs, options
+    ):
+        super().__init__()
+        self.args = (problem, kind, index, values)
+        self.kwargs = dict(backend=backend, jobs=jobs, options=options)
+        self._cancelled = False
+        self._percent = -1
+
+    def cancel(self):
+        """Zruší analýzu; rozřešené body se dořeší, ostatní se přeskočí"""
+        self._cancelled = True
+
+    def _on_progress(self, done: int, total: int):
+        percent = done * 100 // max(total, 1)
+        if percent != self._percent:
+            self._percent = percent
+            self.progress.emit(percent)
+
+    def run(self):
+        try:
+            result = run_sweep(
+                *self.args,
+                progress=self._on_progress,
+                cancelled=lambda: self._cancelled,
+                **self.kwargs,
+            )
+            self.finished.emit(result)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class SweepTableModel(QAbstractTableModel):
+    """Tabulka výsledků analýzy (jen pro čtení) přímo nad poli SweepResult"""
+
+    FIXED_HEADERS = ["Parametr", "Status", "Účelová funkce"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.result = None
+
+    def set_result(self, result: SweepResult):
+        self.beginResetModel()
+        self.result = result
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.result is None:
+            return 0
+        return len(self.result.values)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.result is None:
+            return 0
+        return len(self.FIXED_HEADERS) + len(self.result.names)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Vertical:
+            return str(section + 1)
+        if section < len(self.FIXED_HEADERS):
+            return self.FIXED_HEADERS[section]
+        return self.result.names[section - len(self.FIXED_HEADERS)]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            return format_number(self.result.values[row])
+        if col == 1:
+            return self.result.status[row]
+        if col == 2:
+            value = self.result.objective[row]
+        else:
+            value = self.result.variable_values[row, col - len(self.FIXED_HEADERS)]
+        return "" if np.isnan(value) else f"{value:.6g}"
+
+
+class ParametricDialog(QDialog):
+    """Parametrická analýza pravé strany nebo koeficientu účelové funkce"""
+
+    def __init__(self, problem: LPProblem, time_limit=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Parametrická analýza")
+        self.resize(800, 500)
+        self.problem = problem
+        self.time_limit = time_limit
+        self.sweep_thread = None
+        self.result = None
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.kind_combo = QComboBox()
+        self.kind_combo.addItem("Pravá strana omezení", PARAM_RHS)
+        self.kind_combo.addItem("Koeficient účelové funkce", PARAM_OBJECTIVE)
+        self.kind_combo.currentIndexChanged.connect(self._fill_targets)
+        form.addRow("Parametr:", self.kind_combo)
+
+        self.target_combo = QComboBox()
+        self.target_combo.currentIndexChanged.connect(self._target_changed)
+        form.addRow("Omezení / proměnná:", self.target_combo)
+
+        self.start_spin = self._value_spin()
+        self.stop_spin = self._value_spin()
+        range_row = QHBoxLayout()
+        range_row.addWidget(self.start_spin)
+        range_row.addWidget(QLabel("až"))
+        range_row.addWidget(self.stop_spin)
+        form.addRow("Rozsah:", range_row)
+
+        self.steps_spin = QSpinBox()
+        self.steps_spin.setRange(2, 100_000)
+        self.steps_spin.setValue(11)
+        form.addRow("Počet hodnot:", self.steps_spin)
+
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItems(list(SWEEP_BACKENDS))
+        form.addRow("Řešič:", self.backend_combo)
+
+        self.jobs_spin = QSpinBox()
+        self.jobs_spin.setRange(1, os.cpu_count() or 1)
+        self.jobs_spin.setValue(1)
+        self.jobs_spin.setToolTip(
+            "Počet pracovních procesů; s jedním procesem se teplý start "
+            "využije přes celou řadu hodnot"
+        )
+        form.addRow("Procesy:", self.jobs_spin)
+        layout.addLayout(form)
+
+        buttons = QHBoxLayout()
+        self.run_btn = QPushButton("Spustit")
+        self.stop_btn = QPushButton("⏹ Zastavit")
+        self.stop_btn.setEnabled(False)
+        self.export_btn = QPushButton("💾 Export CSV")
+        self.export_btn.setEnabled(False)
+        self.run_btn.clicked.connect(self.run_sweep)
+        self.stop_btn.clicked.connect(self.stop_sweep)
+        self.export_btn.clicked.connect(self.export_csv)
+        buttons.addWidget(self.run_btn)
+        buttons.addWidget(self.stop_btn)
+        buttons.addWidget(self.export_btn)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        buttons.addWidget(self.progress_bar)
+        layout.addLayout(buttons)
+
+        self.table_model = SweepTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self._fill_targets()
+
+    @staticmethod
+    def _value_spin() -> QDoubleSpinBox:
+        spin = QDoubleSpinBox()
+        spin.setRange(-PARAM_LIMIT, PARAM_LIMIT)
+        spin.setDecimals(4)
+        return spin
+
+    def _fill_targets(self):
+        self.target_combo.blockSignals(True)
+        self.target_combo.clear()
+        if self.kind_combo.currentData() == PARAM_RHS:
+            self.target_combo.addItems(
+                [f"Omezení {i + 1}" for i in range(self.problem.n_cons)]
+            )
+        else:
+            self.target_combo.addItems(self.problem.names)
+        self.target_combo.blockSignals(False)
+        self._target_changed()
+
+    def _target_changed(self):
+        """Výchozí rozsah: 0 až dvojnásobek současné hodnoty parametru"""
+        index = self.target_combo.currentIndex()
+        if index < 0:
+            return
+        if self.kind_combo.currentData() == PARAM_RHS:
+            value = float(self.problem.rhs[index])
+        else:
+            value = float(self.problem.obj_coeffs[index])
+        self.start_spin.setValue(min(0.0, 2 * value))
+        self.stop_spin.setValue(max(0.0, 2 * value))
+
+    def run_sweep(self):
+        if self.target_combo.currentIndex() < 0:
+            return
+        values = np.linspace(
+            self.start_spin.value(), self.stop_spin.value(), self.steps_spin.value()
+        )
+        self.sweep_thread = SweepThread(
+            self.problem,
+            self.kind_combo.currentData(),
+            self.target_combo.currentIndex(),
+            values,
+            SWEEP_BACKENDS[self.backend_combo.currentText()],
+            self.jobs_spin.value(),
+            SolverOptions(time_limit=self.time_limit),
+        )
+        self.sweep_thread.finished.connect(self.on_finished)
+        self.sweep_thread.error.connect(self.on_error)
+        self.sweep_thread.progress.connect(self.progress_bar.setValue)
+        self.sweep_thread.start()
+
+        self.run_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.progress_bar.setValue(0)
+        self.status_label.setText("Probíhá výpočet...")
+
+    def stop_sweep(self):
+        if self.sweep_thread is not None:
+            self.sweep_thread.cancel()
+            self.stop_btn.setEnabled(False)
+            self.status_label.setText("Zastavování (rozřešené body se dokončí)...")
+
+    def _done(self):
+        self.sweep_thread = None
+        self.run_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+    def on_finished(self, result: SweepResult):
+        self._done()
+        self.result = result
+        self.table_model.set_result(result)
+        self.export_btn.setEnabled(True)
+        solved = sum(status != "Cancelled" for status in result.status)
+        self.status_label.setText(
+            f"{result.label}: vyřešeno {solved} z {len(result.values)} hodnot "
+            f"za {result.wall_time:.2f} s"
+        )
+
+    def on_error(self, message: str):
+        self._done()
+        self.status_label.setText("Chyba")
+        QMessageBox.critical(self, "Chyba", message)
+
+    def export_csv(self):
+        if self.result is None:
+            return
+        fname, _ = QFileDialog.getSaveFileName(self, "Export", "", "CSV (*.csv)")
+        if not fname:
+            return
+        try:
+            self.result.to_csv(fname)
+        except Exception as e:
+            QMessageBox.critical(self, "Chyba", str(e))
+
+    def done(self, result):
+        # Zavření dialogu počká na rozběhnuté body analýzy
+        if self.sweep_thread is not None:
+            self.sweep_thread.cancel()
+            self.sweep_thread.wait()
+        super().done(result)
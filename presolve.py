@@ -0,0 +1,352 @@
+"""
+Presolve - redukce LP problému před předáním řešiči (nezávislé na řešiči).
+
+Provádí se opakovaně, dokud se problém mění:
+- odstranění proměnných zafixovaných mezemi (low == up),
+- odstranění prázdných řádků (s kontrolou přípustnosti),
+- převod řádků s jediným koeficientem na meze proměnné,
+- zafixování proměnných, které nejsou v žádném omezení,
+- sloučení duplicitních (i násobných) omezení.
+
+Postsolve pak mapuje řešení redukovaného problému zpět na původní proměnné.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from models import (
+    LPProblem,
+    CSRMatrix,
+    SolverResult,
+    SolverOptions,
+    PresolveStats,
+    REL_LE,
+    REL_GE,
+    REL_EQ,
+)
+from solver_base import AbstractLPSolver
+
+TOL = 1e-9
+
+
+def unsatisfied_by_zero(rel: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Řádky, které levá strana 0 nesplňuje (prázdný takový řádek je spor)"""
+    return (
+        ((rel == REL_LE) & (rhs < -TOL))
+        | ((rel == REL_GE) & (rhs > TOL))
+        | ((rel == REL_EQ) & (np.abs(rhs) > TOL))
+    )
+
+
+@dataclass
+class Postsolve:
+    """Informace potřebné k převodu řešení zpět na původní problém"""
+    names: List[str]  # názvy původních proměnných
+    kept_cols: np.ndarray  # indexy původních proměnných v redukovaném problému
+    fixed_values: np.ndarray  # hodnoty odstraněných proměnných
+    obj_offset: float  # příspěvek odstraněných proměnných k účelové funkci
+
+    def apply(self, result: SolverResult, reduced: LPProblem) -> SolverResult:
+        """Doplní hodnoty odstraněných proměnných a posune hodnotu účelové funkce"""
+        if result.objective_value is not None:
+            result.objective_value += self.obj_offset
+
+        if not result.variable_values and reduced.n_vars > 0:
+            return result
+
+        values = self.fixed_values.tolist()
+        for j, name in zip(self.kept_cols.tolist(), reduced.names):
+            values[j] = result.variable_values.get(name)
+        result.variable_values = dict(zip(self.names, values))
+        return result
+
+
+def presolve(
+    problem: LPProblem, max_passes: int = 20
+) -> Tuple[LPProblem, Postsolve, PresolveStats]:
+    """Zredukuje problém a vrací (redukovaný problém, postsolve, statistiky)"""
+    start_time = time.perf_counter()
+    m, n = problem.n_cons, problem.n_vars
+    stats = PresolveStats()
+
+    # Pracovní kopie matice v COO tvaru seřazená podle (řádek, sloupec)
+    rows = problem.matrix.row_indices().astype(np.int64)
+    cols = problem.matrix.indices.astype(np.int64)
+    vals = problem.matrix.data.copy()
+    order = np.lexsort((cols, rows))
+    rows, cols, vals = rows[order], cols[order], vals[order]
+
+    rel = problem.rel.copy()
+    rhs = problem.rhs.copy()
+    lower = problem.lower.copy()
+    upper = problem.upper.copy()
+    integer = problem.integer
+    # Účelová funkce převedená na minimalizaci
+    cost = -problem.obj_coeffs if problem.maximize else problem.obj_coeffs
+
+    row_alive = np.ones(m, dtype=bool)
+    col_alive = np.ones(n, dtype=bool)
+    fixed_values = np.zeros(n, dtype=np.float64)
+    offset = 0.0
+
+    def drop_entries(mask):
+        nonlocal rows, cols, vals
+        keep = ~mask
+        rows, cols, vals = rows[keep], cols[keep], vals[keep]
+
+    def fix_columns(mask, values):
+        """Dosadí hodnoty proměnných do pravých stran a odstraní je"""
+        nonlocal offset
+        fixed_values[mask] = values
+        in_fixed = mask[cols]
+        rhs[:] -= np.bincount(
+            rows[in_fixed],
+            weights=vals[in_fixed] * fixed_values[cols[in_fixed]],
+            minlength=m,
+        )
+        offset += float(problem.obj_coeffs[mask] @ fixed_values[mask])
+        drop_entries(in_fixed)
+        col_alive[mask] = False
+
+    for _ in range(max_passes):
+        stats.passes += 1
+        changed = False
+
+        # Celočíselné meze se zaokrouhlí dovnitř
+        lower[integer] = np.ceil(lower[integer] - TOL)
+        upper[integer] = np.floor(upper[integer] + TOL)
+        if np.any(lower[col_alive] > upper[col_alive] + TOL):
+            stats.infeasible = True
+            break
+
+        # ===== Zafixované proměnné =====
+        # Jen konečné meze: inf - inf by dalo nan (a varování NumPy)
+        finite = np.isfinite(lower) & np.isfinite(upper)
+        fixed = col_alive & finite
+        fixed[finite] &= upper[finite] - lower[finite] <= TOL
+        if fixed.any():
+            fix_columns(fixed, lower[fixed])
+            changed = True
+
+        counts = np.bincount(rows, minlength=m)
+
+        # ===== Prázdné řádky =====
+        empty = row_alive & (counts == 0)
+        if empty.any():
+            if np.any(empty & unsatisfied_by_zero(rel, rhs)):
+                stats.infeasible = True
+                break
+            row_alive[empty] = False
+            changed = True
+
+        # ===== Řádky s jediným koeficientem -> meze proměnné =====
+        single = row_alive & (counts == 1)
+        if single.any():
+            in_single = single[rows]
+            r, j, a = rows[in_single], cols[in_single], vals[in_single]
+            bound = rhs[r] / a
+            rr = rel[r]
+            sets_upper = (rr == REL_EQ) | ((rr == REL_LE) & (a > 0)) | ((rr == REL_GE) & (a < 0))
+            sets_lower = (rr == REL_EQ) | ((rr == REL_GE) & (a > 0)) | ((rr == REL_LE) & (a < 0))
+            np.minimum.at(upper, j[sets_upper], bound[sets_upper])
+            np.maximum.at(lower, j[sets_lower], bound[sets_lower])
+            drop_entries(in_single)
+            row_alive[single] = False
+            changed = True
+            # Nové meze se zaokrouhlí a zkontrolují hned, ne až v dalším
+            # průchodu - proměnnou bez omezení níže zafixuje na mezi
+            lower[integer] = np.ceil(lower[integer] - TOL)
+            upper[integer] = np.floor(upper[integer] + TOL)
+            if np.any(lower[j] > upper[j] + TOL):
+                stats.infeasible = True
+                break
+
+        # ===== Proměnné mimo všechna omezení =====
+        col_counts = np.bincount(cols, minlength=n)
+        empty_cols = col_alive & (col_counts == 0)
+        if empty_cols.any():
+            best = np.where(
+                cost > 0, lower, np.where(cost < 0, upper, np.clip(0.0, lower, upper))
+            )
+            # Nekonečná optimální hodnota = neomezený problém, ten rozhodne řešič
+            fixable = empty_cols & np.isfinite(best)
+            if fixable.any():
+                fix_columns(fixable, best[fixable])
+                changed = True
+
+        if not changed:
+            break
+
+    if not stats.infeasible:
+        stats.infeasible = not _merge_duplicate_rows(
+            rows, cols, vals, rel, rhs, row_alive
+        )
+        drop_entries(~row_alive[rows])
+
+    # ===== Sestavení redukovaného problému =====
+    kept_cols = np.flatnonzero(col_alive)
+    kept_rows = np.flatnonzero(row_alive)
+    col_map = np.cumsum(col_alive) - 1
+    row_map = np.cumsum(row_alive) - 1
+    keep = col_alive[cols]
+    matrix = CSRMatrix.from_coo(
+        row_map[rows[keep]],
+        col_map[cols[keep]],
+        vals[keep],
+        (len(kept_rows), len(kept_cols)),
+    )
+
+    reduced = LPProblem.from_arrays(
+        names=[problem.names[j] for j in kept_cols],
+        lower=lower[kept_cols],
+        upper=upper[kept_cols],
+        integer=integer[kept_cols],
+        sense=problem.sense,
+        objective=problem.obj_coeffs[kept_cols],
+        matrix=matrix,
+        rel=rel[kept_rows],
+        rhs=rhs[kept_rows],
+    )
+    postsolve = Postsolve(
+        names=list(problem.names),
+        kept_cols=kept_cols,
+        fixed_values=fixed_values,
+        obj_offset=offset,
+    )
+
+    stats.rows_removed = m - reduced.n_cons
+    stats.cols_removed = n - reduced.n_vars
+    stats.nnz_removed = problem.nnz - reduced.nnz
+    stats.time = time.perf_counter() - start_time
+    return reduced, postsolve, stats
+
+
+def _merge_duplicate_rows(rows, cols, vals, rel, rhs, row_alive) -> bool:
+    """Sloučí omezení, jejichž koeficienty jsou násobkem jiného omezení.
+
+    Upravuje pole na místě; vrací False, pokud jsou sloučená omezení
+    ve sporu (problém je nepřípustný).
+    """
+    m = len(rel)
+    indptr = np.zeros(m + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=m), out=indptr[1:])
+
+    groups = {}
+    for r in np.flatnonzero(row_alive & (np.diff(indptr) >= 2)).tolist():
+        start, end = indptr[r], indptr[r + 1]
+        scale = vals[start]
+        key = (
+            cols[start:end].tobytes(),
+            np.round(vals[start:end] / scale, 12).tobytes(),
+        )
+        groups.setdefault(key, []).append(r)
+
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+
+        # Interval, do kterého musí padnout normovaný výraz (první koef. = 1)
+        lo, hi = -np.inf, np.inf
+        for r in members:
+            scale = vals[indptr[r]]
+            b = rhs[r] / scale
+            code = rel[r]
+            if scale < 0 and code != REL_EQ:
+                code = REL_GE if code == REL_LE else REL_LE
+            if code in (REL_GE, REL_EQ):
+                lo = max(lo, b)
+            if code in (REL_LE, REL_EQ):
+                hi = min(hi, b)
+        if lo > hi + TOL * max(1.0, abs(hi)):
+            return False
+
+        # Ponechaná omezení se přepíší do normovaného tvaru
+        first, second = members[0], members[1]
+        for r in (first, second):
+            start, end = indptr[r], indptr[r + 1]
+            vals[start:end] = vals[start:end] / vals[start]
+
+        if np.isinf(lo):
+            rel[first], rhs[first] = REL_LE, hi
+            kept = [first]
+        elif np.isinf(hi):
+            rel[first], rhs[first] = REL_GE, lo
+            kept = [first]
+        elif hi - lo <= TOL * max(1.0, abs(hi)):
+            rel[first], rhs[first] = REL_EQ, hi
+            kept = [first]
+        else:
+            # Omezení z obou stran nelze vyjádřit jedním řádkem
+            rel[first], rhs[first] = REL_LE, hi
+            rel[second], rhs[second] = REL_GE, lo
+            kept = [first, second]
+
+        for r in members:
+            if r not in kept:
+                row_alive[r] = False
+    return True
+
+
+class PresolveSolver(AbstractLPSolver):
+    """Obálka, která před řešičem provede presolve a po něm postsolve.
+
+    Presolve se provede jen pokud je zapnutý v SolverOptions.presolve.
+    """
+
+    def __init__(self, solver: AbstractLPSolver):
+        self.solver = solver
+
+    @property
+    def supports_integers(self):
+        return self.solver.supports_integers
+
+    def config(self) -> dict:
+        return self.solver.config()
+
+    def profiled(self, directory: Optional[str] = None, **kwargs) -> AbstractLPSolver:
+        # Profiluje se řešič redukovaného problému (může běžet v jiném procesu)
+        return PresolveSolver(self.solver.profiled(directory, **kwargs))
+
+    def cancel(self):
+        self.solver.cancel()
+
+    def interrupt(self):
+        self.solver.interrupt()
+
+    def set_progress_callback(self, callback):
+        self.solver.set_progress_callback(callback)
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        options = options or SolverOptions()
+        if not options.presolve:
+            return self.solver.solve(problem, options)
+
+        reduced, postsolve, stats = presolve(problem)
+        if stats.infeasible:
+            return SolverResult(
+                status="Infeasible",
+                objective_value=None,
+                variable_values={},
+                solve_time=stats.time,
+                presolve_stats=stats,
+            )
+
+        if reduced.n_vars == 0:
+            # Presolve zafixoval všechny proměnné, řešič není potřeba
+            result = SolverResult(
+                status="Optimal",
+                objective_value=0.0,
+                variable_values={},
+            )
+        else:
+            result = self.solver.solve(reduced, options)
+
+        result = postsolve.apply(result, reduced)
+        result.solve_time += stats.time
+        result.presolve_stats = stats
+        return result
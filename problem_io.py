@@ -0,0 +1,161 @@
+"""
+Načítání a ukládání LP problémů bez závislosti na GUI.
+
+Vedle JSON jsou podporovány formáty MPS a CPLEX LP (viz model_formats.py),
+u nich i komprimované soubory .mps.gz a .lp.gz, a binární formát .lpb
+načítaný mapováním do paměti (viz binary_format.py).
+
+Formát JSON odpovídá souborům, které ukládá LPWindow.save_problem
+(klíče `variables`, `objective`, `constraints` a volitelně `n_vars`,
+`n_cons`, `obj_sense`, `solver`).
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from models import LPProblem, CSRMatrix, RELATIONS
+from model_formats import read_mps, write_mps, read_lp, write_lp, ProgressCallback
+from binary_format import read_binary, read_binary_extra, write_binary
+
+# Klíče JSON souboru, které popisují samotný problém (ostatní jsou doplňující,
+# např. zvolený řešič)
+PROBLEM_KEYS = (
+    "n_vars", "n_cons", "obj_sense", "variables", "objective", "constraints"
+)
+# Velikost bloku při čtení JSON s hlášením průběhu
+_JSON_CHUNK = 1 << 20
+
+
+def problem_from_dict(data: Dict[str, Any]) -> LPProblem:
+    """Vytvoří LPProblem ze slovníku ve formátu uložených JSON souborů"""
+    variables = data["variables"]
+    constraints = data["constraints"]
+    objective = data["objective"]
+    n_vars = len(variables)
+
+    coeffs = np.array(
+        [c["coeffs"] for c in constraints], dtype=np.float64
+    ).reshape(len(constraints), n_vars)
+
+    return LPProblem.from_arrays(
+        names=[v["name"] for v in variables],
+        lower=[-np.inf if v.get("low") is None else v["low"] for v in variables],
+        upper=[np.inf if v.get("up") is None else v["up"] for v in variables],
+        integer=[v.get("vtype", "Continuous") == "Integer" for v in variables],
+        sense=objective.get("sense", data.get("obj_sense", "Minimalizovat")),
+        objective=objective["coeffs"],
+        matrix=CSRMatrix.from_dense(coeffs),
+        rel=[RELATIONS.index(c["rel"]) for c in constraints],
+        rhs=[c["rhs"] for c in constraints],
+    )
+
+
+def problem_to_dict(problem: LPProblem) -> Dict[str, Any]:
+    """Převede LPProblem na slovník ve formátu uložených JSON souborů"""
+    return {
+        "n_vars": problem.n_vars,
+        "n_cons": problem.n_cons,
+        "obj_sense": problem.sense,
+        "variables": [v.__dict__ for v in problem.variables],
+        "objective": problem.objective.__dict__,
+        "constraints": [c.__dict__ for c in problem.constraints],
+    }
+
+
+def _read_json(path: str, progress: Optional[ProgressCallback] = None) -> dict:
+    if progress is None:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    total = os.path.getsize(path) or 1
+    chunks = []
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_JSON_CHUNK)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            progress(min(f.tell() / total, 1.0))
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def load_json(path: str, progress: Optional[ProgressCallback] = None) -> LPProblem:
+    return problem_from_dict(_read_json(path, progress))
+
+
+def save_json(path: str, problem: LPProblem, extra: Optional[Dict[str, Any]] = None):
+    data = problem_to_dict(problem)
+    if extra:
+        data.update(extra)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# Přípona souboru -> funkce pro načtení / uložení
+LOADERS = {
+    ".json": load_json,
+    ".mps": read_mps,
+    ".lp": read_lp,
+    ".lpb": read_binary,
+}
+SAVERS = {
+    ".json": save_json,
+    ".mps": write_mps,
+    ".lp": write_lp,
+    ".lpb": write_binary,
+}
+
+# Přípony, u kterých formát nepodporuje kompresi gzip
+_PLAIN_ONLY = (".json", ".lpb")
+
+# Vzory názvů všech podporovaných souborů (včetně komprimovaných)
+FILE_PATTERNS = [f"*{ext}" for ext in LOADERS] + [
+    f"*{ext}.gz" for ext in LOADERS if ext not in _PLAIN_ONLY
+]
+
+
+def file_format(path: str) -> str:
+    """Přípona určující formát souboru (u .gz přípona před ní)"""
+    root, ext = os.path.splitext(path.lower())
+    if ext == ".gz":
+        ext = os.path.splitext(root)[1]
+        if ext in _PLAIN_ONLY:
+            return ext + ".gz"
+    return ext
+
+
+def load_problem_file(
+    path: str, progress: Optional[ProgressCallback] = None
+) -> LPProblem:
+    """Načte problém ze souboru podle jeho přípony.
+
+    `progress` se během čtení volá s podílem přečtené části souboru.
+    """
+    ext = file_format(path)
+    if ext not in LOADERS:
+        raise ValueError(f"Nepodporovaný formát souboru: {path}")
+    return LOADERS[ext](path, progress=progress)
+
+
+def load_problem_with_extra(
+    path: str, progress: Optional[ProgressCallback] = None
+) -> Tuple[LPProblem, Dict[str, Any]]:
+    """Načte problém i doplňující data uložená s ním (JSON a binární formát)"""
+    ext = file_format(path)
+    if ext == ".json":
+        data = _read_json(path, progress)
+        extra = {k: v for k, v in data.items() if k not in PROBLEM_KEYS}
+        return problem_from_dict(data), extra
+    problem = load_problem_file(path, progress)
+    return problem, read_binary_extra(path) if ext == ".lpb" else {}
+
+
+def save_problem_file(path: str, problem: LPProblem):
+    """Uloží problém do souboru podle jeho přípony"""
+    ext = file_format(path)
+    if ext not in SAVERS:
+        raise ValueError(f"Nepodporovaný formát souboru: {path}")
+    SAVERS[ext](path, problem)
@@ -0,0 +1,174 @@
+"""
+Volitelné profilování řešení (cProfile a tracemalloc).
+
+ProfilingSolver spustí řešení pod cProfile a/nebo tracemalloc, profil
+a snímek paměti zapíše do zadaného adresáře (jeden pár souborů na každé
+řešení) a k výsledku připojí ProfileReport se souhrnem nejdražších míst.
+Souhrn ukazuje, zda čas padl na sestavení modelu v Pythonu, nebo na
+nativní řešič (volání nativní knihovny či čekání na proces CBC).
+
+Profilování se zapíná metodou AbstractLPSolver.profiled(), v GUI
+zaškrtávátkem "Profilovat", v dávkovém řešení přepínačem --profile nebo
+pro obojí proměnnou prostředí LP_SOLVER_PROFILE s cílovým adresářem:
+
+    LP_SOLVER_PROFILE=profily python main.py
+
+Uložené soubory lze dále zkoumat standardními nástroji:
+
+    python -m pstats profily/<soubor>.prof
+    tracemalloc.Snapshot.load("profily/<soubor>.tracemalloc")
+
+tracemalloc zpomaluje alokace v Pythonu, naměřené časy jsou proto při
+profilování paměti vyšší než při běžném řešení.
+"""
+
+import cProfile
+import itertools
+import os
+import pstats
+import time
+import tracemalloc
+from typing import List, Optional
+
+from models import LPProblem, ProfileReport, SolverResult, SolverOptions
+from solver_base import AbstractLPSolver
+
+PROFILE_ENV = "LP_SOLVER_PROFILE"
+
+# Počet řádků souhrnu nejdražších míst
+PROFILE_TOP = 10
+
+# Pořadí souborů v rámci procesu (více řešení ve stejné sekundě)
+_sequence = itertools.count(1)
+
+
+def default_profile_dir() -> str:
+    """Adresář pro profily (lze přepsat proměnnou LP_SOLVER_PROFILE)"""
+    return os.environ.get(PROFILE_ENV) or os.path.join(
+        os.path.expanduser("~"), ".cache", "lp_solver", "profiles"
+    )
+
+
+def profile_dir_from_env() -> Optional[str]:
+    """Adresář podle proměnné LP_SOLVER_PROFILE (None = profilování vypnuto)"""
+    return os.environ.get(PROFILE_ENV) or None
+
+
+def _function_label(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":
+        # Vestavěná funkce nebo metoda nativního rozšíření
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def cpu_hotspots(profile: cProfile.Profile, top: int = PROFILE_TOP) -> List[str]:
+    """Funkce s největším vlastním časem (bez volaných funkcí)"""
+    stats = pstats.Stats(profile).stats
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [
+        f"{tottime * 1000:9.1f} ms {ncalls:>8d}×  {_function_label(func)}"
+        for func, (_, ncalls, tottime, _, _) in ranked[:top]
+    ]
+
+
+def memory_hotspots(snapshot: tracemalloc.Snapshot, top: int = PROFILE_TOP) -> List[str]:
+    """Řádky kódu s největším objemem alokací, které přežily řešení"""
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    return [
+        f"{stat.size / 1024 ** 2:9.2f} MB {stat.count:>8d}×  "
+        f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}"
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+
+class ProfilingSolver(AbstractLPSolver):
+    """Obálka, která každé řešení profiluje a profil uloží do adresáře.
+
+    Profiluje se vlákno, ve kterém běží solve(); proto se obálka vkládá
+    až dovnitř ProcessSolver (viz AbstractLPSolver.profiled).
+    """
+
+    def __init__(
+        self,
+        solver: AbstractLPSolver,
+        directory: Optional[str] = None,
+        cpu: bool = True,
+        memory: bool = True,
+        top: int = PROFILE_TOP,
+    ):
+        self.solver = solver
+        self.directory = directory or default_profile_dir()
+        self.cpu = cpu
+        self.memory = memory
+        self.top = top
+
+    @property
+    def supports_integers(self):
+        return self.solver.supports_integers
+
+    def config(self) -> dict:
+        return self.solver.config()
+
+    def cancel(self):
+        self.solver.cancel()
+
+    def interrupt(self):
+        self.solver.interrupt()
+
+    def set_progress_callback(self, callback):
+        self.solver.set_progress_callback(callback)
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        # Sledování paměti spuštěné jinde (např. uživatelem) se nevypíná
+        started_tracing = self.memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif self.memory:
+            tracemalloc.reset_peak()
+        profile = cProfile.Profile() if self.cpu else None
+
+        try:
+            if profile is not None:
+                profile.enable()
+            try:
+                result = self.solver.solve(problem, options)
+            finally:
+                if profile is not None:
+                    profile.disable()
+            snapshot = peak = None
+            if self.memory:
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        result.profile = self._report(profile, snapshot, peak)
+        return result
+
+    def _report(self, profile, snapshot, peak) -> ProfileReport:
+        os.makedirs(self.directory, exist_ok=True)
+        backend = self.solver.config().get("backend", "solver")
+        base = os.path.join(
+            self.directory,
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{backend}-{os.getpid()}-{next(_sequence)}",
+        )
+        report = ProfileReport()
+        if profile is not None:
+            report.profile_path = base + ".prof"
+            profile.dump_stats(report.profile_path)
+            report.hotspots = cpu_hotspots(profile, self.top)
+        if snapshot is not None:
+            report.snapshot_path = base + ".tracemalloc"
+            snapshot.dump(report.snapshot_path)
+            report.memory_top = memory_hotspots(snapshot, self.top)
+            report.peak_memory_mb = peak / 1024 ** 2
+        return report
@@ -0,0 +1,242 @@
+"""
+Hromadné řešení scénářů sdílejících matici omezení.
+
+Scénář popisuje jen odchylky od základního problému (pravé strany, meze,
+koeficienty účelové funkce). Matice i nezměněná pole se mezi scénáři sdílí
+(bez kopírování), takže vytvoření problému pro scénář stojí jen kopii
+změněných vektorů. Scénáře se rozdělí na souvislé úseky řešené v pracovních
+procesech; v rámci úseku jeden řešič řeší scénáře po sobě, s OR-Tools
+(SolveSession) s teplým startem z předchozího scénáře.
+
+Výsledky se vrací sloupcově (pole přes všechny scénáře), ne jako jeden
+SolverResult na scénář.
+"""
+
+import csv
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from models import LPProblem, SolverOptions
+
+# Změna vektoru: {index: hodnota}, nebo celý nový vektor
+Delta = Union[Mapping[int, float], Sequence[float], np.ndarray]
+
+# Počet úseků na jeden pracovní proces (jemnější průběh, kratší čekání na zrušení)
+CHUNKS_PER_JOB = 4
+
+CANCELLED = "Cancelled"
+
+
+@dataclass
+class Scenario:
+    """Odchylky scénáře od základního problému (None = beze změny)"""
+    name: str = ""
+    rhs: Optional[Delta] = None
+    lower: Optional[Delta] = None
+    upper: Optional[Delta] = None
+    objective: Optional[Delta] = None
+
+
+@dataclass
+class ScenarioResults:
+    """Výsledky scénářů po sloupcích (řádek = scénář, sloupec = proměnná)"""
+    scenario_names: List[str]
+    names: List[str]  # názvy proměnných (sloupce variable_values)
+    status: List[str]
+    objective: np.ndarray  # NaN, pokud řešení neexistuje
+    variable_values: np.ndarray  # tvar (počet scénářů, n_vars), NaN = bez řešení
+    solve_time: np.ndarray
+    wall_time: float
+
+    @classmethod
+    def empty(cls, scenario_names: List[str], names: List[str]) -> "ScenarioResults":
+        """Výsledky, ve kterých jsou všechny scénáře zatím nevyřešené"""
+        n = len(scenario_names)
+        return cls(
+            scenario_names=list(scenario_names),
+            names=list(names),
+            status=[CANCELLED] * n,
+            objective=np.full(n, np.nan),
+            variable_values=np.full((n, len(names)), np.nan),
+            solve_time=np.zeros(n),
+            wall_time=0.0,
+        )
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def store(self, start: int, other: "ScenarioResults"):
+        """Zapíše výsledky úseku scénářů počínaje indexem `start`"""
+        end = start + len(other)
+        self.status[start:end] = other.status
+        self.objective[start:end] = other.objective
+        self.variable_values[start:end] = other.variable_values
+        self.solve_time[start:end] = other.solve_time
+
+    def _row_labels(self) -> list:
+        return self.scenario_names
+
+    def _label_header(self) -> str:
+        return "scenario"
+
+    def to_csv(self, path: str):
+        """Uloží výsledky do CSV (scénář, stav, účelová funkce, proměnné)"""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [self._label_header(), "status", "objective", "solve_time"]
+                + self.names
+            )
+            for i, label in enumerate(self._row_labels()):
+                writer.writerow(
+                    [label, self.status[i], _csv_number(self.objective[i]),
+                     self.solve_time[i]]
+                    + [_csv_number(v) for v in self.variable_values[i].tolist()]
+                )
+
+
+def _csv_number(value: float):
+    return "" if np.isnan(value) else value
+
+
+def _apply_delta(base: np.ndarray, delta: Optional[Delta]) -> np.ndarray:
+    if delta is None:
+        return base
+    if isinstance(delta, Mapping):
+        values = base.copy()
+        if delta:
+            values[np.fromiter(delta.keys(), dtype=np.int64, count=len(delta))] = (
+                np.fromiter(delta.values(), dtype=np.float64, count=len(delta))
+            )
+        return values
+    values = np.asarray(delta, dtype=np.float64)
+    if values.shape != base.shape:
+        raise ValueError(
+            f"Vektor scénáře má délku {len(values)}, očekáváno {len(base)}"
+        )
+    return values
+
+
+def apply_scenario(base: LPProblem, scenario: Scenario) -> LPProblem:
+    """Problém scénáře; matice a nezměněná pole se sdílí se základem"""
+    return LPProblem.from_arrays(
+        names=base.names,
+        lower=_apply_delta(base.lower, scenario.lower),
+        upper=_apply_delta(base.upper, scenario.upper),
+        integer=base.integer,
+        sense=base.sense,
+        objective=_apply_delta(base.obj_coeffs, scenario.objective),
+        matrix=base.matrix,
+        rel=base.rel,
+        rhs=_apply_delta(base.rhs, scenario.rhs),
+    )
+
+
+def make_solver(backend: str):
+    """Řešič pro řadu scénářů; OR-Tools jako relace s teplým startem"""
+    if backend == "ortools":
+        from solve_session import SolveSession
+
+        return SolveSession()
+    from solver_base import create_solver
+
+    return create_solver(backend)
+
+
+def _solve_chunk(base, scenarios, backend, options) -> ScenarioResults:
+    """Úloha pracovního procesu: souvislý úsek scénářů jedním řešičem"""
+    return make_solver(backend).solve_many(base, scenarios, options)
+
+
+def solve_many(
+    base: LPProblem,
+    scenarios: List[Scenario],
+    backend: str = "ortools",
+    jobs: Optional[int] = None,
+    options: Optional[SolverOptions] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> ScenarioResults:
+    """Vyřeší všechny scénáře základního problému.
+
+    S jedním procesem řeší všechny scénáře jediný řešič v tomto procesu,
+    jinak se řeší po úsecích ve fondu procesů. `progress(hotovo, celkem)`
+    se volá po každém dokončeném scénáři (resp. úseku), `cancelled()` se
+    kontroluje mezi nimi; nedořešené scénáře mají stav "Cancelled".
+    """
+    start_time = time.perf_counter()
+    n = len(scenarios)
+    names = [s.name or f"S{i + 1}" for i, s in enumerate(scenarios)]
+    jobs = max(1, min(jobs or multiprocessing.cpu_count(), n or 1))
+
+    if jobs == 1:
+        results = make_solver(backend).solve_many(
+            base, scenarios, options, progress=progress, cancelled=cancelled
+        )
+        results.scenario_names = names
+    else:
+        results = ScenarioResults.empty(names, base.names)
+        n_chunks = min(n, jobs * CHUNKS_PER_JOB)
+        bounds = np.linspace(0, n, n_chunks + 1).astype(int).tolist()
+        done = 0
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as executor:
+            futures = {
+                executor.submit(
+                    _solve_chunk, base, scenarios[s:e], backend, options
+                ): s
+                for s, e in zip(bounds[:-1], bounds[1:])
+            }
+            for future in as_completed(futures):
+                chunk = future.result()
+                results.store(futures[future], chunk)
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, n)
+                if cancelled is not None and cancelled():
+                    # Rozběhnuté úseky se dořeší, čekající se zruší
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+
+    results.wall_time = time.perf_counter() - start_time
+    return results
+
+
+def solve_scenarios_sequentially(
+    solver,
+    base: LPProblem,
+    scenarios: List[Scenario],
+    options: Optional[SolverOptions] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> ScenarioResults:
+    """Vyřeší scénáře jeden po druhém daným řešičem.
+
+    Výchozí implementace AbstractLPSolver.solve_many.
+    """
+    start_time = time.perf_counter()
+    n = len(scenarios)
+    results = ScenarioResults.empty(
+        [s.name or f"S{i + 1}" for i, s in enumerate(scenarios)], base.names
+    )
+    for i, scenario in enumerate(scenarios):
+        if cancelled is not None and cancelled():
+            break
+        result = solver.solve(apply_scenario(base, scenario), options)
+        results.status[i] = result.status
+        results.solve_time[i] = result.solve_time
+        if result.objective_value is not None:
+            results.objective[i] = result.objective_value
+        if result.variable_values:
+            results.variable_values[i] = [
+                result.variable_values.get(name, np.nan) for name in base.names
+            ]
+        if progress is not None:
+            progress(i + 1, n)
+    results.wall_time = time.perf_counter() - start_time
+    return results
@@ -0,0 +1,292 @@
+"""
+Relace pro opakované řešení upravovaného problému s teplým startem.
+
+SolveSession drží model OR-Tools (pywraplp.Solver) mezi jednotlivými
+řešeními. Při dalším řešení se problém porovná s předchozím a do modelu
+se promítnou jen změněné meze, koeficienty účelové funkce, koeficienty
+matice a pravé strany. GLOP pak pokračuje z předchozí optimální báze,
+u celočíselných úloh dostane SCIP předchozí řešení jako nápovědu (hint).
+
+Model se sestaví znovu jen při změně rozměrů, při přechodu mezi LP a MIP
+nebo při změně řešiče či počtu vláken v nastavení (SolverOptions).
+"""
+
+import threading
+from typing import Optional
+
+import numpy as np
+
+from models import LPProblem, SolverResult, SolverOptions
+from solver_base import AbstractLPSolver, CONCLUSIVE_STATUSES, PhaseTimer
+from solver_ortools import ORToolsSolver
+
+
+class SolveSession(AbstractLPSolver):
+    """Trvalý model OR-Tools, do kterého se promítají jen změny problému.
+
+    Relace patří k jednomu otevřenému problému; řešení se nesmí spouštět
+    souběžně (zajišťuje zámek). Relace se nedá předat do jiného procesu,
+    proto se nepoužívá s ProcessSolver; přerušení řeší InterruptSolve.
+    Pole předaného problému se po řešení nesmí měnit na místě: pole sdílené
+    s předchozím problémem se považuje za nezměněné.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._solver = None
+        self._vars = []
+        self._cons = []
+        self._problem: Optional[LPProblem] = None
+        self._hint: Optional[list] = None
+        self._settings: Optional[tuple] = None
+        self._interrupted = False
+
+    def config(self) -> dict:
+        # Výsledek nezávisí na tom, zda se model sestavil znovu
+        return ORToolsSolver().config()
+
+    def reset(self):
+        """Zahodí model; další řešení ho sestaví znovu"""
+        with self._lock:
+            self._solver = None
+            self._vars, self._cons = [], []
+            self._problem = None
+            self._hint = None
+            self._settings = None
+
+    def cancel(self):
+        solver = self._solver
+        if solver is not None:
+            solver.InterruptSolve()
+
+    def interrupt(self):
+        # SCIP po přerušení vrátí nejlepší nalezené řešení
+        self._interrupted = True
+        self.cancel()
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        timer = PhaseTimer()
+        try:
+            from ortools.linear_solver import pywraplp
+            from ortools.linear_solver import linear_solver_pb2
+        except ImportError:
+            return SolverResult(
+                status="Error",
+                objective_value=None,
+                variable_values={},
+                error_message="OR-Tools není nainstalováno. Spusťte: pip install ortools",
+            )
+
+        timer.lap("import_time")
+        options = options or SolverOptions()
+        with self._lock:
+            self._interrupted = False
+            try:
+                compatible = self._compatible(problem, options)
+                if (
+                    compatible
+                    and problem.has_integers
+                    and self._integers_changed(problem)
+                ):
+                    # Změnu mezí nebo typu celočíselné proměnné SCIP po
+                    # řešení nepřijme (proměnnou s mezemi 0..1 si převedl
+                    # na binární); sestaví se znovu, nápověda zůstane
+                    hint = self._hint
+                    self._build(problem, pywraplp, options)
+                    self._hint = hint
+                    changes = None
+                elif compatible:
+                    changes = self._apply_changes(problem)
+                    if changes == 0 and problem.has_integers:
+                        # SCIP po dokončeném řešení nezměněný model znovu
+                        # neřeší; sestaví se znovu, nápověda zůstane
+                        hint = self._hint
+                        self._build(problem, pywraplp, options)
+                        self._hint = hint
+                else:
+                    self._build(problem, pywraplp, options)
+                    changes = None
+                self._problem = problem
+
+                solver = self._solver
+                solver.SetTimeLimit(
+                    int(options.time_limit * 1000) if options.time_limit else 0
+                )
+                if problem.has_integers and self._hint is not None:
+                    solver.SetHint(self._vars, self._hint)
+                params = ORToolsSolver._parameters(solver, problem, options, pywraplp)
+                timer.lap("build_time")
+
+                solver.Solve(params)
+                timer.lap("native_time")
+                counters = ORToolsSolver._counters(solver, problem)
+                response = linear_solver_pb2.MPSolutionResponse()
+                solver.FillSolutionResponseProto(response)
+                ORToolsSolver._confirm_infeasible(
+                    problem,
+                    options,
+                    response,
+                    timer.elapsed,
+                    pywraplp,
+                    linear_solver_pb2,
+                )
+                timer.lap("native_time")
+                result = ORToolsSolver._make_result(
+                    problem, response, options, timer, counters, linear_solver_pb2
+                )
+                if result.variable_values:
+                    self._hint = list(response.variable_value)
+                if self._interrupted and result.status not in CONCLUSIVE_STATUSES:
+                    result.status = "Cancelled"
+                result.session_changes = changes
+                return result
+
+            except Exception as e:
+                # Model v neznámém stavu se při dalším řešení sestaví znovu
+                self._solver = None
+                self._problem = None
+                return SolverResult(
+                    status="Error",
+                    objective_value=None,
+                    variable_values={},
+                    solve_time=timer.elapsed,
+                    error_message=str(e),
+                    timings=timer.timings,
+                )
+
+    @staticmethod
+    def _solver_settings(problem: LPProblem, options: SolverOptions) -> tuple:
+        return ORToolsSolver.solver_name(problem, options), options.threads
+
+    def _compatible(self, problem: LPProblem, options: SolverOptions) -> bool:
+        old = self._problem
+        return (
+            self._solver is not None
+            and old is not None
+            and old.n_vars == problem.n_vars
+            and old.n_cons == problem.n_cons
+            and old.has_integers == problem.has_integers
+            and self._settings == self._solver_settings(problem, options)
+        )
+
+    def _integers_changed(self, problem: LPProblem) -> bool:
+        """Zda se změnil typ proměnné nebo meze některé celočíselné"""
+        old = self._problem
+        if len(_changed(problem.integer, old.integer)):
+            return True
+        bounds = np.union1d(
+            _changed(problem.lower, old.lower), _changed(problem.upper, old.upper)
+        )
+        return bool(problem.integer[bounds].any())
+
+    def _build(self, problem: LPProblem, pywraplp, options: SolverOptions):
+        self._solver = ORToolsSolver()._build_solver(problem, pywraplp, options)
+        self._settings = self._solver_settings(problem, options)
+        self._vars = self._solver.variables()
+        self._cons = self._solver.constraints()
+        self._hint = None
+
+    def _apply_changes(self, problem: LPProblem) -> int:
+        """Promítne do modelu rozdíly proti předchozímu problému.
+
+        Vrací počet provedených změn.
+        """
+        old = self._problem
+        solver = self._solver
+        variables, constraints = self._vars, self._cons
+        inf = solver.infinity()
+        changes = 0
+
+        # ===== Proměnné: meze a typ =====
+        lower = np.clip(problem.lower, -inf, inf)
+        upper = np.clip(problem.upper, -inf, inf)
+        changed = np.union1d(
+            _changed(problem.lower, old.lower), _changed(problem.upper, old.upper)
+        )
+        for j in changed.tolist():
+            variables[j].SetBounds(float(lower[j]), float(upper[j]))
+        changes += len(changed)
+
+        changed = _changed(problem.integer, old.integer)
+        for j in changed.tolist():
+            variables[j].SetInteger(bool(problem.integer[j]))
+        changes += len(changed)
+
+        # ===== Účelová funkce =====
+        objective = solver.Objective()
+        changed = _changed(problem.obj_coeffs, old.obj_coeffs)
+        for j in changed.tolist():
+            objective.SetCoefficient(variables[j], float(problem.obj_coeffs[j]))
+        changes += len(changed)
+        if problem.maximize != old.maximize:
+            if problem.maximize:
+                objective.SetMaximization()
+            else:
+                objective.SetMinimization()
+            changes += 1
+
+        # ===== Relace a pravé strany =====
+        new_lower, new_upper = ORToolsSolver._row_bounds(problem)
+        changed = np.union1d(
+            _changed(problem.rel, old.rel), _changed(problem.rhs, old.rhs)
+        )
+        for r in changed.tolist():
+            constraints[r].SetBounds(
+                max(float(new_lower[r]), -inf), min(float(new_upper[r]), inf)
+            )
+        changes += len(changed)
+
+        # ===== Koeficienty matice =====
+        rows, cols, vals = _matrix_changes(old, problem)
+        for r, j, v in zip(rows.tolist(), cols.tolist(), vals.tolist()):
+            constraints[r].SetCoefficient(variables[j], v)
+        changes += len(rows)
+
+        return changes
+
+
+def _changed(new: np.ndarray, old: np.ndarray) -> np.ndarray:
+    """Indexy prvků, které se liší (sdílené pole se neporovnává)"""
+    if new is old:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(new != old)
+
+
+def _matrix_changes(old: LPProblem, new: LPProblem):
+    """Prvky matice, které se liší (řádky, sloupce, nové hodnoty).
+
+    Prvky, které v nové matici chybí, se vrací s hodnotou 0.
+    """
+    a, b = old.matrix, new.matrix
+    if a is b:
+        # Sdílená matice (např. scénáře jednoho problému)
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+    if np.array_equal(a.indptr, b.indptr) and np.array_equal(a.indices, b.indices):
+        # Stejná struktura, liší se nejvýš hodnoty
+        changed = np.flatnonzero(a.data != b.data)
+        rows = b.row_indices()[changed]
+        return rows, b.indices[changed], b.data[changed]
+
+    # Klíč prvku = řádek * počet sloupců + sloupec (v CSR vzestupně seřazený)
+    n = np.int64(b.n_cols)
+    old_keys = a.row_indices().astype(np.int64) * n + a.indices
+    new_keys = b.row_indices().astype(np.int64) * n + b.indices
+
+    pos = np.searchsorted(old_keys, new_keys)
+    pos_clipped = np.minimum(pos, max(len(old_keys) - 1, 0))
+    found = (
+        (pos < len(old_keys)) & (old_keys[pos_clipped] == new_keys)
+        if len(old_keys)
+        else np.zeros(len(new_keys), dtype=bool)
+    )
+    differs = ~found
+    differs[found] = a.data[pos[found]] != b.data[found]
+
+    removed = ~np.isin(old_keys, new_keys, assume_unique=True)
+
+    keys = np.concatenate([new_keys[differs], old_keys[removed]])
+    vals = np.concatenate([b.data[differs], np.zeros(int(removed.sum()))])
+    return keys // n, keys % n, vals
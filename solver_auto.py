@@ -0,0 +1,410 @@
+"""
+Automatická volba řešiče podle vlastností problému a historie řešení.
+
+Každé dokončené řešení se připíše do souboru historie (JSON Lines): třída
+úlohy, řešič, stav a doba řešení. Třída úlohy shrnuje vlastnosti, na
+kterých rychlost řešičů nejvíc závisí - celočíselnost, řád počtu
+nenulových prvků, hustotu matice a strukturu mezí, např.
+"mip/1e3/sparse/mixed".
+
+AutoSolver pro každý problém vybere řešič s nejnižším mediánem doby
+řešení v historii nejbližší třídy úloh (nejdřív přesná třída, pak jen
+celočíselnost a velikost, nakonec jen celočíselnost). Bez historie
+použije výchozí pravidla podle srovnávacího měření (benchmark.py). Aby se
+historie doplňovala i pro ostatní řešiče, každé EXPLORE_EVERY-té řešení
+třídy zkusí řešič, který v ní má málo záznamů.
+
+Historie se ukládá do souboru zadaného proměnnou LP_SOLVER_STATS, jinak
+do ~/.cache/lp_solver/solve_history.jsonl:
+
+    LP_SOLVER_STATS=historie.jsonl python main.py
+
+Připisování a zkracování souboru chrání zámek souboru "<historie>.lock"
+mezi procesy. Dávkové řešení zápis historie vypne přepínačem --no-history.
+"""
+
+import contextlib
+import json
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models import LPProblem, SolverResult, SolverOptions
+from solver_base import (
+    AbstractLPSolver,
+    CONCLUSIVE_STATUSES,
+    SOLVER_REGISTRY,
+    create_solver,
+)
+
+STATS_ENV = "LP_SOLVER_STATS"
+
+# Řešiče, mezi kterými se volí (portfolio se nezaznamenává ani nevolí)
+AUTO_BACKENDS = ("pulp", "scipy", "ortools")
+# Kolik záznamů řešiče ve třídě úloh stačí k porovnání
+MIN_SAMPLES = 2
+# Počet posledních záznamů řešiče ve třídě, ze kterých se počítá medián
+HISTORY_WINDOW = 20
+# Každé kolikáté řešení třídy zkusí řešič s málo záznamy
+EXPLORE_EVERY = 10
+# Násobek doby řešení, které neskončilo jednoznačným výsledkem
+FAILURE_PENALTY = 10.0
+# Nad touto velikostí se soubor historie zkrátí na poslední polovinu záznamů
+MAX_HISTORY_BYTES = 1_000_000
+# Hustota matice, od které se úloha považuje za hustou
+DENSE_THRESHOLD = 0.05
+# Od tohoto počtu nenulových prvků je LP bez historie rychlejší v HiGHS
+LARGE_LP_NONZEROS = 1_000
+
+
+def default_history_path() -> str:
+    """Soubor historie řešení (lze přepsat proměnnou LP_SOLVER_STATS)"""
+    return os.environ.get(STATS_ENV) or os.path.join(
+        os.path.expanduser("~"), ".cache", "lp_solver", "solve_history.jsonl"
+    )
+
+
+def backend_name(class_name: Optional[str]) -> Optional[str]:
+    """Název řešiče v SOLVER_REGISTRY podle názvu třídy (např. PuLPSolver)"""
+    for name, (_, registered_class) in SOLVER_REGISTRY.items():
+        if registered_class == class_name:
+            return name
+    return None
+
+
+def solve_time_without_import(result: SolverResult) -> float:
+    """Doba řešení bez importu knihovny řešiče.
+
+    Import platí každý nový pracovní proces znovu a u malých úloh by
+    o pořadí řešičů rozhodl víc než samotné řešení.
+    """
+    if result.timings is None:
+        return result.solve_time
+    return result.timings.total - result.timings.import_time
+
+
+@dataclass
+class ProblemFeatures:
+    """Vlastnosti problému, podle kterých se volí řešič"""
+    rows: int
+    cols: int
+    nonzeros: int
+    integers: int
+    free_vars: int  # proměnné bez dolní i horní meze
+    boxed_vars: int  # proměnné s oběma mezemi konečnými
+
+    @classmethod
+    def from_problem(cls, problem: LPProblem) -> "ProblemFeatures":
+        lower_finite = np.isfinite(problem.lower)
+        upper_finite = np.isfinite(problem.upper)
+        return cls(
+            rows=problem.n_cons,
+            cols=problem.n_vars,
+            nonzeros=problem.matrix.nnz,
+            integers=int(np.count_nonzero(problem.integer)),
+            free_vars=int(np.count_nonzero(~lower_finite & ~upper_finite)),
+            boxed_vars=int(np.count_nonzero(lower_finite & upper_finite)),
+        )
+
+    @property
+    def density(self) -> float:
+        return self.nonzeros / max(self.rows * self.cols, 1)
+
+    @property
+    def problem_class(self) -> str:
+        """Třída úlohy, např. "lp/1e4/sparse/mixed" """
+        kind = "mip" if self.integers else "lp"
+        size = f"1e{int(math.log10(max(self.nonzeros, 1)))}"
+        structure = "dense" if self.density >= DENSE_THRESHOLD else "sparse"
+        if self.free_vars:
+            bounds = "free"
+        elif self.boxed_vars == self.cols:
+            bounds = "boxed"
+        else:
+            bounds = "mixed"
+        return f"{kind}/{size}/{structure}/{bounds}"
+
+    @property
+    def class_levels(self) -> List[str]:
+        """Třídy úlohy od nejpřesnější po nejobecnější"""
+        parts = self.problem_class.split("/")
+        return ["/".join(parts), "/".join(parts[:2]), parts[0]]
+
+
+@contextlib.contextmanager
+def _file_lock(path: str):
+    """Výhradní zámek souboru mezi procesy (fcntl.flock, na Windows msvcrt)"""
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+        import msvcrt
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            # Zamyká se první bajt souboru; LK_LOCK čeká nejvýš asi 10 s
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SolveHistory:
+    """Historie dob řešení v souboru JSON Lines (jeden záznam na řešení).
+
+    Do souboru mohou zapisovat i souběžné procesy dávkového řešení:
+    připsání záznamu i zkrácení souboru probíhá pod zámkem vedle souboru
+    historie, takže zkrácení nezahodí záznam připsaný jiným procesem.
+    Čtení zámek nepotřebuje, soubor se při zkrácení nahrazuje atomicky.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_history_path()
+        self._lock = threading.Lock()
+
+    def load(self) -> List[dict]:
+        """Záznamy v pořadí zápisu (poškozené řádky se přeskočí)"""
+        records = []
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+
+    def record(
+        self, features: ProblemFeatures, backend: str, status: str, solve_time: float
+    ):
+        line = json.dumps(
+            {
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "class": features.problem_class,
+                "backend": backend,
+                "status": status,
+                "solve_time": solve_time,
+                "rows": features.rows,
+                "cols": features.cols,
+                "nonzeros": features.nonzeros,
+                "integers": features.integers,
+            }
+        )
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock, _file_lock(self.path + ".lock"):
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            if os.path.getsize(self.path) > MAX_HISTORY_BYTES:
+                self._compact()
+
+    def _compact(self):
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.readlines()
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines[len(lines) // 2:])
+        os.replace(tmp_path, self.path)
+
+
+def expected_times(
+    records: Sequence[dict], problem_class: str, backends: Sequence[str]
+) -> Dict[str, Tuple[float, int]]:
+    """Medián doby řešení a počet záznamů každého řešiče ve třídě úloh.
+
+    Do mediánu jde posledních HISTORY_WINDOW záznamů; řešení, které
+    neskončilo jednoznačným výsledkem, se počítá FAILURE_PENALTY-krát,
+    chyba řešiče jako nekonečná doba.
+    """
+    times: Dict[str, List[float]] = {backend: [] for backend in backends}
+    prefix = problem_class + "/"
+    for record in records:
+        backend = record.get("backend")
+        record_class = record.get("class", "")
+        if backend in times and (
+            record_class == problem_class or record_class.startswith(prefix)
+        ):
+            status = record.get("status")
+            solve_time = float(record.get("solve_time", 0.0))
+            if status == "Error":
+                solve_time = math.inf
+            elif status not in CONCLUSIVE_STATUSES:
+                solve_time *= FAILURE_PENALTY
+            times[backend].append(solve_time)
+    return {
+        backend: (statistics.median(values[-HISTORY_WINDOW:]), len(values))
+        for backend, values in times.items()
+        if values
+    }
+
+
+def default_backend(features: ProblemFeatures) -> str:
+    """Volba bez historie: SCIP pro MIP, GLOP pro malé LP, jinak HiGHS"""
+    if features.integers or features.nonzeros < LARGE_LP_NONZEROS:
+        return "ortools"
+    return "scipy"
+
+
+def choose_backend(
+    features: ProblemFeatures,
+    records: Sequence[dict],
+    backends: Sequence[str] = AUTO_BACKENDS,
+) -> Tuple[str, str]:
+    """Řešič pro problém s danými vlastnostmi a zdůvodnění volby"""
+    candidates = [
+        backend
+        for backend in backends
+        if not features.integers or create_solver(backend).supports_integers
+    ]
+    if not candidates:
+        raise ValueError("Žádný z řešičů neřeší celočíselné úlohy")
+
+    # Průzkum: občas se zkusí řešič, o kterém historie ve třídě málo ví
+    problem_class = features.problem_class
+    in_class = [r for r in records if r.get("class") == problem_class]
+    if in_class and len(in_class) % EXPLORE_EVERY == 0:
+        counts = {
+            backend: sum(r.get("backend") == backend for r in in_class)
+            for backend in candidates
+        }
+        rare = min(candidates, key=counts.get)
+        if counts[rare] < MIN_SAMPLES:
+            return rare, f"zkušební řešení pro historii úloh {problem_class}"
+
+    for level in features.class_levels:
+        known = {
+            backend: (median, count)
+            for backend, (median, count) in expected_times(
+                records, level, candidates
+            ).items()
+            if count >= MIN_SAMPLES
+        }
+        if len(known) >= 2 or len(known) == len(candidates):
+            best = min(known, key=lambda backend: known[backend][0])
+            median, count = known[best]
+            return best, (
+                f"nejrychlejší v historii úloh {level} "
+                f"(medián {median:.3f} s z {count} řešení)"
+            )
+
+    best = default_backend(features)
+    if best not in candidates:
+        best = candidates[0]
+    return best, f"výchozí volba, pro úlohy {problem_class} zatím chybí historie"
+
+
+class AutoSolver(AbstractLPSolver):
+    """Řešič, který pro každý problém zvolí nejrychlejší řešič z historie.
+
+    Volbu a její zdůvodnění uvádí ve výsledku (backend, backend_choice).
+    Historii sám nezapisuje, to dělá StatsSolver kolem něj.
+    """
+
+    def __init__(
+        self,
+        history_path: Optional[str] = None,
+        backends: Sequence[str] = AUTO_BACKENDS,
+    ):
+        self.history_path = history_path
+        self.backends = tuple(backends)
+        self._solver: Optional[AbstractLPSolver] = None
+
+    def choose(self, problem: LPProblem) -> Tuple[str, str]:
+        """Řešič pro problém a zdůvodnění volby"""
+        records = SolveHistory(self.history_path).load()
+        return choose_backend(
+            ProblemFeatures.from_problem(problem), records, self.backends
+        )
+
+    def cancel(self):
+        if self._solver is not None:
+            self._solver.cancel()
+
+    def interrupt(self):
+        if self._solver is not None:
+            self._solver.interrupt()
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        name, reason = self.choose(problem)
+        solver = create_solver(name)
+        solver.set_progress_callback(self._progress_callback)
+        self._solver = solver
+        result = solver.solve(problem, options)
+        result.backend = solver.config()["backend"]
+        result.backend_choice = reason
+        return result
+
+
+class StatsSolver(AbstractLPSolver):
+    """Obálka, která po každém řešení připíše dobu řešení do historie.
+
+    Nezaznamenává výsledky z cache, zrušená řešení a souběh řešičů
+    (portfolio); chyba zápisu řešení neovlivní.
+    """
+
+    def __init__(
+        self, solver: AbstractLPSolver, history: Optional[SolveHistory] = None
+    ):
+        self.solver = solver
+        self.history = history if history is not None else SolveHistory()
+
+    @property
+    def supports_integers(self):
+        return self.solver.supports_integers
+
+    def config(self) -> dict:
+        return self.solver.config()
+
+    def profiled(self, directory: Optional[str] = None, **kwargs) -> AbstractLPSolver:
+        # Profilované řešení je pomalejší, do historie nepatří
+        return self.solver.profiled(directory, **kwargs)
+
+    def cancel(self):
+        self.solver.cancel()
+
+    def interrupt(self):
+        self.solver.interrupt()
+
+    def set_progress_callback(self, callback):
+        self.solver.set_progress_callback(callback)
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        result = self.solver.solve(problem, options)
+        backend = backend_name(result.backend or self.solver.config().get("backend"))
+        if (
+            backend in AUTO_BACKENDS
+            and not result.from_cache
+            and not result.backend_times
+            and result.status != "Cancelled"
+        ):
+            try:
+                self.history.record(
+                    ProblemFeatures.from_problem(problem),
+                    backend,
+                    result.status,
+                    solve_time_without_import(result),
+                )
+            except OSError as e:
+                print(f"Zápis historie řešení selhal: {e}", file=sys.stderr)
+        return result
@@ -1,5 +1,13 @@
+import importlib
+import time
 from abc import ABC, abstractmethod
-from models import LPProblem, SolverResult
+from typing import Callable, Optional
+from models import LPProblem, SolverResult, SolverOptions, PhaseTimings, SolveProgress
+
+# Stavy, které jsou konečnou odpovědí (ne jen nejlepší dosud nalezené řešení)
+CONCLUSIVE_STATUSES = ("Optimal", "Infeasible", "Unbounded")
+
+ProgressCallback = Callable[[SolveProgress], None]
 
 
 class AbstractLPSolver(ABC):
@@ -8,7 +16,133 @@ class AbstractLPSolver(ABC):
     Pokud chcete použít jiný řešič, stačí implementovat tuto třídu.
     """
 
+    # Zda řešič umí celočíselné proměnné (jinak řeší jen LP relaxaci)
+    supports_integers = True
+
+    # Příjemce průběžného stavu řešení (viz set_progress_callback)
+    _progress_callback: Optional[ProgressCallback] = None
+
     @abstractmethod
-    def solve(self, problem: LPProblem) -> SolverResult:
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
         """Řeší LP problém a vrací výsledek"""
         pass
+
+    def solve_many(
+        self,
+        base: LPProblem,
+        scenarios: list,
+        options: Optional[SolverOptions] = None,
+        progress=None,
+        cancelled=None,
+    ):
+        """Vyřeší řadu scénářů základního problému (viz scenarios.py).
+
+        Vrací ScenarioResults. Výchozí implementace řeší scénáře postupně
+        metodou solve, řešič s trvalým modelem (SolveSession) tak každý
+        scénář začíná z řešení předchozího.
+        """
+        from scenarios import solve_scenarios_sequentially
+
+        return solve_scenarios_sequentially(
+            self, base, scenarios, options, progress, cancelled
+        )
+
+    def profiled(self, directory: Optional[str] = None, **kwargs) -> "AbstractLPSolver":
+        """Řešič, který každé řešení profiluje (viz profiling.py).
+
+        Výchozí implementace obalí řešič ProfilingSolver. Obálky, které
+        řešení předávají jinam (jiný proces, cache), ji přepisují tak, aby
+        se profiloval řešič, který model skutečně sestavuje a řeší.
+        """
+        from profiling import ProfilingSolver
+
+        return ProfilingSolver(self, directory, **kwargs)
+
+    def cancel(self):
+        """Požádá o přerušení probíhajícího řešení.
+
+        Výchozí implementace nic nedělá; řešič, který přerušení neumí,
+        doběhne (nejvýše do časového limitu). Tvrdé přerušení zajišťuje
+        ProcessSolver.
+        """
+        pass
+
+    def interrupt(self):
+        """Požádá o předčasné ukončení s nejlepším dosud nalezeným řešením.
+
+        Na rozdíl od cancel() řešení vrátí výsledek: nejlepší nalezené
+        řešení se stavem "Cancelled", případně konečný výsledek, pokud už
+        je znám. Výchozí implementace nic nedělá (řešič doběhne).
+        """
+        pass
+
+    def set_progress_callback(self, callback: Optional[ProgressCallback]):
+        """Nastaví funkci, které řešič hlásí průběh řešení (SolveProgress).
+
+        Funkce se volá z vlákna řešiče. Řešič, který průběh hlásit neumí,
+        ji nevolá; obálky ji předávají řešiči, který model řeší.
+        """
+        self._progress_callback = callback
+
+    def _report_progress(self, progress: SolveProgress):
+        if self._progress_callback is not None:
+            self._progress_callback(progress)
+
+    def config(self) -> dict:
+        """Identifikace řešiče a jeho nastavení (např. pro klíč cache).
+
+        Výchozí implementace vrací název třídy a veřejné atributy instance.
+        """
+        config = {"backend": type(self).__name__}
+        config.update(
+            (name, value)
+            for name, value in vars(self).items()
+            if not name.startswith("_")
+        )
+        return config
+
+
+class PhaseTimer:
+    """Měří po sobě jdoucí fáze jednoho řešení monotónními hodinami.
+
+    Každé volání lap() připíše čas od předchozího volání zadané fázi
+    PhaseTimings (např. "build_time").
+    """
+
+    def __init__(self):
+        self.start = self.last = time.perf_counter()
+        self.timings = PhaseTimings()
+
+    def lap(self, phase: str):
+        now = time.perf_counter()
+        setattr(self.timings, phase, getattr(self.timings, phase) + now - self.last)
+        self.last = now
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+
+# Vestavěné řešiče: název -> (modul, třída). Moduly se importují až při
+# vytvoření řešiče, takže registr nenačítá žádné knihovny řešičů.
+SOLVER_REGISTRY = {
+    "pulp": ("solver_pulp", "PuLPSolver"),
+    "scipy": ("solver_scipy", "SciPySolver"),
+    "ortools": ("solver_ortools", "ORToolsSolver"),
+    "portfolio": ("solver_portfolio", "PortfolioSolver"),
+    "auto": ("solver_auto", "AutoSolver"),
+}
+
+
+def create_solver(name: str, **kwargs) -> AbstractLPSolver:
+    """Vytvoří řešič podle názvu z SOLVER_REGISTRY"""
+    try:
+        module_name, class_name = SOLVER_REGISTRY[name]
+    except KeyError:
+        raise ValueError(
+            f"Neznámý řešič '{name}', dostupné: {', '.join(SOLVER_REGISTRY)}"
+        )
+    solver_class = getattr(importlib.import_module(module_name), class_name)
+    return solver_class(**kwargs)
@@ -0,0 +1,219 @@
+"""
+Cache výsledků řešení adresovaná obsahem problému.
+
+Klíčem je SHA-256 otisk kanonické podoby LPProblem (proměnné, meze,
+účelová funkce, omezení) spolu s konfigurací řešiče. Výsledky se drží
+v paměťové LRU cache omezené velikostí a volitelně i na disku.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from models import LPProblem, SolverResult, SolverOptions
+from solver_base import AbstractLPSolver
+
+# Stavy, které nezávisí na okolnostech běhu a má smysl je cachovat
+CACHEABLE_STATUSES = ("Optimal", "Infeasible", "Unbounded")
+
+
+def default_cache_dir() -> str:
+    """Adresář pro diskovou cache (lze přepsat proměnnou LP_SOLVER_CACHE_DIR)"""
+    return os.environ.get(
+        "LP_SOLVER_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "lp_solver", "results"),
+    )
+
+
+def problem_hash(problem: LPProblem, config: Optional[dict] = None) -> str:
+    """Kanonický otisk problému a konfigurace řešiče"""
+    h = hashlib.sha256()
+
+    def add_array(arr, dtype):
+        # +0.0 sjednotí -0.0 a 0.0, aby neovlivnily otisk
+        arr = np.ascontiguousarray(arr, dtype=dtype)
+        if arr.dtype.kind == "f":
+            arr = arr + 0.0
+        h.update(str(arr.shape).encode())
+        h.update(arr.tobytes())
+
+    h.update(json.dumps(config or {}, sort_keys=True, default=str).encode())
+    h.update(problem.sense.encode())
+    h.update("\0".join(problem.names).encode("utf-8"))
+    add_array(problem.lower, "<f8")
+    add_array(problem.upper, "<f8")
+    add_array(problem.integer, "?")
+    add_array(problem.obj_coeffs, "<f8")
+    add_array(problem.rel, "i1")
+    add_array(problem.rhs, "<f8")
+
+    # Pořadí prvků v řádcích CSR matice nemusí být seřazené
+    matrix = problem.matrix
+    rows = matrix.row_indices()
+    order = np.lexsort((matrix.indices, rows))
+    add_array(matrix.indptr, "<i8")
+    add_array(matrix.indices[order], "<i4")
+    add_array(matrix.data[order], "<f8")
+    return h.hexdigest()
+
+
+def _result_size(result: SolverResult) -> int:
+    """Přibližná paměťová náročnost výsledku v bajtech"""
+    return 256 + sum(len(name) + 120 for name in result.variable_values)
+
+
+class ResultCache:
+    """Paměťová LRU cache výsledků s volitelným úložištěm na disku"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, cache_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[SolverResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        result = self._load_from_disk(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store(key, result)
+        return result
+
+    def put(self, key: str, result: SolverResult):
+        with self._lock:
+            self._store(key, result)
+        self._save_to_disk(key, result)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats_text(self) -> str:
+        """Krátký souhrn statistik pro stavový řádek"""
+        total = self.hits + self.misses
+        ratio = self.hits / total * 100 if total else 0.0
+        return (
+            f"Cache: {self.hits} zásahů / {self.misses} minutí ({ratio:.0f} %), "
+            f"{len(self)} položek, {self._size / 1024:.0f} kB"
+        )
+
+    def _store(self, key: str, result: SolverResult):
+        size = _result_size(result)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old[1]
+        self._entries[key] = (result, size)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+            self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_from_disk(self, key: str) -> Optional[SolverResult]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return SolverResult.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_to_disk(self, key: str, result: SolverResult):
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(dataclasses.asdict(result), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Disková cache je jen optimalizace, chyba zápisu řešení neovlivní
+            pass
+
+
+class CachedSolver(AbstractLPSolver):
+    """Obálka řešiče, která vrací uložené výsledky pro již řešené problémy"""
+
+    def __init__(self, solver: AbstractLPSolver, cache: Optional[ResultCache] = None):
+        self.solver = solver
+        self.cache = cache if cache is not None else ResultCache()
+
+    def config(self) -> dict:
+        return self.solver.config()
+
+    def profiled(self, directory: Optional[str] = None, **kwargs) -> AbstractLPSolver:
+        # Výsledek z cache by nic neprofiloval, řeší se vždy znovu
+        return self.solver.profiled(directory, **kwargs)
+
+    def cancel(self):
+        self.solver.cancel()
+
+    def interrupt(self):
+        self.solver.interrupt()
+
+    def set_progress_callback(self, callback):
+        self.solver.set_progress_callback(callback)
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        start_time = time.perf_counter()
+        options = options or SolverOptions()
+        key = problem_hash(
+            problem, {**self.solver.config(), "options": dataclasses.asdict(options)}
+        )
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return dataclasses.replace(
+                cached,
+                variable_values=dict(cached.variable_values),
+                solve_time=time.perf_counter() - start_time,
+                timings=None,
+                from_cache=True,
+            )
+
+        result = self.solver.solve(problem, options)
+        if result.status in CACHEABLE_STATUSES and not result.error_message:
+            self.cache.put(key, result)
+        return result
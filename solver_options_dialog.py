@@ -0,0 +1,111 @@
+"""
+Dialog nativního nastavení řešiče pro LPWindow (viz SolverOptions).
+
+Nastavení se ukládá s úlohou (JSON i binární formát) a při načtení úlohy
+se obnoví.
+"""
+
+from dataclasses import replace
+
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QCheckBox,
+    QComboBox,
+    QDoubleSpinBox,
+    QSpinBox,
+    QDialogButtonBox,
+    QLabel,
+)
+
+from models import SolverOptions, ALGORITHM_AUTO, ALGORITHM_SIMPLEX, ALGORITHM_BARRIER
+
+# Popisky algoritmů v nabídce
+ALGORITHM_LABELS = {
+    ALGORITHM_AUTO: "Automaticky (výchozí řešiče)",
+    ALGORITHM_SIMPLEX: "Duální simplex",
+    ALGORITHM_BARRIER: "Bariérová metoda (IPM)",
+}
+# Nejvyšší počet vláken nabízený v dialogu
+MAX_THREADS = 256
+
+
+class SolverOptionsDialog(QDialog):
+    """Vlákna, mezera MIP, nativní presolve a algoritmus řešiče"""
+
+    def __init__(self, options: SolverOptions, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Nastavení řešiče")
+        self._options = options
+
+        form = QFormLayout()
+
+        self.threads_spin = QSpinBox()
+        self.threads_spin.setRange(0, MAX_THREADS)
+        self.threads_spin.setSpecialValueText("výchozí")
+        self.threads_spin.setValue(options.threads or 0)
+        self.threads_spin.setToolTip(
+            "Vlákna nativního řešiče (CBC, SCIP); GLOP, CLP a HiGHS v SciPy "
+            "řeší jedním vláknem"
+        )
+        form.addRow("Vlákna:", self.threads_spin)
+
+        # Mezera se zadává v procentech; bez zaškrtnutí platí výchozí řešiče
+        gap_row = QHBoxLayout()
+        self.gap_check = QCheckBox()
+        self.gap_spin = QDoubleSpinBox()
+        self.gap_spin.setRange(0, 100)
+        self.gap_spin.setDecimals(3)
+        self.gap_spin.setSuffix(" %")
+        self.gap_check.setChecked(options.mip_gap is not None)
+        self.gap_spin.setValue((options.mip_gap or 0) * 100)
+        self.gap_spin.setEnabled(options.mip_gap is not None)
+        self.gap_check.toggled.connect(self.gap_spin.setEnabled)
+        gap_row.addWidget(self.gap_check)
+        gap_row.addWidget(self.gap_spin)
+        self.gap_check.setToolTip(
+            "Řešení MIP skončí, jakmile relativní mezera mezi nejlepším "
+            "řešením a mezí klesne pod zadanou hodnotu"
+        )
+        form.addRow("Mezera MIP:", gap_row)
+
+        self.native_presolve_check = QCheckBox("Presolve nativního řešiče")
+        self.native_presolve_check.setChecked(options.native_presolve)
+        form.addRow(self.native_presolve_check)
+
+        self.algorithm_combo = QComboBox()
+        for algorithm, label in ALGORITHM_LABELS.items():
+            self.algorithm_combo.addItem(label, algorithm)
+        self.algorithm_combo.setCurrentIndex(
+            self.algorithm_combo.findData(options.algorithm)
+        )
+        self.algorithm_combo.setToolTip(
+            "Algoritmus LP (u MIP pro relaxace); bariérovou metodu v OR-Tools "
+            "řeší CLP místo GLOP"
+        )
+        form.addRow("Algoritmus LP:", self.algorithm_combo)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        note = QLabel("Co řešič nepodporuje, ignoruje.")
+        note.setStyleSheet("color: gray")
+        layout.addWidget(note)
+        layout.addWidget(buttons)
+
+    def options(self) -> SolverOptions:
+        """Nastavení podle dialogu (časový limit a presolve zůstávají)"""
+        return replace(
+            self._options,
+            threads=self.threads_spin.value() or None,
+            mip_gap=(
+                self.gap_spin.value() / 100 if self.gap_check.isChecked() else None
+            ),
+            native_presolve=self.native_presolve_check.isChecked(),
+            algorithm=self.algorithm_combo.currentData(),
+        )
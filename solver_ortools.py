@@ -1,14 +1,52 @@
-import time
-from solver_base import AbstractLPSolver
-from models import LPProblem, SolverResult
+from typing import Optional
+import numpy as np
+from solver_base import AbstractLPSolver, PhaseTimer
+from models import (
+    LPProblem,
+    SolverResult,
+    SolverOptions,
+    ModelStats,
+    SolverCounters,
+    REL_LE,
+    REL_GE,
+    ALGORITHM_SIMPLEX,
+    ALGORITHM_BARRIER,
+)
+
+# Typ řešiče v MPModelRequest podle názvu řešiče pywraplp
+SOLVER_TYPES = {
+    "GLOP": "GLOP_LINEAR_PROGRAMMING",
+    "CLP": "CLP_LINEAR_PROGRAMMING",
+    "SCIP": "SCIP_MIXED_INTEGER_PROGRAMMING",
+}
+# Hodnota parametru LP_ALGORITHM (MPSolverParameters) podle algoritmu
+LP_ALGORITHMS = {
+    ALGORITHM_SIMPLEX: "DUAL",
+    ALGORITHM_BARRIER: "BARRIER",
+}
 
 
 class ORToolsSolver(AbstractLPSolver):
-    """Implementace pomocí Google OR-Tools"""
+    """Implementace pomocí Google OR-Tools
+
+    Ve výchozím režimu (use_proto=True) se model naplní z polí problému do
+    MPModelProto a vyřeší jedním voláním SolveWithProto. Režim
+    use_proto=False sestavuje model postupně přes objekty pywraplp.
+
+    Nativní nastavení (SolverOptions) se předává přes MPSolverParameters,
+    model z proto se pak načte do pywraplp.Solver (LoadModelFromProto).
+    """
 
-    def solve(self, problem: LPProblem) -> SolverResult:
+    def __init__(self, use_proto: bool = True):
+        self.use_proto = use_proto
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        timer = PhaseTimer()
         try:
             from ortools.linear_solver import pywraplp
+            from ortools.linear_solver import linear_solver_pb2
         except ImportError:
             return SolverResult(
                 status="Error",
@@ -16,81 +54,43 @@ class ORToolsSolver(AbstractLPSolver):
                 variable_values={},
                 error_message="OR-Tools není nainstalováno. Spusťte: pip install ortools",
             )
+        timer.lap("import_time")
 
-        start_time = time.time()
+        options = options or SolverOptions()
 
         try:
-            # Vytvoření solveru
-            # GLOP = LP solver, SCIP = MIP solver (podporuje celočíselné)
-            has_integers = any(v.vtype == "Integer" for v in problem.variables)
-            solver_type = "SCIP" if has_integers else "GLOP"
-
-            solver = pywraplp.Solver.CreateSolver(solver_type)
-            if not solver:
-                raise Exception(f"Nepodařilo se vytvořit {solver_type} solver")
-
-            # Vytvoření proměnných
-            vars_dict = {}
-            for v in problem.variables:
-                lb = v.low if v.low is not None else -solver.infinity()
-                ub = v.up if v.up is not None else solver.infinity()
-
-                if v.vtype == "Integer":
-                    vars_dict[v.name] = solver.IntVar(lb, ub, v.name)
-                else:
-                    vars_dict[v.name] = solver.NumVar(lb, ub, v.name)
-
-            # Účelová funkce
-            objective = solver.Objective()
-            for i, var in enumerate(problem.variables):
-                objective.SetCoefficient(
-                    vars_dict[var.name], problem.objective.coeffs[i]
-                )
-
-            if problem.objective.sense == "Minimalizovat":
-                objective.SetMinimization()
+            response = linear_solver_pb2.MPSolutionResponse()
+            counters = SolverCounters()
+            if self.use_proto and options.native_defaults:
+                request = self._build_request(problem, linear_solver_pb2)
+                if options.time_limit is not None:
+                    request.solver_time_limit_seconds = options.time_limit
+                timer.lap("build_time")
+                pywraplp.Solver.SolveWithProto(request, response)
+                timer.lap("native_time")
             else:
-                objective.SetMaximization()
-
-            # Omezení
-            for constraint in problem.constraints:
-                if constraint.rel == "≤":
-                    ct = solver.Constraint(-solver.infinity(), constraint.rhs)
-                elif constraint.rel == "≥":
-                    ct = solver.Constraint(constraint.rhs, solver.infinity())
-                else:  # =
-                    ct = solver.Constraint(constraint.rhs, constraint.rhs)
-
-                for i, var in enumerate(problem.variables):
-                    ct.SetCoefficient(vars_dict[var.name], constraint.coeffs[i])
-
-            # Řešení
-            status = solver.Solve()
-            solve_time = time.time() - start_time
-
-            # Mapování statusů
-            status_map = {
-                pywraplp.Solver.OPTIMAL: "Optimal",
-                pywraplp.Solver.FEASIBLE: "Feasible",
-                pywraplp.Solver.INFEASIBLE: "Infeasible",
-                pywraplp.Solver.UNBOUNDED: "Unbounded",
-                pywraplp.Solver.ABNORMAL: "Abnormal",
-                pywraplp.Solver.NOT_SOLVED: "Not Solved",
-            }
-
-            variable_values = {
-                name: var.solution_value() for name, var in vars_dict.items()
-            }
-
-            return SolverResult(
-                status=status_map.get(status, "Unknown"),
-                objective_value=(
-                    objective.Value()
-                    if status in [pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE]
-                    else None
-                ),
-                variable_values=variable_values,
-                solve_time=solve_time,
+                if self.use_proto:
+                    request = self._build_request(problem, linear_solver_pb2, options)
+                    solver = self._create_solver(problem, options, pywraplp)
+                    error = solver.LoadModelFromProto(request.model)
+                    if error:
+                        raise Exception(error)
+                else:
+                    solver = self._build_solver(problem, pywraplp, options)
+                if options.time_limit is not None:
+                    solver.SetTimeLimit(int(options.time_limit * 1000))
+                params = self._parameters(solver, problem, options, pywraplp)
+                timer.lap("build_time")
+                solver.Solve(params)
+                timer.lap("native_time")
+                counters = self._counters(solver, problem)
+                solver.FillSolutionResponseProto(response)
+            self._confirm_infeasible(
+                problem, options, response, timer.elapsed, pywraplp, linear_solver_pb2
+            )
+            timer.lap("native_time")
+            return self._make_result(
+                problem, response, options, timer, counters, linear_solver_pb2
             )
 
         except Exception as e:
@@ -98,6 +98,233 @@ class ORToolsSolver(AbstractLPSolver):
                 status="Error",
                 objective_value=None,
                 variable_values={},
-                solve_time=time.time() - start_time,
+                solve_time=timer.elapsed,
                 error_message=str(e),
+                timings=timer.timings,
+            )
+
+    @classmethod
+    def _confirm_infeasible(
+        cls,
+        problem: LPProblem,
+        options: SolverOptions,
+        response,
+        elapsed: float,
+        pywraplp,
+        pb,
+    ):
+        """Rozliší nepřípustný a neomezený problém.
+
+        GLOP i SCIP po nativním presolve hlásí "nepřípustný nebo neomezený"
+        jako MPSOLVER_INFEASIBLE (bez presolve stavy rozlišují). Problém
+        se pak ve zbývajícím čase vyřeší s nulovou účelovou funkcí: je-li
+        přípustný, je původní problém neomezený. Když čas na kontrolu
+        nezbude, stav se změní na MPSOLVER_NOT_SOLVED.
+        """
+        if response.status != pb.MPSOLVER_INFEASIBLE or not options.native_presolve:
+            return
+        request = cls()._build_request(problem, pb, options)
+        for variable in request.model.variable:
+            variable.objective_coefficient = 0.0
+        if options.time_limit is not None:
+            remaining = options.time_limit - elapsed
+            if remaining <= 0:
+                response.status = pb.MPSOLVER_NOT_SOLVED
+                return
+            request.solver_time_limit_seconds = remaining
+        feasibility = pb.MPSolutionResponse()
+        pywraplp.Solver.SolveWithProto(request, feasibility)
+        if feasibility.status in (pb.MPSOLVER_OPTIMAL, pb.MPSOLVER_FEASIBLE):
+            response.status = pb.MPSOLVER_UNBOUNDED
+        elif feasibility.status != pb.MPSOLVER_INFEASIBLE:
+            response.status = pb.MPSOLVER_NOT_SOLVED
+
+    @staticmethod
+    def _counters(solver, problem: LPProblem) -> SolverCounters:
+        """Čítače dostupné jen přes objekt pywraplp.Solver (ne přes proto)"""
+        return SolverCounters(
+            iterations=solver.iterations(),
+            nodes=solver.nodes() if problem.has_integers else None,
+        )
+
+    @staticmethod
+    def _make_result(
+        problem: LPProblem,
+        response,
+        options: SolverOptions,
+        timer: PhaseTimer,
+        counters: SolverCounters,
+        pb,
+    ) -> SolverResult:
+        """Převede MPSolutionResponse na SolverResult.
+
+        Doba od posledního kroku `timer` (včetně vyplnění odpovědi) se
+        započte jako převod výsledku.
+        """
+        # Mapování statusů
+        status_map = {
+            pb.MPSOLVER_OPTIMAL: "Optimal",
+            pb.MPSOLVER_FEASIBLE: "Feasible",
+            pb.MPSOLVER_INFEASIBLE: "Infeasible",
+            pb.MPSOLVER_UNBOUNDED: "Unbounded",
+            pb.MPSOLVER_ABNORMAL: "Abnormal",
+            pb.MPSOLVER_NOT_SOLVED: "Not Solved",
+        }
+        status = status_map.get(response.status)
+        if status is None:
+            raise Exception(
+                f"OR-Tools vrátil stav {response.status}: {response.status_str}"
+            )
+
+        # Hodnoty proměnných se čtou hromadně z odpovědi řešiče
+        has_solution = status in ("Optimal", "Feasible")
+        if options.time_limit is not None and status in ("Feasible", "Not Solved"):
+            # Řešič skončil na časovém limitu, případně s nejlepším řešením
+            status = "TimeLimit"
+        values = np.asarray(response.variable_value, dtype=np.float64)
+        variable_values = (
+            dict(zip(problem.names, values.tolist())) if has_solution else {}
+        )
+        if has_solution and problem.has_integers and response.HasField(
+            "best_objective_bound"
+        ):
+            bound = response.best_objective_bound
+            counters.best_bound = bound
+            counters.gap = abs(response.objective_value - bound) / max(
+                abs(response.objective_value), 1e-9
             )
+
+        timer.lap("extract_time")
+        return SolverResult(
+            status=status,
+            objective_value=response.objective_value if has_solution else None,
+            variable_values=variable_values,
+            solve_time=timer.elapsed,
+            timings=timer.timings,
+            model_stats=ModelStats.from_problem(problem),
+            counters=counters,
+        )
+
+    @staticmethod
+    def _row_bounds(problem: LPProblem):
+        """Dolní a horní meze řádků odvozené z relací a pravých stran"""
+        lower = np.where(problem.rel == REL_LE, -np.inf, problem.rhs)
+        upper = np.where(problem.rel == REL_GE, np.inf, problem.rhs)
+        return lower, upper
+
+    @staticmethod
+    def solver_name(problem: LPProblem, options: Optional[SolverOptions] = None) -> str:
+        """Řešič pywraplp pro problém a nastavení.
+
+        GLOP = LP solver, SCIP = MIP solver (podporuje celočíselné); GLOP
+        bariérovou metodu nemá, LP s bariérou proto řeší CLP.
+        """
+        if problem.has_integers:
+            return "SCIP"
+        if options is not None and options.algorithm == ALGORITHM_BARRIER:
+            return "CLP"
+        return "GLOP"
+
+    @classmethod
+    def _create_solver(cls, problem: LPProblem, options, pywraplp):
+        solver_type = cls.solver_name(problem, options)
+        solver = pywraplp.Solver.CreateSolver(solver_type)
+        if not solver:
+            raise Exception(f"Nepodařilo se vytvořit {solver_type} solver")
+        return solver
+
+    @staticmethod
+    def _parameters(solver, problem: LPProblem, options: SolverOptions, pywraplp):
+        """Nastaví vlákna a vrátí MPSolverParameters podle SolverOptions"""
+        if options.threads is not None:
+            # GLOP a CLP více vláken nevyužijí (SetNumThreads vrátí False)
+            solver.SetNumThreads(options.threads)
+        params = pywraplp.MPSolverParameters()
+        if options.mip_gap is not None and problem.has_integers:
+            params.SetDoubleParam(params.RELATIVE_MIP_GAP, options.mip_gap)
+        if not options.native_presolve:
+            params.SetIntegerParam(params.PRESOLVE, params.PRESOLVE_OFF)
+        algorithm = LP_ALGORITHMS.get(options.algorithm)
+        if algorithm is not None:
+            params.SetIntegerParam(params.LP_ALGORITHM, getattr(params, algorithm))
+        return params
+
+    def _build_request(
+        self, problem: LPProblem, pb, options: Optional[SolverOptions] = None
+    ):
+        """Naplní MPModelRequest přímo z polí problému"""
+        request = pb.MPModelRequest()
+        request.solver_type = getattr(
+            pb.MPModelRequest, SOLVER_TYPES[self.solver_name(problem, options)]
+        )
+
+        model = request.model
+        model.maximize = problem.maximize
+        for name, lb, ub, is_int, obj in zip(
+            problem.names,
+            problem.lower.tolist(),
+            problem.upper.tolist(),
+            problem.integer.tolist(),
+            problem.obj_coeffs.tolist(),
+        ):
+            model.variable.add(
+                name=name,
+                lower_bound=lb,
+                upper_bound=ub,
+                is_integer=is_int,
+                objective_coefficient=obj,
+            )
+
+        # Každý řádek se vloží jako celé řezy polí CSR (bez volání po prvcích)
+        indptr = problem.matrix.indptr.tolist()
+        indices = problem.matrix.indices.tolist()
+        data = problem.matrix.data.tolist()
+        row_lower, row_upper = self._row_bounds(problem)
+        for r, (lb, ub) in enumerate(zip(row_lower.tolist(), row_upper.tolist())):
+            start, end = indptr[r], indptr[r + 1]
+            model.constraint.add(
+                lower_bound=lb,
+                upper_bound=ub,
+                var_index=indices[start:end],
+                coefficient=data[start:end],
+            )
+        return request
+
+    def _build_solver(
+        self, problem: LPProblem, pywraplp, options: Optional[SolverOptions] = None
+    ):
+        """Sestaví model postupně přes objekty pywraplp"""
+        solver = self._create_solver(problem, options, pywraplp)
+
+        # Vytvoření proměnných (±inf v polích mezí odpovídá solver.infinity())
+        inf = solver.infinity()
+        lower = np.clip(problem.lower, -inf, inf).tolist()
+        upper = np.clip(problem.upper, -inf, inf).tolist()
+        var_list = []
+        for name, lb, ub, is_int in zip(
+            problem.names, lower, upper, problem.integer.tolist()
+        ):
+            if is_int:
+                var_list.append(solver.IntVar(lb, ub, name))
+            else:
+                var_list.append(solver.NumVar(lb, ub, name))
+
+        # Účelová funkce
+        objective = solver.Objective()
+        for j in np.flatnonzero(problem.obj_coeffs).tolist():
+            objective.SetCoefficient(var_list[j], float(problem.obj_coeffs[j]))
+
+        if problem.maximize:
+            objective.SetMaximization()
+        else:
+            objective.SetMinimization()
+
+        # Omezení - koeficienty se nastavují jen pro nenulové prvky
+        row_lower, row_upper = self._row_bounds(problem)
+        for r, (lb, ub) in enumerate(zip(row_lower.tolist(), row_upper.tolist())):
+            ct = solver.Constraint(max(lb, -inf), min(ub, inf))
+            idx, vals = problem.matrix.row(r)
+            for j, coef in zip(idx.tolist(), vals.tolist()):
+                ct.SetCoefficient(var_list[j], coef)
+
+        return solver
@@ -0,0 +1,165 @@
+"""
+Portfolio řešičů - souběžné řešení více řešiči ("závod").
+
+Který řešič je nejrychlejší, silně závisí na konkrétní úloze. PortfolioSolver
+proto spustí několik řešičů paralelně v samostatných procesech, vrátí první
+jednoznačný výsledek a ostatní procesy ukončí. Procesy, které doběhnou,
+se vrací do zásoby pro další řešení (viz solver_process.py).
+"""
+
+import dataclasses
+import threading
+from typing import List, Optional
+
+from models import LPProblem, SolverResult, SolverOptions
+from solver_base import AbstractLPSolver, CONCLUSIVE_STATUSES
+from solver_process import POLL_INTERVAL, WorkerHandle
+
+
+def default_portfolio() -> List[AbstractLPSolver]:
+    from solver_pulp import PuLPSolver
+    from solver_scipy import SciPySolver
+    from solver_ortools import ORToolsSolver
+
+    return [PuLPSolver(), SciPySolver(), ORToolsSolver()]
+
+
+class PortfolioSolver(AbstractLPSolver):
+    """Spouští několik řešičů souběžně a vrací první jednoznačný výsledek"""
+
+    def __init__(
+        self,
+        solvers: Optional[List[AbstractLPSolver]] = None,
+        grace_period: float = 2.0,
+    ):
+        self.solvers = solvers if solvers is not None else default_portfolio()
+        self.grace_period = grace_period
+        self._cancel_event = threading.Event()
+        self._interrupt_event = threading.Event()
+
+    def config(self) -> dict:
+        return {
+            "backend": type(self).__name__,
+            "solvers": [solver.config() for solver in self.solvers],
+        }
+
+    def profiled(self, directory: Optional[str] = None, **kwargs) -> AbstractLPSolver:
+        # Každý řešič portfolia běží ve vlastním procesu a profiluje se tam
+        return PortfolioSolver(
+            [solver.profiled(directory, **kwargs) for solver in self.solvers],
+            self.grace_period,
+        )
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def interrupt(self):
+        self._interrupt_event.set()
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        options = options or SolverOptions()
+        self._cancel_event.clear()
+        self._interrupt_event.clear()
+
+        # Řešiče bez podpory celočíselnosti by vrátily jen LP relaxaci
+        solvers = [
+            s for s in self.solvers if s.supports_integers or not problem.has_integers
+        ]
+        if not solvers:
+            return SolverResult(
+                status="Error",
+                objective_value=None,
+                variable_values={},
+                error_message="Žádný řešič v portfoliu nepodporuje tento problém",
+            )
+
+        deadline = None
+        if options.time_limit is not None:
+            deadline = options.time_limit + self.grace_period
+
+        running = {}
+        for i, solver in enumerate(solvers):
+            name = solver.config()["backend"]
+            if name in running:
+                name = f"{name}#{i}"
+            running[name] = WorkerHandle.acquire(
+                solver, problem, options, self._progress_callback
+            )
+        finished = {}
+        times = {}
+        winner = None
+        interrupt_deadline = None
+
+        try:
+            while running and winner is None:
+                for name, worker in list(running.items()):
+                    result = worker.poll(POLL_INTERVAL / len(running))
+                    if result is None:
+                        continue
+                    del running[name]
+                    worker.release()
+                    finished[name] = result
+                    times[name] = worker.elapsed
+                    if result.status in CONCLUSIVE_STATUSES:
+                        winner = name
+                        break
+
+                if winner is None and running:
+                    elapsed = max(worker.elapsed for worker in running.values())
+                    if self._interrupt_event.is_set() and interrupt_deadline is None:
+                        # Řešiče vrátí nejlepší nalezená řešení a vybere se z nich
+                        for worker in running.values():
+                            worker.interrupt()
+                        interrupt_deadline = elapsed + self.grace_period
+                    if (
+                        self._cancel_event.is_set()
+                        or (deadline is not None and elapsed > deadline)
+                        or (
+                            interrupt_deadline is not None
+                            and elapsed > interrupt_deadline
+                        )
+                    ):
+                        break
+        finally:
+            # Pomalejší řešiče se ukončí i s případnými podprocesy
+            for name, worker in running.items():
+                times[name] = worker.elapsed
+                worker.kill()
+
+        if winner is None:
+            winner = self._best_incumbent(finished, problem.maximize)
+        stopped = self._cancel_event.is_set() or self._interrupt_event.is_set()
+        if winner is None:
+            status = "Cancelled" if stopped else "TimeLimit"
+            return SolverResult(
+                status=status,
+                objective_value=None,
+                variable_values={},
+                solve_time=max(times.values(), default=0.0),
+                backend_times=times,
+            )
+
+        result = dataclasses.replace(
+            finished[winner],
+            backend=winner,
+            backend_times=times,
+            solve_time=times[winner],
+        )
+        if stopped and result.status not in CONCLUSIVE_STATUSES:
+            result.status = "Cancelled"
+        return result
+
+    @staticmethod
+    def _best_incumbent(finished: dict, maximize: bool) -> Optional[str]:
+        """Bez jednoznačného výsledku vybere nejlepší nalezené řešení"""
+        with_solution = {
+            name: r.objective_value
+            for name, r in finished.items()
+            if r.objective_value is not None
+        }
+        if with_solution:
+            pick = max if maximize else min
+            return pick(with_solution, key=with_solution.get)
+        return next(iter(finished), None)
@@ -0,0 +1,289 @@
+"""
+Spouštění řešiče v samostatném pracovním procesu.
+
+Nativní řešiče (CBC, SCIP, HiGHS) nelze z Pythonu spolehlivě přerušit,
+proto ProcessSolver spouští zvolený řešič v odděleném procesu, který lze
+při zrušení nebo po překročení časového limitu tvrdě ukončit.
+
+Proces po dokončeném řešení zůstává v zásobě pro další řešení stejným
+řešičem; nový proces (start interpretu a import knihovny řešiče) se
+spouští jen poprvé a po tvrdém ukončení.
+"""
+
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from typing import Optional
+
+from models import LPProblem, SolverResult, SolverOptions, SolveProgress
+from solver_base import AbstractLPSolver, CONCLUSIVE_STATUSES, ProgressCallback
+
+# Jak často rodičovský proces kontroluje výsledek a požadavek na zrušení
+POLL_INTERVAL = 0.05
+
+# Nečinné pracovní procesy podle řešiče, který v nich běžel naposledy
+_idle_workers = {}
+_idle_lock = threading.Lock()
+
+
+def _worker_key(solver: AbstractLPSolver) -> str:
+    return solver.config()["backend"]
+
+
+def _worker_main(conn):
+    """Vstupní bod pracovního procesu.
+
+    Proces řeší úlohy (řešič, problém, nastavení, hlásit průběh) jednu po
+    druhé, dokud rodič rouru nezavře; knihovny řešičů se tak importují
+    jen jednou. Průběh řešení (SolveProgress) se posílá stejnou rourou
+    jako výsledek.
+    """
+    if hasattr(os, "setsid"):
+        # Vlastní skupina procesů, aby šlo ukončit i podprocesy (např. CBC)
+        os.setsid()
+    send_lock = threading.Lock()
+
+    def send(message):
+        with send_lock:
+            conn.send(message)
+
+    while True:
+        try:
+            solver, problem, options, report_progress = conn.recv()
+        except EOFError:
+            break
+        # SIGINT z WorkerHandle.interrupt patří nativnímu řešiči (CBC, SCIP),
+        # který na něj skončí s nejlepším nalezeným řešením; obálka v Pythonu
+        # se o přerušení dozví přes interrupt()
+        signal.signal(signal.SIGINT, lambda signum, frame, s=solver: s.interrupt())
+        if report_progress:
+            solver.set_progress_callback(send)
+        try:
+            result = solver.solve(problem, options)
+        except Exception as e:
+            result = SolverResult(
+                status="Error",
+                objective_value=None,
+                variable_values={},
+                error_message=str(e),
+            )
+        solver.set_progress_callback(None)
+        send(result)
+        # Nečinný proces nedrží data poslední úlohy
+        del solver, problem, options, result
+    conn.close()
+
+
+def kill_process_tree(process: multiprocessing.Process):
+    """Tvrdě ukončí pracovní proces i s jeho podprocesy"""
+    if not process.is_alive():
+        return
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            process.kill()
+    else:
+        process.kill()
+    process.join()
+
+
+class WorkerHandle:
+    """Pracovní proces řešiče a úloha, kterou právě řeší.
+
+    Po vrácení výsledku může proces řešit další úlohu. Procesy ze zásoby
+    nečinných procesů (viz acquire a release) mají knihovnu řešiče už
+    naimportovanou, takže opakované řešení neplatí start interpretu.
+    """
+
+    def __init__(
+        self,
+        solver: AbstractLPSolver,
+        problem: LPProblem,
+        options: Optional[SolverOptions],
+        progress: Optional[ProgressCallback] = None,
+    ):
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn,), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.submit(solver, problem, options, progress)
+
+    @classmethod
+    def acquire(
+        cls,
+        solver: AbstractLPSolver,
+        problem: LPProblem,
+        options: Optional[SolverOptions],
+        progress: Optional[ProgressCallback] = None,
+    ) -> "WorkerHandle":
+        """Spustí úlohu v nečinném procesu stejného řešiče, případně v novém"""
+        with _idle_lock:
+            worker = _idle_workers.pop(_worker_key(solver), None)
+        if worker is not None and worker.process.is_alive():
+            try:
+                worker.submit(solver, problem, options, progress)
+                return worker
+            except OSError:
+                worker.kill()
+        return cls(solver, problem, options, progress)
+
+    def submit(
+        self,
+        solver: AbstractLPSolver,
+        problem: LPProblem,
+        options: Optional[SolverOptions],
+        progress: Optional[ProgressCallback] = None,
+    ):
+        self.key = _worker_key(solver)
+        self._progress = progress
+        self.start_time = time.perf_counter()
+        self._conn.send((solver, problem, options, progress is not None))
+
+    def release(self):
+        """Po vrácení výsledku uloží proces do zásoby (jeden na řešič)"""
+        with _idle_lock:
+            if self.key not in _idle_workers and self.process.is_alive():
+                _idle_workers[self.key] = self
+                return
+        self.close()
+
+    def close(self):
+        """Ukončí nečinný proces (po zavření roury skončí sám)"""
+        self._conn.close()
+
+    @property
+    def elapsed(self) -> float:
+        """Doba od zadání úlohy"""
+        return time.perf_counter() - self.start_time
+
+    def poll(self, timeout: float = 0.0) -> Optional[SolverResult]:
+        """Vrací výsledek, pokud je k dispozici, jinak None.
+
+        Hlášení průběhu, která mezitím přišla, předá funkci `progress`.
+        """
+        while self._conn.poll(timeout):
+            try:
+                message = self._conn.recv()
+            except EOFError:
+                return self._crash_result()
+            if isinstance(message, SolveProgress):
+                if self._progress is not None:
+                    self._progress(message)
+                timeout = 0.0
+                continue
+            return message
+        if not self.process.is_alive():
+            # Proces skončil bez odeslání výsledku (pád nativní knihovny)
+            return self._crash_result()
+        return None
+
+    def interrupt(self):
+        """Pošle skupině procesů SIGINT (řešič skončí s nejlepším řešením)"""
+        if hasattr(os, "killpg") and self.process.is_alive():
+            try:
+                os.killpg(self.process.pid, signal.SIGINT)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+    def kill(self):
+        kill_process_tree(self.process)
+        self._conn.close()
+
+    def _crash_result(self) -> SolverResult:
+        self.process.join()
+        return SolverResult(
+            status="Error",
+            objective_value=None,
+            variable_values={},
+            solve_time=self.elapsed,
+            error_message=(
+                f"Proces řešiče neočekávaně skončil (kód {self.process.exitcode})"
+            ),
+        )
+
+
+class ProcessSolver(AbstractLPSolver):
+    """Obálka, která spouští řešič v samostatném procesu.
+
+    Proces je tvrdě ukončen při volání cancel() nebo pokud řešič nedodrží
+    časový limit ani po uplynutí `grace_period` sekund navíc. Po interrupt()
+    dostane řešič `grace_period` sekund na vrácení nejlepšího řešení.
+    """
+
+    def __init__(self, solver: AbstractLPSolver, grace_period: float = 2.0):
+        self.solver = solver
+        self.grace_period = grace_period
+        self._cancel_event = threading.Event()
+        self._interrupt_event = threading.Event()
+
+    def config(self) -> dict:
+        return self.solver.config()
+
+    def profiled(self, directory: Optional[str] = None, **kwargs) -> AbstractLPSolver:
+        # Řeší se v pracovním procesu, profilovat se musí tam
+        return ProcessSolver(
+            self.solver.profiled(directory, **kwargs), self.grace_period
+        )
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def interrupt(self):
+        self._interrupt_event.set()
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        options = options or SolverOptions()
+        self._cancel_event.clear()
+        self._interrupt_event.clear()
+
+        deadline = None
+        if options.time_limit is not None:
+            deadline = options.time_limit + self.grace_period
+        interrupt_deadline = None
+
+        worker = WorkerHandle.acquire(
+            self.solver, problem, options, self._progress_callback
+        )
+        while True:
+            result = worker.poll(POLL_INTERVAL)
+            if result is not None:
+                worker.release()
+                # Doba řešení včetně předání úlohy procesu a zpět
+                result.solve_time = worker.elapsed
+                if (
+                    interrupt_deadline is not None
+                    and result.status not in CONCLUSIVE_STATUSES + ("Error",)
+                ):
+                    result.status = "Cancelled"
+                return result
+            if self._cancel_event.is_set():
+                worker.kill()
+                return self._stopped_result("Cancelled", worker.elapsed)
+            if self._interrupt_event.is_set() and interrupt_deadline is None:
+                worker.interrupt()
+                interrupt_deadline = worker.elapsed + self.grace_period
+            if interrupt_deadline is not None and worker.elapsed > interrupt_deadline:
+                # Řešič na přerušení nereaguje (např. HiGHS)
+                worker.kill()
+                return self._stopped_result("Cancelled", worker.elapsed)
+            if deadline is not None and worker.elapsed > deadline:
+                worker.kill()
+                return self._stopped_result("TimeLimit", worker.elapsed)
+
+    @staticmethod
+    def _stopped_result(status: str, elapsed: float) -> SolverResult:
+        # Po tvrdém ukončení procesu není nejlepší nalezené řešení k dispozici
+        return SolverResult(
+            status=status,
+            objective_value=None,
+            variable_values={},
+            solve_time=elapsed,
+        )
@@ -2,15 +2,176 @@
 Implementace řešiče pomocí PuLP knihovny.
 """
 
-import time
-from solver_base import AbstractLPSolver
-from models import LPProblem, SolverResult
+import math
+import os
+import re
+import tempfile
+import threading
+from typing import Optional
+
+import numpy as np
+
+from presolve import unsatisfied_by_zero
+from solver_base import AbstractLPSolver, PhaseTimer
+from models import (
+    LPProblem,
+    SolverResult,
+    SolverOptions,
+    SolveProgress,
+    ModelStats,
+    ALGORITHM_SIMPLEX,
+    ALGORITHM_BARRIER,
+    SolverCounters,
+    REL_LE,
+    REL_GE,
+    REL_EQ,
+)
+
+# Jak často se při hlášení průběhu čte nový výpis CBC (v sekundách)
+CBC_LOG_POLL_INTERVAL = 0.2
+# Hodnota, kterou CBC vypisuje místo dosud nenalezeného řešení
+CBC_NO_SOLUTION = 1e50
+# Příkazy CBC, kterými se LP (u MIP kořenová relaxace) vyřeší zvoleným algoritmem
+CBC_ALGORITHM_OPTIONS = {
+    ALGORITHM_SIMPLEX: ["dualSimplex"],
+    ALGORITHM_BARRIER: ["barrier"],
+}
+
+_CBC_NODES = re.compile(
+    r"Cbc0010I After (\d+) nodes, \d+ on tree, (\S+) best solution, "
+    r"best possible (\S+) \((\S+) seconds\)"
+)
+_CBC_SOLUTION = re.compile(
+    r"Cbc00(?:04|12)I Integer solution of (\S+) found.* (\d+) nodes "
+    r"\((\S+) seconds\)"
+)
+
+
+def _last_match(pattern: str, text: str, cast):
+    matches = re.findall(pattern, text)
+    return cast(matches[-1]) if matches else None
+
+
+def cbc_counters(log: str) -> SolverCounters:
+    """Čítače ze souhrnu na konci výpisu CBC"""
+    iterations = _last_match(r"Total iterations:\s+(\d+)", log, int)
+    if iterations is None:
+        # Čistě LP úloha: "Optimal objective ... - 28 iterations time 0.002"
+        iterations = _last_match(r"- (\d+) iterations", log, int)
+    return SolverCounters(
+        iterations=iterations,
+        nodes=_last_match(r"Enumerated nodes:\s+(\d+)", log, int),
+        gap=_last_match(r"Gap:\s+(\S+)", log, float),
+    )
+
+
+def cbc_progress(line: str, maximize: bool) -> Optional[SolveProgress]:
+    """Průběžný stav z řádku výpisu CBC (None = řádek stav nenese).
+
+    CBC vždy minimalizuje, u maximalizace jsou hodnoty ve výpisu
+    s opačným znaménkem.
+    """
+    sign = -1.0 if maximize else 1.0
+    bound = None
+    match = _CBC_NODES.search(line)
+    if match is not None:
+        nodes, objective, bound, seconds = match.groups()
+        bound = sign * float(bound)
+    else:
+        match = _CBC_SOLUTION.search(line)
+        if match is None:
+            return None
+        objective, nodes, seconds = match.groups()
+
+    objective = float(objective)
+    return SolveProgress(
+        elapsed=float(seconds),
+        objective=sign * objective if abs(objective) < CBC_NO_SOLUTION else None,
+        best_bound=bound,
+        nodes=int(nodes),
+        backend="PuLPSolver",
+    )
+
+
+def follow_cbc_log(path: str, maximize: bool, report, stop: threading.Event):
+    """Čte přibývající výpis CBC a hlásí průběh, dokud není nastaveno `stop`.
+
+    CBC zapisuje výpis do souboru po blocích, hlášení proto chodí
+    s určitým zpožděním.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        pending = ""
+        while True:
+            finished = stop.wait(CBC_LOG_POLL_INTERVAL)
+            pending += f.read()
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                progress = cbc_progress(line, maximize)
+                if progress is not None:
+                    report(progress)
+            if finished:
+                break
+
+
+def has_violated_empty_row(problem: LPProblem) -> bool:
+    """Zda problém obsahuje řádek bez koeficientů, který 0 nesplňuje.
+
+    CBC takový řádek nehlásí jako nepřípustnost, ale skončí stavem
+    "Stopped"; spor se proto pozná ještě před řešením.
+    """
+    empty = np.diff(problem.matrix.indptr) == 0
+    return bool(np.any(empty & unsatisfied_by_zero(problem.rel, problem.rhs)))
 
 
 class PuLPSolver(AbstractLPSolver):
     """Implementace řešiče pomocí PuLP knihovny"""
 
-    def solve(self, problem: LPProblem) -> SolverResult:
+    # Nastaví interrupt(); výsledek bez konečného stavu je pak "Cancelled"
+    _interrupted = False
+
+    def interrupt(self):
+        # CBC samotný přeruší SIGINT, který ProcessSolver posílá celé
+        # skupině procesů; zde se jen zaznamená, že řešení skončilo předčasně
+        self._interrupted = True
+
+    @staticmethod
+    def _confirm_infeasible(model, options: SolverOptions, elapsed: float, pulp):
+        """Rozliší nepřípustný a neomezený problém (vrací stav výsledku).
+
+        CBC hlásí jako nepřípustné i některé neomezené problémy (i bez
+        presolve). Model se proto ve zbývajícím čase vyřeší znovu s nulovou
+        účelovou funkcí; je-li přípustný, je původní problém neomezený.
+        Nulové koeficienty musí zůstat u všech proměnných, jinak PuLP
+        vynechá v MPS sloupce proměnných mimo omezení. Kontrola nezapisuje
+        výpis, ten patří prvnímu řešení (čtou se z něj čítače a průběh).
+        """
+        time_limit = None
+        if options.time_limit is not None:
+            time_limit = options.time_limit - elapsed
+            if time_limit <= 0:
+                return "Not Solved"
+        objective = model.objective
+        model.setObjective(
+            pulp.LpAffineExpression((var, 0.0) for var in model.variables())
+        )
+        try:
+            status = model.solve(
+                pulp.PULP_CBC_CMD(
+                    timeLimit=time_limit, msg=False, threads=options.threads
+                )
+            )
+        finally:
+            model.setObjective(objective)
+        if status == pulp.LpStatusOptimal:
+            return "Unbounded"
+        if status == pulp.LpStatusInfeasible:
+            return "Infeasible"
+        return "Not Solved"
+
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        timer = PhaseTimer()
         try:
             import pulp
         except ImportError:
@@ -21,50 +182,136 @@ class PuLPSolver(AbstractLPSolver):
                 error_message="PuLP není nainstalováno. Spusťte: pip install pulp",
             )
 
-        start_time = time.time()
+        timer.lap("import_time")
+        options = options or SolverOptions()
+        self._interrupted = False
+        if has_violated_empty_row(problem):
+            timer.lap("build_time")
+            return SolverResult(
+                status="Infeasible",
+                objective_value=None,
+                variable_values={},
+                solve_time=timer.elapsed,
+                timings=timer.timings,
+                model_stats=ModelStats.from_problem(problem),
+            )
+        # Výpis CBC jde do souboru, ze kterého se po řešení přečtou čítače
+        # (a při hlášení průběhu se čte už během řešení)
+        fd, log_path = tempfile.mkstemp(prefix="cbc-", suffix=".log")
+        os.close(fd)
+        follower = None
 
         try:
-            sense = (
-                pulp.LpMinimize
-                if problem.objective.sense == "Minimalizovat"
-                else pulp.LpMaximize
-            )
+            sense = pulp.LpMaximize if problem.maximize else pulp.LpMinimize
 
             model = pulp.LpProblem("GUI_LP_Model", sense)
 
-            var_dict = {}
-            for v in problem.variables:
-                var_dict[v.name] = pulp.LpVariable(
-                    v.name, lowBound=v.low, upBound=v.up, cat=v.vtype
+            # Meze ±inf odpovídají v PuLP hodnotě None
+            var_list = [
+                pulp.LpVariable(
+                    name,
+                    lowBound=lo if math.isfinite(lo) else None,
+                    upBound=up if math.isfinite(up) else None,
+                    cat="Integer" if is_int else "Continuous",
                 )
+                for name, lo, up, is_int in zip(
+                    problem.names,
+                    problem.lower.tolist(),
+                    problem.upper.tolist(),
+                    problem.integer.tolist(),
+                )
+            ]
+            var_dict = dict(zip(problem.names, var_list))
 
-            model += pulp.lpSum(
-                problem.objective.coeffs[i] * var_dict[problem.variables[i].name]
-                for i in range(len(problem.variables))
+            # Účelová funkce obsahuje všechny proměnné (i s nulovým koeficientem),
+            # aby byly v modelu zaregistrované i proměnné mimo omezení
+            model += pulp.LpAffineExpression(
+                zip(var_list, problem.obj_coeffs.tolist())
             )
 
-            for c in problem.constraints:
-                lhs = pulp.lpSum(
-                    c.coeffs[i] * var_dict[problem.variables[i].name]
-                    for i in range(len(problem.variables))
+            # Výrazy omezení se skládají přímo z polí indexů a hodnot nenulových
+            # prvků CSR řádku a do modelu se vloží najednou
+            senses = {
+                REL_LE: pulp.LpConstraintLE,
+                REL_GE: pulp.LpConstraintGE,
+                REL_EQ: pulp.LpConstraintEQ,
+            }
+            indptr = problem.matrix.indptr.tolist()
+            indices = problem.matrix.indices.tolist()
+            data = problem.matrix.data.tolist()
+            constraints = {}
+            for r, (rel, rhs) in enumerate(
+                zip(problem.rel.tolist(), problem.rhs.tolist())
+            ):
+                start, end = indptr[r], indptr[r + 1]
+                expr = pulp.LpAffineExpression(
+                    zip(map(var_list.__getitem__, indices[start:end]), data[start:end])
                 )
-                if c.rel == "≤":
-                    model += lhs <= c.rhs
-                elif c.rel == "≥":
-                    model += lhs >= c.rhs
-                else:
-                    model += lhs == c.rhs
+                name = f"_C{r + 1}"
+                constraints[name] = pulp.LpConstraint(expr, senses[rel], name, rhs)
+            model.extend(constraints)
 
-            status = model.solve()
-            solve_time = time.time() - start_time
+            timer.lap("build_time")
 
+            if self._progress_callback is not None:
+                stop_following = threading.Event()
+                follower = threading.Thread(
+                    target=follow_cbc_log,
+                    args=(
+                        log_path,
+                        problem.maximize,
+                        self._report_progress,
+                        stop_following,
+                    ),
+                    daemon=True,
+                )
+                follower.start()
+            status = model.solve(
+                pulp.PULP_CBC_CMD(
+                    timeLimit=options.time_limit,
+                    msg=False,
+                    logPath=log_path,
+                    threads=options.threads,
+                    gapRel=options.mip_gap,
+                    # None = výchozí presolve CBC (zapnutý)
+                    presolve=None if options.native_presolve else False,
+                    options=CBC_ALGORITHM_OPTIONS.get(options.algorithm, []),
+                )
+            )
+            status_str = pulp.LpStatus[status]
+            incumbent = model.sol_status == pulp.LpSolutionIntegerFeasible
+            # Výsledek prvního řešení se uloží dřív, než ho kontrola přepíše
             variable_values = {name: var.value() for name, var in var_dict.items()}
+            objective_value = pulp.value(model.objective)
+            if status_str == "Infeasible":
+                status_str = self._confirm_infeasible(
+                    model, options, timer.elapsed, pulp
+                )
+            timer.lap("native_time")
+            with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+                counters = cbc_counters(f.read())
+            if status_str in ("Infeasible", "Unbounded"):
+                # CBC vrací i v tomto případě hodnoty z posledního bodu
+                variable_values, objective_value = {}, None
+
+            if incumbent or status_str == "Not Solved":
+                # CBC skončil předčasně, případně s nejlepším nalezeným řešením
+                if self._interrupted:
+                    status_str = "Cancelled"
+                elif options.time_limit is not None:
+                    status_str = "TimeLimit"
+                elif incumbent:
+                    status_str = "Feasible"
 
+            timer.lap("extract_time")
             return SolverResult(
-                status=pulp.LpStatus[status],
-                objective_value=pulp.value(model.objective),
+                status=status_str,
+                objective_value=objective_value,
                 variable_values=variable_values,
-                solve_time=solve_time,
+                solve_time=timer.elapsed,
+                timings=timer.timings,
+                model_stats=ModelStats.from_problem(problem),
+                counters=counters,
             )
 
         except Exception as e:
@@ -72,6 +319,12 @@ class PuLPSolver(AbstractLPSolver):
                 status="Error",
                 objective_value=None,
                 variable_values={},
-                solve_time=time.time() - start_time,
+                solve_time=timer.elapsed,
                 error_message=str(e),
+                timings=timer.timings,
             )
+        finally:
+            if follower is not None:
+                stop_following.set()
+                follower.join()
+            os.remove(log_path)
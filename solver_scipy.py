@@ -1,12 +1,40 @@
-import time
-from solver_base import AbstractLPSolver
-from models import LPProblem, SolverResult
+from typing import Optional
+from solver_base import AbstractLPSolver, PhaseTimer
+from models import (
+    LPProblem,
+    SolverResult,
+    SolverOptions,
+    ModelStats,
+    ALGORITHM_SIMPLEX,
+    ALGORITHM_BARRIER,
+    SolverCounters,
+    REL_GE,
+    REL_EQ,
+)
+
+
+# Stavy linprog (mimo úspěšné řešení) -> stav výsledku, ostatní = chyba
+LINPROG_STATUSES = {1: "TimeLimit", 2: "Infeasible", 3: "Unbounded"}
+# Metoda linprog (HiGHS) podle zvoleného algoritmu
+HIGHS_METHODS = {
+    ALGORITHM_SIMPLEX: "highs-ds",
+    ALGORITHM_BARRIER: "highs-ipm",
+}
 
 
 class SciPySolver(AbstractLPSolver):
-    """Implementace pomocí scipy.optimize.linprog"""
+    """Implementace pomocí scipy.optimize.linprog
+
+    Rozhraní linprog nenabízí počet vláken HiGHS a řeší jen LP, nastavení
+    threads a mip_gap se proto neuplatní.
+    """
+
+    supports_integers = False
 
-    def solve(self, problem: LPProblem) -> SolverResult:
+    def solve(
+        self, problem: LPProblem, options: Optional[SolverOptions] = None
+    ) -> SolverResult:
+        timer = PhaseTimer()
         try:
             import numpy as np
             from scipy.optimize import linprog
@@ -18,56 +46,73 @@ class SciPySolver(AbstractLPSolver):
                 error_message="SciPy není nainstalováno. Spusťte: pip install scipy",
             )
 
-        start_time = time.time()
+        timer.lap("import_time")
+        options = options or SolverOptions()
 
         try:
-            c = np.array(problem.objective.coeffs)
-            if problem.objective.sense == "Maximalizovat":
+            c = problem.obj_coeffs.copy()
+            if problem.maximize:
                 c = -c
 
-            A_ub = []
-            b_ub = []
-            A_eq = []
-            b_eq = []
+            # Rozdělení řádků podle relací jedním průchodem přes masky;
+            # řádky "≥" se převedou na "≤" vynásobením -1
+            A = problem.matrix.to_scipy()
+            is_ge = problem.rel == REL_GE
+            ub_rows = np.flatnonzero(problem.rel != REL_EQ)
+            eq_rows = np.flatnonzero(problem.rel == REL_EQ)
 
-            for constraint in problem.constraints:
-                if constraint.rel == "≤":
-                    A_ub.append(constraint.coeffs)
-                    b_ub.append(constraint.rhs)
-                elif constraint.rel == "≥":
-                    A_ub.append([-x for x in constraint.coeffs])
-                    b_ub.append(-constraint.rhs)
-                else:
-                    A_eq.append(constraint.coeffs)
-                    b_eq.append(constraint.rhs)
+            sign = np.where(is_ge[ub_rows], -1.0, 1.0)
+            A_ub = A[ub_rows]
+            A_ub.data *= np.repeat(sign, np.diff(A_ub.indptr))
+            b_ub = problem.rhs[ub_rows] * sign
 
-            bounds = [(v.low, v.up) for v in problem.variables]
+            A_eq = A[eq_rows]
+            b_eq = problem.rhs[eq_rows]
+
+            # linprog přijímá chybějící meze přímo jako ±inf
+            bounds = np.column_stack((problem.lower, problem.upper))
+            timer.lap("build_time")
 
             result = linprog(
                 c=c,
-                A_ub=A_ub if A_ub else None,
-                b_ub=b_ub if b_ub else None,
-                A_eq=A_eq if A_eq else None,
-                b_eq=b_eq if b_eq else None,
+                A_ub=A_ub if len(ub_rows) else None,
+                b_ub=b_ub if len(ub_rows) else None,
+                A_eq=A_eq if len(eq_rows) else None,
+                b_eq=b_eq if len(eq_rows) else None,
                 bounds=bounds,
-                method="highs",
+                method=HIGHS_METHODS.get(options.algorithm, "highs"),
+                options=self._highs_options(options),
             )
 
-            solve_time = time.time() - start_time
+            timer.lap("native_time")
 
             obj_value = result.fun
-            if problem.objective.sense == "Maximalizovat":
+            if problem.maximize and obj_value is not None:
                 obj_value = -obj_value
 
-            variable_values = {
-                v.name: result.x[i] for i, v in enumerate(problem.variables)
-            }
+            variable_values = (
+                dict(zip(problem.names, result.x.tolist()))
+                if result.x is not None
+                else {}
+            )
+
+            # linprog status: 1 = limit iterací nebo času, 2 = nepřípustný,
+            # 3 = neomezený, 4 = numerické potíže
+            if result.success:
+                status = "Optimal"
+            else:
+                status = LINPROG_STATUSES.get(result.status, "Error")
 
+            timer.lap("extract_time")
             return SolverResult(
-                status="Optimal" if result.success else "Infeasible",
-                objective_value=obj_value if result.success else None,
+                status=status,
+                objective_value=obj_value if result.x is not None else None,
                 variable_values=variable_values,
-                solve_time=solve_time,
+                solve_time=timer.elapsed,
+                error_message=result.message if status == "Error" else None,
+                timings=timer.timings,
+                model_stats=ModelStats.from_problem(problem),
+                counters=SolverCounters(iterations=int(result.nit)),
             )
 
         except Exception as e:
@@ -75,6 +120,16 @@ class SciPySolver(AbstractLPSolver):
                 status="Error",
                 objective_value=None,
                 variable_values={},
-                solve_time=time.time() - start_time,
+                solve_time=timer.elapsed,
                 error_message=str(e),
+                timings=timer.timings,
             )
+
+    @staticmethod
+    def _highs_options(options: SolverOptions) -> Optional[dict]:
+        highs = {}
+        if options.time_limit is not None:
+            highs["time_limit"] = options.time_limit
+        if not options.native_presolve:
+            highs["presolve"] = False
+        return highs or None
@@ -1,25 +1,80 @@
+import threading
+import time
+from dataclasses import replace
 from PySide6.QtCore import QThread, Signal
-from models import LPProblem, SolverResult
+from models import LPProblem, SolverResult, SolverOptions, SolveProgress
 from solver_base import AbstractLPSolver
 from solver_pulp import PuLPSolver
 
 
 class SolverThread(QThread):
-    """Thread pro asynchronní řešení LP problému"""
+    """Thread pro asynchronní řešení LP problému.
+
+    Průběh hlášený řešičem (SolveProgress) se slučuje do jednoho stavu,
+    který si GUI vyzvedává metodou latest_progress() vlastním časovačem;
+    rychlost aktualizací tak neurčuje řešič, ale GUI.
+    """
 
     finished = Signal(SolverResult)
     error = Signal(str)
     progress = Signal(str)
 
-    def __init__(self, problem: LPProblem, solver: AbstractLPSolver = None):
+    def __init__(
+        self,
+        problem: LPProblem,
+        solver: AbstractLPSolver = None,
+        options: SolverOptions = None,
+        profile_dir: str = None,
+    ):
+        """`profile_dir` zapne profilování řešení (profily se uloží do adresáře)"""
         super().__init__()
         self.problem = problem
         self.solver = solver if solver is not None else PuLPSolver()
+        if profile_dir is not None:
+            self.solver = self.solver.profiled(profile_dir)
+        self.options = options
+        self.profile_dir = profile_dir
+        self._cancelled = False
+        self._progress_lock = threading.Lock()
+        self._progress = SolveProgress()
+        self._start_time = None
+        self.solver.set_progress_callback(self._on_solver_progress)
+
+    def cancel(self):
+        """Zruší řešení; po zrušení už thread nevyšle žádný výsledek"""
+        self._cancelled = True
+        self.solver.cancel()
+
+    def interrupt(self):
+        """Ukončí řešení předčasně; thread vyšle nejlepší nalezené řešení"""
+        self.solver.interrupt()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def _on_solver_progress(self, progress: SolveProgress):
+        with self._progress_lock:
+            self._progress = self._progress.merged(progress)
+
+    def latest_progress(self) -> SolveProgress:
+        """Poslední známý stav řešení; `elapsed` je doba od spuštění threadu"""
+        with self._progress_lock:
+            progress = self._progress
+        if self._start_time is None:
+            return progress
+        return replace(progress, elapsed=time.perf_counter() - self._start_time)
 
     def run(self):
+        self._start_time = time.perf_counter()
         try:
-            self.progress.emit("Řešení probíhá...")
-            result = self.solver.solve(self.problem)
-            self.finished.emit(result)
+            self.progress.emit(
+                "Profilování probíhá..."
+                if self.profile_dir is not None
+                else "Řešení probíhá..."
+            )
+            result = self.solver.solve(self.problem, self.options)
+            if not self._cancelled:
+                self.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            if not self._cancelled:
+                self.error.emit(str(e))
@@ -0,0 +1,609 @@
+"""
+Modely tabulek pro LPWindow postavené na polích NumPy.
+
+Místo QTableWidget s jednou položkou (a případně jedním QComboBoxem) na buňku
+drží data tabulek přímo pole problému a QTableView si je čte jen pro viditelné
+buňky. Výběr relace a typu proměnné obstarává delegát, který vytvoří editor
+až při úpravě buňky.
+
+Matice omezení je uložená řídce (CSRMatrix) a úpravy z GUI se do ní
+slučují až při sestavení problému. LPProblem se tak z tabulek sestaví bez
+kopírování polí; aby úpravy během běžícího řešení nezměnily data řešiče,
+modely po předání polí při další úpravě pole nejprve zkopírují.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QStyledItemDelegate, QComboBox
+
+from models import LPProblem, CSRMatrix, RELATIONS, REL_LE
+
+TYPE_LABELS = ("Reálné", "Celočíselné")
+
+ERROR_COLOR = QColor(Qt.red)
+
+
+@dataclass
+class CellError:
+    """Chyba vstupu v konkrétní buňce tabulky"""
+    model: "ArrayTableModel"
+    row: int
+    col: int
+    message: str
+
+
+def format_number(value: float) -> str:
+    """Text buňky pro číselnou hodnotu (nekonečno = prázdná buňka)"""
+    if math.isinf(value):
+        return ""
+    return f"{value:.15g}"
+
+
+def parse_number(text: str, empty: float) -> float:
+    """Převede text buňky na číslo; prázdný text dává `empty`, chyba NaN"""
+    text = text.strip()
+    if not text:
+        return empty
+    try:
+        value = float(text.replace(",", "."))
+    except ValueError:
+        return math.nan
+    return math.nan if math.isnan(value) else value
+
+
+class ArrayTableModel(QAbstractTableModel):
+    """Společný základ modelů tabulek nad poli NumPy.
+
+    Neplatný text se v poli uloží jako NaN a jeho původní znění se drží
+    zvlášť, aby ho uživatel v buňce dál viděl a mohl opravit.
+    """
+
+    # Atributy s poli, která se při úpravě sdílených dat zkopírují
+    _array_attrs: Tuple[str, ...] = ()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._shared = False
+        self._invalid: Dict[Tuple[int, int], str] = {}
+        self._errors = set()
+
+    # ========== SDÍLENÍ DAT S ŘEŠIČEM ==========
+    def mark_shared(self):
+        """Pole byla předána problému - další úprava je nejprve zkopíruje"""
+        self._shared = True
+
+    def _detach(self):
+        if not self._shared:
+            return
+        for attr in self._array_attrs:
+            value = getattr(self, attr)
+            copy = list(value) if isinstance(value, list) else value.copy()
+            setattr(self, attr, copy)
+        self._shared = False
+
+    # ========== CHYBY ==========
+    def set_errors(self, cells):
+        """Zvýrazní chybné buňky; překreslí jen buňky, jejichž stav se změnil"""
+        cells = set(cells)
+        changed = cells ^ self._errors
+        self._errors = cells
+        if not changed:
+            return
+        # Jeden signál pro obdélník změněných buněk; pohled z něj
+        # překreslí jen viditelnou část
+        rows = [r for r, _ in changed]
+        cols = [c for _, c in changed]
+        self.dataChanged.emit(
+            self.index(min(rows), min(cols)),
+            self.index(max(rows), max(cols)),
+            [Qt.BackgroundRole],
+        )
+
+    # ========== QAbstractTableModel ==========
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cell = (index.row(), index.column())
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if cell in self._invalid:
+                return self._invalid[cell]
+            return self.cell_text(*cell)
+        if role == Qt.BackgroundRole and cell in self._errors:
+            return ERROR_COLOR
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._detach()
+        cell = (index.row(), index.column())
+        text = str(value)
+        if self.set_cell(*cell, text):
+            self._invalid.pop(cell, None)
+        else:
+            self._invalid[cell] = text
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.column_label(section)
+        return str(section + 1)
+
+    # ========== PRO PODTŘÍDY ==========
+    def check(self) -> List[CellError]:
+        """Chybné buňky zjištěné hromadně nad celými sloupci polí"""
+        return []
+
+    def cell_text(self, row: int, col: int) -> str:
+        raise NotImplementedError
+
+    def set_cell(self, row: int, col: int, text: str) -> bool:
+        """Uloží text do pole; vrací False, pokud text není platný"""
+        raise NotImplementedError
+
+    def column_label(self, col: int) -> str:
+        return f"x{col + 1}"
+
+    def _set_float(self, array: np.ndarray, i: int, text: str, empty: float) -> bool:
+        array[i] = parse_number(text, empty)
+        return not math.isnan(array[i])
+
+    def _remap_cells(self, mapping):
+        """Přečísluje neplatné a chybné buňky po vložení/odebrání řádků či
+        sloupců; `mapping` vrací novou pozici buňky nebo None (buňka zanikla)"""
+        invalid = {}
+        for cell, text in self._invalid.items():
+            new = mapping(*cell)
+            if new is not None:
+                invalid[new] = text
+        self._invalid = invalid
+        errors = (mapping(*cell) for cell in self._errors)
+        self._errors = {cell for cell in errors if cell is not None}
+
+    def _reset_cells(self):
+        self._invalid = {}
+        self._errors = set()
+
+
+def _grow(buffer: np.ndarray, old: int, size: int, fill) -> np.ndarray:
+    """Zajistí v bufferu místo pro `size` prvků a nové prvky vyplní `fill`.
+
+    Kapacita roste geometricky, opakované přidávání je tak amortizovaně O(1).
+    """
+    if size > len(buffer):
+        grown = np.empty(max(size, 2 * len(buffer), 16), dtype=buffer.dtype)
+        grown[:old] = buffer[:old]
+        buffer = grown
+    buffer[old:size] = fill
+    return buffer
+
+
+class VariablesModel(ArrayTableModel):
+    """Tabulka proměnných: název, dolní mez, horní mez, typ"""
+
+    HEADERS = ["Název", "Dolní mez", "Horní mez", "Typ"]
+    TYPE_COLUMN = 3
+
+    # Názvy se do LPProblem kopírují, sdílí se jen pole mezí a typů
+    _array_attrs = ("_lower", "_upper", "_integer")
+
+    def __init__(self, n_vars: int = 0, parent=None):
+        super().__init__(parent)
+        self.names: List[str] = []
+        self._lower = np.zeros(0, dtype=np.float64)
+        self._upper = np.zeros(0, dtype=np.float64)
+        self._integer = np.zeros(0, dtype=bool)
+        self.resize(n_vars)
+
+    @property
+    def lower(self) -> np.ndarray:
+        return self._lower[: len(self.names)]
+
+    @property
+    def upper(self) -> np.ndarray:
+        return self._upper[: len(self.names)]
+
+    @property
+    def integer(self) -> np.ndarray:
+        return self._integer[: len(self.names)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def column_label(self, col):
+        return self.HEADERS[col]
+
+    def cell_text(self, row, col):
+        if col == 0:
+            return self.names[row]
+        if col == 1:
+            return format_number(self._lower[row])
+        if col == 2:
+            return format_number(self._upper[row])
+        return TYPE_LABELS[int(self._integer[row])]
+
+    def check(self):
+        errors = [
+            CellError(self, r, 0, f"Proměnná {r+1}: prázdné jméno")
+            for r, name in enumerate(self.names)
+            if not name
+        ]
+        for col, values, bound in ((1, self.lower, "dolní"), (2, self.upper, "horní")):
+            errors.extend(
+                CellError(self, r, col, f"Proměnná {self.names[r]}: chybná {bound} mez")
+                for r in np.flatnonzero(np.isnan(values)).tolist()
+            )
+        return errors
+
+    def set_cell(self, row, col, text):
+        if col == 0:
+            self.names[row] = text.strip()
+            return True
+        if col == 1:
+            return self._set_float(self._lower, row, text, -np.inf)
+        if col == 2:
+            return self._set_float(self._upper, row, text, np.inf)
+        self._integer[row] = text == TYPE_LABELS[1]
+        return True
+
+    def resize(self, n_vars: int):
+        """Přidá nebo odebere proměnné na konci; ostatní hodnoty zůstanou"""
+        old = len(self.names)
+        if n_vars > old:
+            # Zápis za konec pole by mohl přepsat data sdílená s řešičem
+            self._detach()
+            self.beginInsertRows(QModelIndex(), old, n_vars - 1)
+            self.names.extend(f"x{i+1}" for i in range(old, n_vars))
+            self._lower = _grow(self._lower, old, n_vars, 0.0)
+            self._upper = _grow(self._upper, old, n_vars, np.inf)
+            self._integer = _grow(self._integer, old, n_vars, False)
+            self.endInsertRows()
+        elif n_vars < old:
+            self.beginRemoveRows(QModelIndex(), n_vars, old - 1)
+            del self.names[n_vars:]
+            self._remap_cells(lambda r, c: (r, c) if r < n_vars else None)
+            self.endRemoveRows()
+
+    def set_arrays(self, names, lower, upper, integer):
+        """Hromadně nahradí obsah tabulky poli problému"""
+        self.beginResetModel()
+        self.names = list(names)
+        self._lower = np.asarray(lower, dtype=np.float64)
+        self._upper = np.asarray(upper, dtype=np.float64)
+        self._integer = np.asarray(integer, dtype=bool)
+        # Pole mohou patřit načtenému problému
+        self._shared = True
+        self._reset_cells()
+        self.endResetModel()
+
+
+class ObjectiveModel(ArrayTableModel):
+    """Tabulka účelové funkce: jeden řádek koeficientů"""
+
+    _array_attrs = ("_coeffs",)
+
+    def __init__(self, n_vars: int = 0, parent=None):
+        super().__init__(parent)
+        self._n_vars = 0
+        self._coeffs = np.zeros(0, dtype=np.float64)
+        self.resize(n_vars)
+
+    @property
+    def coeffs(self) -> np.ndarray:
+        return self._coeffs[: self._n_vars]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._n_vars
+
+    def cell_text(self, row, col):
+        return format_number(self._coeffs[col])
+
+    def check(self):
+        return [
+            CellError(self, 0, c, f"Účelová funkce: neplatný koef. u x{c+1}")
+            for c in np.flatnonzero(np.isnan(self.coeffs)).tolist()
+        ]
+
+    def set_cell(self, row, col, text):
+        return self._set_float(self._coeffs, col, text, 0.0)
+
+    def resize(self, n_vars: int):
+        old = self._n_vars
+        if n_vars > old:
+            self._detach()
+            self.beginInsertColumns(QModelIndex(), old, n_vars - 1)
+            self._coeffs = _grow(self._coeffs, old, n_vars, 0.0)
+            self._n_vars = n_vars
+            self.endInsertColumns()
+        elif n_vars < old:
+            self.beginRemoveColumns(QModelIndex(), n_vars, old - 1)
+            self._n_vars = n_vars
+            self._remap_cells(lambda r, c: (r, c) if c < n_vars else None)
+            self.endRemoveColumns()
+
+    def set_arrays(self, coeffs):
+        self.beginResetModel()
+        self._coeffs = np.asarray(coeffs, dtype=np.float64)
+        self._n_vars = len(self._coeffs)
+        self._shared = True
+        self._reset_cells()
+        self.endResetModel()
+
+
+class ConstraintsModel(ArrayTableModel):
+    """Tabulka omezení: koeficienty, relace a pravá strana.
+
+    Koeficienty jsou v řídké matici; úpravy z GUI se drží ve slovníku
+    a do matice se sloučí až metodou matrix().
+    """
+
+    _array_attrs = ("_rel", "_rhs")
+
+    def __init__(self, n_cons: int = 0, n_vars: int = 0, parent=None):
+        super().__init__(parent)
+        self._matrix = CSRMatrix.empty(0, 0)
+        self._edits: Dict[Tuple[int, int], float] = {}
+        self._rel = np.zeros(0, dtype=np.int8)
+        self._rhs = np.zeros(0, dtype=np.float64)
+        self.resize(n_cons, n_vars)
+
+    @property
+    def n_vars(self) -> int:
+        return self._matrix.n_cols
+
+    @property
+    def n_cons(self) -> int:
+        return self._matrix.n_rows
+
+    @property
+    def rel(self) -> np.ndarray:
+        return self._rel[: self.n_cons]
+
+    @property
+    def rhs(self) -> np.ndarray:
+        return self._rhs[: self.n_cons]
+
+    @property
+    def rel_column(self) -> int:
+        return self.n_vars
+
+    @property
+    def rhs_column(self) -> int:
+        return self.n_vars + 1
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.n_cons
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.n_vars + 2
+
+    def column_label(self, col):
+        if col == self.rel_column:
+            return "Relace"
+        if col == self.rhs_column:
+            return "Pravá strana"
+        return super().column_label(col)
+
+    def coefficient(self, row: int, col: int) -> float:
+        value = self._edits.get((row, col))
+        if value is not None:
+            return value
+        indices, data = self._matrix.row(row)
+        k = np.searchsorted(indices, col)
+        if k < len(indices) and indices[k] == col:
+            return float(data[k])
+        return 0.0
+
+    def cell_text(self, row, col):
+        if col == self.rel_column:
+            return RELATIONS[self._rel[row]]
+        if col == self.rhs_column:
+            return format_number(self._rhs[row])
+        return format_number(self.coefficient(row, col))
+
+    def check(self):
+        # Neplatné koeficienty mohou být jen mezi úpravami z GUI
+        errors = [
+            CellError(self, r, c, f"Omezení {r+1}: neplatný koef. u x{c+1}")
+            for (r, c), value in self._edits.items()
+            if math.isnan(value)
+        ]
+        rhs_column = self.rhs_column
+        errors.extend(
+            CellError(self, r, rhs_column, f"Omezení {r+1}: neplatná pravá strana")
+            for r in np.flatnonzero(np.isnan(self.rhs)).tolist()
+        )
+        errors.sort(key=lambda e: (e.row, e.col))
+        return errors
+
+    def set_cell(self, row, col, text):
+        if col == self.rel_column:
+            self._rel[row] = RELATIONS.index(text)
+            return True
+        if col == self.rhs_column:
+            return self._set_float(self._rhs, row, text, 0.0)
+        value = parse_number(text, 0.0)
+        self._edits[(row, col)] = value
+        return not math.isnan(value)
+
+    def matrix(self) -> CSRMatrix:
+        """Matice koeficientů se sloučenými úpravami z GUI"""
+        valid = {
+            cell: value for cell, value in self._edits.items() if not math.isnan(value)
+        }
+        if not valid:
+            return self._matrix
+
+        n_rows, n_cols = self._matrix.shape
+        cells = np.array(list(valid), dtype=np.int64)
+        values = np.fromiter(valid.values(), dtype=np.float64, count=len(valid))
+        rows = self._matrix.row_indices().astype(np.int64)
+        cols = self._matrix.indices.astype(np.int64)
+        # Upravené pozice nahrazují původní hodnoty
+        keep = ~np.isin(rows * n_cols + cols, cells[:, 0] * n_cols + cells[:, 1])
+        self._matrix = CSRMatrix.from_coo(
+            np.concatenate((rows[keep], cells[:, 0])),
+            np.concatenate((cols[keep], cells[:, 1])),
+            np.concatenate((self._matrix.data[keep], values)),
+            (n_rows, n_cols),
+        )
+        self._edits = {
+            cell: value for cell, value in self._edits.items() if math.isnan(value)
+        }
+        return self._matrix
+
+    def resize(self, n_cons: int, n_vars: int):
+        """Přidá nebo odebere omezení a proměnné na konci tabulky.
+
+        Matice se při přidání nekopíruje vůbec (sloupce) nebo jen v poli
+        indptr (řádky); stávající hodnoty zůstanou zachovány.
+        """
+        if n_vars != self.n_vars:
+            self._resize_columns(n_vars)
+        if n_cons != self.n_cons:
+            self._resize_rows(n_cons)
+
+    def _resize_columns(self, n_vars: int):
+        old = self.n_vars
+        # Sloupce relace a pravé strany se posunou za nové koeficienty
+        shift = n_vars - old
+
+        def mapping(r, c):
+            if c >= old:
+                return r, c + shift
+            return (r, c) if c < n_vars else None
+
+        if n_vars > old:
+            self.beginInsertColumns(QModelIndex(), old, n_vars - 1)
+            m = self._matrix
+            self._matrix = CSRMatrix(m.indptr, m.indices, m.data, n_vars)
+            self._remap_cells(mapping)
+            self.endInsertColumns()
+            return
+
+        self.beginRemoveColumns(QModelIndex(), n_vars, old - 1)
+        m = self.matrix()
+        keep = m.indices < n_vars
+        indptr = np.zeros(m.n_rows + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(m.row_indices()[keep], minlength=m.n_rows), out=indptr[1:]
+        )
+        self._matrix = CSRMatrix(indptr, m.indices[keep], m.data[keep], n_vars)
+        self._edits = {
+            (r, c): value for (r, c), value in self._edits.items() if c < n_vars
+        }
+        self._remap_cells(mapping)
+        self.endRemoveColumns()
+
+    def _resize_rows(self, n_cons: int):
+        old = self.n_cons
+        m = self._matrix
+        if n_cons > old:
+            self._detach()
+            self.beginInsertRows(QModelIndex(), old, n_cons - 1)
+            indptr = np.concatenate(
+                (m.indptr, np.full(n_cons - old, m.indptr[-1], dtype=np.int64))
+            )
+            self._matrix = CSRMatrix(indptr, m.indices, m.data, m.n_cols)
+            self._rel = _grow(self._rel, old, n_cons, REL_LE)
+            self._rhs = _grow(self._rhs, old, n_cons, 0.0)
+            self.endInsertRows()
+            return
+
+        self.beginRemoveRows(QModelIndex(), n_cons, old - 1)
+        end = m.indptr[n_cons]
+        self._matrix = CSRMatrix(
+            m.indptr[: n_cons + 1], m.indices[:end], m.data[:end], m.n_cols
+        )
+        self._edits = {
+            (r, c): value for (r, c), value in self._edits.items() if r < n_cons
+        }
+        self._remap_cells(lambda r, c: (r, c) if r < n_cons else None)
+        self.endRemoveRows()
+
+    def set_arrays(self, matrix: CSRMatrix, rel, rhs):
+        self.beginResetModel()
+        self._matrix = matrix
+        self._edits = {}
+        self._rel = np.asarray(rel, dtype=np.int8)
+        self._rhs = np.asarray(rhs, dtype=np.float64)
+        self._shared = True
+        self._reset_cells()
+        self.endResetModel()
+
+
+def build_problem(
+    variables: VariablesModel,
+    objective: ObjectiveModel,
+    constraints: ConstraintsModel,
+    sense: str,
+) -> Tuple[Optional[LPProblem], List[CellError]]:
+    """Jedním průchodem ověří tabulky a sestaví z nich LPProblem.
+
+    Vrací (problém, []) nebo (None, chyby). Zvýraznění chybných buněk se
+    změní jen tam, kde se stav buňky oproti minulé kontrole liší.
+    """
+    errors = []
+    for model in (variables, objective, constraints):
+        model_errors = model.check()
+        model.set_errors((e.row, e.col) for e in model_errors)
+        errors.extend(model_errors)
+    if errors:
+        return None, errors
+
+    problem = LPProblem.from_arrays(
+        names=variables.names,
+        lower=variables.lower,
+        upper=variables.upper,
+        integer=variables.integer,
+        sense=sense,
+        objective=objective.coeffs,
+        matrix=constraints.matrix(),
+        rel=constraints.rel,
+        rhs=constraints.rhs,
+    )
+    # Další úprava tabulek už nesmí změnit pole předaná řešiči
+    for model in (variables, objective, constraints):
+        model.mark_shared()
+    return problem, []
+
+
+class ComboDelegate(QStyledItemDelegate):
+    """Delegát s výběrem z pevného seznamu hodnot.
+
+    QComboBox vzniká jen pro právě upravovanou buňku, ne pro každý řádek.
+    """
+
+    def __init__(self, items, parent=None):
+        super().__init__(parent)
+        self.items = list(items)
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(self.items)
+        # Výběr se potvrdí hned, bez nutnosti opustit buňku
+        combo.activated.connect(lambda: self.commitData.emit(combo))
+        return combo
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
@@ -0,0 +1,165 @@
+"""
+Testy formátů MPS, CPLEX LP, .lpb a JSON (python -m pytest test_model_formats.py).
+"""
+
+import textwrap
+
+import numpy as np
+import pytest
+
+from binary_format import (
+    binary_to_json,
+    json_to_binary,
+    read_binary,
+    read_binary_extra,
+    write_binary,
+)
+from model_formats import read_lp, read_mps
+from models import LPProblem, CSRMatrix, REL_LE, REL_GE, REL_EQ
+from problem_io import (
+    load_problem_file,
+    load_problem_with_extra,
+    save_json,
+    save_problem_file,
+)
+
+
+def sample_problem() -> LPProblem:
+    """Volná, záporně omezená, zafixovaná i celočíselná proměnná, prázdný
+    řádek i sloupec a malý koeficient"""
+    return LPProblem.from_arrays(
+        names=["x1", "x2", "y", "z", "w"],
+        lower=[0.0, -np.inf, -2.5, 3.0, 0.0],
+        upper=[np.inf, np.inf, 4.0, 3.0, 10.0],
+        integer=[False, False, True, False, True],
+        sense="Minimalizovat",
+        objective=[1.5, -2.0, 0.0, 1.0, 0.0],
+        matrix=CSRMatrix.from_dense(
+            [
+                [1.0, 2.0, 0.0, 0.0, 0.0],
+                [0.0, -1.0, 3.25, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0],
+                [1e-7, 0.0, 0.0, 1.0, 0.0],
+            ]
+        ),
+        rel=[REL_LE, REL_GE, REL_LE, REL_EQ],
+        rhs=[4.0, -1.0, 0.0, 2.5],
+    )
+
+
+def assert_same_problem(a: LPProblem, b: LPProblem):
+    assert a.names == b.names
+    assert a.sense == b.sense
+    for name in ("lower", "upper", "integer", "obj_coeffs", "rel", "rhs"):
+        np.testing.assert_array_equal(getattr(a, name), getattr(b, name))
+    np.testing.assert_array_equal(a.matrix.to_dense(), b.matrix.to_dense())
+
+
+@pytest.mark.parametrize("ext", [".json", ".mps", ".mps.gz", ".lp", ".lp.gz", ".lpb"])
+@pytest.mark.parametrize("sense", ["Minimalizovat", "Maximalizovat"])
+def test_round_trip(tmp_path, ext, sense):
+    problem = sample_problem()
+    problem.sense = sense
+    path = str(tmp_path / f"uloha{ext}")
+    save_problem_file(path, problem)
+    assert_same_problem(load_problem_file(path), problem)
+
+
+def test_binary_without_memory_map_and_extra(tmp_path):
+    path = str(tmp_path / "uloha.lpb")
+    write_binary(path, sample_problem(), extra={"solver": "PuLP"})
+    assert_same_problem(read_binary(path, memory_map=False), sample_problem())
+    assert read_binary_extra(path) == {"solver": "PuLP"}
+
+
+def test_binary_json_conversion_keeps_extra(tmp_path):
+    src, lpb, dst = (str(tmp_path / name) for name in ("a.json", "b.lpb", "c.json"))
+    save_json(src, sample_problem(), extra={"solver": "SciPy"})
+    json_to_binary(src, lpb)
+    binary_to_json(lpb, dst)
+    problem, extra = load_problem_with_extra(dst)
+    assert_same_problem(problem, sample_problem())
+    assert extra == {"solver": "SciPy"}
+
+
+def fixed_mps_line(*fields: str) -> str:
+    """Datový řádek MPS v pevném formátu (pole od sloupců 2, 5, 15, 25, 40, 50)"""
+    line = ""
+    for start, field in zip((1, 4, 14, 24, 39, 49), fields):
+        line = line.ljust(start) + field
+    return line
+
+
+def test_fixed_mps_with_ranges(tmp_path):
+    path = tmp_path / "pevny.mps"
+    lines = [
+        "NAME          TEST",
+        "ROWS",
+        fixed_mps_line("N", "COST"),
+        fixed_mps_line("L", "LIM1"),
+        fixed_mps_line("G", "LIM2"),
+        fixed_mps_line("E", "MYEQN"),
+        "COLUMNS",
+        fixed_mps_line("", "X1", "COST", "1.0", "LIM1", "1.0"),
+        fixed_mps_line("", "X1", "LIM2", "1.0"),
+        fixed_mps_line("", "X2", "COST", "2.0", "LIM1", "1.0"),
+        fixed_mps_line("", "X2", "MYEQN", "-1.0"),
+        "RHS",
+        fixed_mps_line("", "RHS", "LIM1", "4.0", "LIM2", "1.0"),
+        fixed_mps_line("", "RHS", "MYEQN", "7.0"),
+        "RANGES",
+        fixed_mps_line("", "RNG", "LIM1", "2.5"),
+        "BOUNDS",
+        fixed_mps_line("UP", "BND", "X1", "4.0"),
+        fixed_mps_line("MI", "BND", "X2"),
+        "ENDATA",
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    problem = read_mps(str(path), fixed=True)
+    assert problem.names == ["X1", "X2"]
+    assert problem.sense == "Minimalizovat"
+    np.testing.assert_array_equal(problem.obj_coeffs, [1.0, 2.0])
+    # Omezení s rozsahem 1.5 <= X1 + X2 <= 4 se rozdělí na dvě
+    np.testing.assert_array_equal(problem.rel, [REL_GE, REL_GE, REL_EQ, REL_LE])
+    np.testing.assert_array_equal(problem.rhs, [1.5, 1.0, 7.0, 4.0])
+    np.testing.assert_array_equal(
+        problem.matrix.to_dense(), [[1, 1], [1, 0], [0, -1], [1, 1]]
+    )
+    np.testing.assert_array_equal(problem.lower, [0.0, -np.inf])
+    np.testing.assert_array_equal(problem.upper, [4.0, np.inf])
+
+
+def test_cplex_lp(tmp_path):
+    path = tmp_path / "uloha.lp"
+    path.write_text(
+        textwrap.dedent(
+            """\
+            \\ Komentář
+            Maximize
+             obj: 3 x + 2 y - z
+            Subject To
+             c1: x + y <= 4
+             c2: x + 3 y
+                 >= 2
+             c3: -2 x + z = 1
+            Bounds
+             -1 <= x <= 5
+             z free
+            General
+             y
+            End
+            """
+        )
+    )
+    problem = read_lp(str(path))
+    assert problem.names == ["x", "y", "z"]
+    assert problem.maximize
+    np.testing.assert_array_equal(problem.obj_coeffs, [3.0, 2.0, -1.0])
+    np.testing.assert_array_equal(problem.rel, [REL_LE, REL_GE, REL_EQ])
+    np.testing.assert_array_equal(problem.rhs, [4.0, 2.0, 1.0])
+    np.testing.assert_array_equal(
+        problem.matrix.to_dense(), [[1, 1, 0], [1, 3, 0], [-2, 0, 1]]
+    )
+    np.testing.assert_array_equal(problem.lower, [-1.0, 0.0, -np.inf])
+    np.testing.assert_array_equal(problem.upper, [5.0, np.inf, np.inf])
+    np.testing.assert_array_equal(problem.integer, [False, True, False])
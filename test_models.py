@@ -0,0 +1,86 @@
+"""
+Testy řídké matice CSR a polí LPProblem (python -m pytest test_models.py).
+"""
+
+import numpy as np
+
+from models import (
+    LPProblem,
+    CSRMatrix,
+    Variable,
+    Objective,
+    Constraint,
+    REL_LE,
+    REL_GE,
+    REL_EQ,
+)
+
+DENSE = np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [0.0, -3.0, 4.0]])
+
+
+def test_from_dense_keeps_only_nonzeros():
+    matrix = CSRMatrix.from_dense(DENSE)
+    assert matrix.shape == (3, 3)
+    assert matrix.nnz == 4
+    assert matrix.indptr.tolist() == [0, 2, 2, 4]
+    assert matrix.indices.tolist() == [0, 2, 1, 2]
+    assert matrix.data.tolist() == [1.0, 2.0, -3.0, 4.0]
+    assert matrix.row_indices().tolist() == [0, 0, 2, 2]
+    np.testing.assert_array_equal(matrix.to_dense(), DENSE)
+    np.testing.assert_array_equal(matrix.to_scipy().toarray(), DENSE)
+
+
+def test_from_coo_sums_duplicates_and_drops_zeros():
+    # Neseřazené trojice, dvakrát pozice (2, 2) a prvek, který se vyruší
+    matrix = CSRMatrix.from_coo(
+        rows=[2, 0, 2, 0, 2, 1, 1],
+        cols=[2, 2, 1, 0, 2, 0, 0],
+        values=[1.0, 2.0, -3.0, 1.0, 3.0, 5.0, -5.0],
+        shape=(3, 3),
+    )
+    np.testing.assert_array_equal(matrix.to_dense(), DENSE)
+    assert matrix.nnz == 4
+
+
+def test_row_returns_indices_and_values():
+    indices, values = CSRMatrix.from_dense(DENSE).row(2)
+    assert indices.tolist() == [1, 2]
+    assert values.tolist() == [-3.0, 4.0]
+
+
+def test_list_and_array_constructors_agree():
+    variables = [
+        Variable("x1", 0, 4),
+        Variable("x2", None, None, "Integer"),
+        Variable("x3", -1, None),
+    ]
+    constraints = [
+        Constraint([1.0, 0.0, 2.0], "≤", 5.0),
+        Constraint([0.0, 0.0, 0.0], "≥", 0.0),
+        Constraint([0.0, -3.0, 4.0], "=", 1.0),
+    ]
+    from_lists = LPProblem(
+        variables, Objective("Maximalizovat", [1.0, 2.0, 3.0]), constraints
+    )
+    from_arrays = LPProblem.from_arrays(
+        names=["x1", "x2", "x3"],
+        lower=[0, -np.inf, -1],
+        upper=[4, np.inf, np.inf],
+        integer=[False, True, False],
+        sense="Maximalizovat",
+        objective=[1.0, 2.0, 3.0],
+        matrix=CSRMatrix.from_dense(DENSE),
+        rel=[REL_LE, REL_GE, REL_EQ],
+        rhs=[5.0, 0.0, 1.0],
+    )
+    for name in ("lower", "upper", "integer", "obj_coeffs", "rel", "rhs"):
+        np.testing.assert_array_equal(
+            getattr(from_lists, name), getattr(from_arrays, name)
+        )
+    np.testing.assert_array_equal(
+        from_lists.matrix.to_dense(), from_arrays.matrix.to_dense()
+    )
+    # Kompatibilní pohled vrací původní seznamy
+    assert from_arrays.variables == variables
+    assert from_arrays.constraints == constraints
+    assert from_arrays.has_integers and from_arrays.maximize
@@ -0,0 +1,95 @@
+"""
+Testy parametrické analýzy proti známé křivce (python -m pytest test_parametric.py).
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from models import LPProblem, CSRMatrix, REL_LE
+from parametric import PARAM_OBJECTIVE, PARAM_RHS, run_sweep, sweep_scenarios
+
+
+def sample_problem() -> LPProblem:
+    """max x1 + x2; x1 + 2 x2 <= b (b = 4), x1 <= 3, x >= 0"""
+    return LPProblem.from_arrays(
+        names=["x1", "x2"],
+        lower=np.zeros(2),
+        upper=np.full(2, np.inf),
+        integer=np.zeros(2, dtype=bool),
+        sense="Maximalizovat",
+        objective=np.array([1.0, 1.0]),
+        matrix=CSRMatrix.from_dense([[1.0, 2.0], [1.0, 0.0]]),
+        rel=[REL_LE, REL_LE],
+        rhs=np.array([4.0, 3.0]),
+    )
+
+
+def rhs_curve(b: np.ndarray) -> np.ndarray:
+    """Optimum v závislosti na pravé straně prvního omezení (b >= 0)"""
+    return np.where(b <= 3, b, 3 + (b - 3) / 2)
+
+
+@pytest.mark.parametrize("backend", ["ortools", "scipy", "pulp"])
+def test_rhs_sweep_follows_curve(backend):
+    pytest.importorskip(backend)
+    values = np.linspace(0, 10, 11)
+    result = run_sweep(sample_problem(), PARAM_RHS, 0, values, backend, jobs=1)
+    assert result.status == ["Optimal"] * 11
+    np.testing.assert_allclose(result.objective, rhs_curve(values), atol=1e-7)
+    np.testing.assert_array_equal(result.values, values)
+    assert result.variable_values.shape == (11, 2)
+    assert result.label == "pravá strana omezení 1"
+
+
+def test_parallel_sweep_matches_sequential():
+    pytest.importorskip("ortools")
+    values = np.linspace(-2, 10, 13)
+    sequential = run_sweep(sample_problem(), PARAM_RHS, 0, values, jobs=1)
+    parallel = run_sweep(sample_problem(), PARAM_RHS, 0, values, jobs=2)
+    assert parallel.status == sequential.status
+    # Záporná pravá strana nemá řešení, hodnoty zůstanou NaN
+    assert sequential.status[:2] == ["Infeasible"] * 2
+    assert np.isnan(sequential.objective[:2]).all()
+    np.testing.assert_allclose(
+        parallel.objective, sequential.objective, atol=1e-7, equal_nan=True
+    )
+
+
+def test_objective_sweep_switches_vertex():
+    pytest.importorskip("ortools")
+    # Koeficient u x2 nad 2 přesune optimum z (3, 0.5) do (0, 2)
+    values = np.array([0.0, 1.0, 3.0])
+    result = run_sweep(sample_problem(), PARAM_OBJECTIVE, 1, values, jobs=1)
+    np.testing.assert_allclose(result.objective, [3.0, 3.5, 6.0], atol=1e-7)
+    np.testing.assert_allclose(result.variable_values[2], [0.0, 2.0], atol=1e-7)
+    assert result.label == "koeficient účelové funkce u x2"
+
+
+def test_cancelled_sweep_leaves_points_unsolved():
+    pytest.importorskip("ortools")
+    result = run_sweep(
+        sample_problem(), PARAM_RHS, 0, [1.0, 2.0], jobs=1, cancelled=lambda: True
+    )
+    assert result.status == ["Cancelled"] * 2
+    assert np.isnan(result.objective).all()
+
+
+def test_invalid_parameter_is_rejected():
+    with pytest.raises(ValueError):
+        run_sweep(sample_problem(), PARAM_RHS, 2, [1.0])
+    with pytest.raises(ValueError):
+        sweep_scenarios("lower", 0, [1.0])
+
+
+def test_sweep_csv_has_parameter_column(tmp_path):
+    pytest.importorskip("ortools")
+    path = str(tmp_path / "krivka.csv")
+    run_sweep(sample_problem(), PARAM_RHS, 0, [-1.0, 2.0], jobs=1).to_csv(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:3] == ["pravá strana omezení 1", "status", "objective"]
+    assert rows[0][4:] == ["x1", "x2"]
+    assert rows[1][:3] == ["-1.0", "Infeasible", ""]
+    assert rows[2][0] == "2.0" and float(rows[2][2]) == pytest.approx(2.0)
@@ -0,0 +1,61 @@
+"""
+Regresní testy presolve (python -m pytest test_presolve.py).
+"""
+
+import warnings
+
+import numpy as np
+
+from models import LPProblem, CSRMatrix, REL_GE, REL_EQ
+from presolve import presolve
+
+
+def make_problem(coeffs, rel, rhs, objective, integer=None, maximize=True):
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    n = coeffs.shape[1]
+    return LPProblem.from_arrays(
+        names=[f"x{j + 1}" for j in range(n)],
+        lower=np.zeros(n),
+        upper=np.full(n, np.inf),
+        integer=integer if integer is not None else np.zeros(n, dtype=bool),
+        sense="Maximalizovat" if maximize else "Minimalizovat",
+        objective=objective,
+        matrix=CSRMatrix.from_dense(coeffs),
+        rel=rel,
+        rhs=rhs,
+    )
+
+
+def test_duplicate_one_sided_rows_stay_one_sided():
+    # x1 + x2 >= 1 a 2x1 + 2x2 >= 2 se nesmí sloučit na rovnost "= inf"
+    problem = make_problem(
+        [[1, 1], [2, 2]], [REL_GE, REL_GE], [1, 2], [1, 1], maximize=False
+    )
+    reduced, _, stats = presolve(problem)
+    assert not stats.infeasible
+    assert reduced.rel.tolist() == [REL_GE]
+    assert reduced.rhs.tolist() == [1.0]
+
+
+def test_crossed_bounds_from_singleton_rows_are_infeasible():
+    # x1 = 1 a 2x1 >= 3: meze se překříží ještě před zafixováním x1
+    problem = make_problem([[1], [2]], [REL_EQ, REL_GE], [1, 3], [1])
+    _, _, stats = presolve(problem)
+    assert stats.infeasible
+
+
+def test_singleton_row_bounds_are_rounded_for_integers():
+    # 3x1 = 4 nemá celočíselné řešení
+    problem = make_problem([[3]], [REL_EQ], [4], [1], integer=[True])
+    _, _, stats = presolve(problem)
+    assert stats.infeasible
+
+
+def test_free_variables_do_not_warn():
+    # Meze -inf..inf i inf..inf nesmí v NumPy vyvolat "invalid value"
+    problem = make_problem([[1, 1]], [REL_GE], [1], [1, 1], maximize=False)
+    problem.lower[:] = [-np.inf, np.inf]
+    problem.upper[:] = [np.inf, np.inf]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        presolve(problem)
@@ -0,0 +1,101 @@
+"""
+Testy hromadného řešení scénářů (python -m pytest test_scenarios.py).
+"""
+
+import numpy as np
+import pytest
+
+from models import LPProblem, CSRMatrix, REL_LE
+from scenarios import Scenario, apply_scenario, solve_many
+from solver_base import create_solver
+
+
+def base_problem() -> LPProblem:
+    return LPProblem.from_arrays(
+        names=["x1", "x2", "x3"],
+        lower=np.zeros(3),
+        upper=np.array([4.0, 4.0, 4.0]),
+        integer=np.zeros(3, dtype=bool),
+        sense="Maximalizovat",
+        objective=np.array([3.0, 2.0, 1.0]),
+        matrix=CSRMatrix.from_dense([[1.0, 1.0, 1.0], [2.0, 1.0, 0.0]]),
+        rel=[REL_LE, REL_LE],
+        rhs=np.array([6.0, 8.0]),
+    )
+
+
+def sample_scenarios():
+    return [
+        Scenario(),
+        Scenario("rhs", rhs={0: 3.0}),
+        Scenario("meze", lower={2: 1.0}, upper=[1.0, 4.0, 4.0]),
+        Scenario("cena", objective=[1.0, 3.0, 2.0]),
+        Scenario("nelze", rhs={1: -1.0}),
+        Scenario("vše", rhs=[5.0, 7.0], upper={0: 2.0}, objective={1: 0.5}),
+    ]
+
+
+def test_apply_scenario_shares_unchanged_arrays():
+    base = base_problem()
+    problem = apply_scenario(base, Scenario(rhs={1: 5.0}))
+    assert problem.matrix is base.matrix
+    assert problem.lower is base.lower and problem.obj_coeffs is base.obj_coeffs
+    np.testing.assert_array_equal(problem.rhs, [6.0, 5.0])
+    # Základ zůstane nezměněný
+    np.testing.assert_array_equal(base.rhs, [6.0, 8.0])
+
+
+def test_apply_scenario_rejects_vector_of_wrong_length():
+    with pytest.raises(ValueError):
+        apply_scenario(base_problem(), Scenario(upper=[1.0, 2.0]))
+
+
+@pytest.mark.parametrize("backend", ["ortools", "scipy", "pulp"])
+def test_results_match_separate_solves(backend):
+    pytest.importorskip(backend)
+    base, scenarios = base_problem(), sample_scenarios()
+    calls = []
+    results = solve_many(
+        base, scenarios, backend, jobs=1,
+        progress=lambda done, total: calls.append((done, total)),
+    )
+    assert results.scenario_names == ["S1", "rhs", "meze", "cena", "nelze", "vše"]
+    assert results.names == base.names
+    assert calls == [(i + 1, 6) for i in range(6)]
+    for i, scenario in enumerate(scenarios):
+        expected = create_solver(backend).solve(apply_scenario(base, scenario))
+        assert results.status[i] == expected.status
+        if expected.objective_value is None:
+            assert np.isnan(results.objective[i])
+            assert np.isnan(results.variable_values[i]).all()
+        else:
+            assert results.objective[i] == pytest.approx(expected.objective_value)
+
+
+def test_parallel_chunks_keep_scenario_order():
+    pytest.importorskip("ortools")
+    base, scenarios = base_problem(), sample_scenarios() * 3
+    sequential = solve_many(base, scenarios, jobs=1)
+    parallel = solve_many(base, scenarios, jobs=2)
+    assert parallel.scenario_names == sequential.scenario_names
+    assert parallel.status == sequential.status
+    np.testing.assert_allclose(
+        parallel.objective, sequential.objective, atol=1e-7, equal_nan=True
+    )
+    assert parallel.wall_time > 0
+
+
+def test_cancel_between_scenarios():
+    pytest.importorskip("ortools")
+    results = solve_many(
+        base_problem(), sample_scenarios(), jobs=1,
+        cancelled=iter([False, False, True]).__next__,
+    )
+    assert results.status[2:] == ["Cancelled"] * 4
+    assert results.status[:2] == ["Optimal"] * 2
+
+
+def test_no_scenarios():
+    results = solve_many(base_problem(), [], "scipy")
+    assert len(results) == 0
+    assert results.variable_values.shape == (0, 3)
@@ -0,0 +1,157 @@
+"""
+Testy přepočtu v SolveSession proti řešení od začátku
+(python -m pytest test_solve_session.py).
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ortools")
+
+from models import LPProblem, CSRMatrix, REL_LE, REL_GE, REL_EQ  # noqa: E402
+from solve_session import SolveSession, _matrix_changes  # noqa: E402
+from solver_ortools import ORToolsSolver  # noqa: E402
+
+
+def random_problem(rng, integer=False) -> LPProblem:
+    n, m = 6, 5
+    dense = rng.integers(-3, 4, (m, n)) * (rng.random((m, n)) < 0.6)
+    upper = rng.integers(1, 6, n).astype(np.float64)
+    x0 = np.floor(rng.uniform(0, upper))
+    rel = rng.choice([REL_LE, REL_GE, REL_EQ], m, p=[0.6, 0.3, 0.1])
+    return LPProblem.from_arrays(
+        names=[f"x{j + 1}" for j in range(n)],
+        lower=np.zeros(n),
+        upper=upper,
+        integer=np.full(n, integer),
+        sense="Maximalizovat",
+        objective=rng.integers(-2, 6, n).astype(np.float64),
+        matrix=CSRMatrix.from_dense(dense),
+        rel=rel,
+        rhs=dense @ x0 + (rel == REL_LE) - (rel == REL_GE),
+    )
+
+
+def edited(problem: LPProblem, rng) -> LPProblem:
+    """Kopie problému s náhodnou úpravou; nezměněná pole zůstávají sdílená"""
+    arrays = dict(
+        names=problem.names,
+        lower=problem.lower,
+        upper=problem.upper,
+        integer=problem.integer,
+        sense=problem.sense,
+        objective=problem.obj_coeffs,
+        matrix=problem.matrix,
+        rel=problem.rel,
+        rhs=problem.rhs,
+    )
+    kind = rng.integers(6)
+    if kind == 0:
+        arrays["upper"] = problem.upper + rng.integers(-1, 2, problem.n_vars)
+        arrays["upper"] = np.maximum(arrays["upper"], 0)
+    elif kind == 1:
+        arrays["objective"] = rng.integers(-2, 6, problem.n_vars).astype(np.float64)
+    elif kind == 2:
+        # Změna hodnot i struktury matice (nové i odebrané prvky)
+        dense = problem.matrix.to_dense()
+        r, j = rng.integers(problem.n_cons), rng.integers(problem.n_vars)
+        dense[r, j] = 0.0 if dense[r, j] else float(rng.integers(1, 4))
+        dense[rng.integers(problem.n_cons), rng.integers(problem.n_vars)] += 1.0
+        arrays["matrix"] = CSRMatrix.from_dense(dense)
+    elif kind == 3:
+        arrays["rhs"] = problem.rhs + rng.integers(-2, 3, problem.n_cons)
+    elif kind == 4:
+        rel = problem.rel.copy()
+        rel[rng.integers(problem.n_cons)] = rng.choice([REL_LE, REL_GE])
+        arrays["rel"] = rel
+    else:
+        arrays["sense"] = (
+            "Minimalizovat" if problem.maximize else "Maximalizovat"
+        )
+    return LPProblem.from_arrays(**arrays)
+
+
+def test_matrix_changes_turn_old_matrix_into_new():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        old = CSRMatrix.from_dense(
+            rng.integers(-2, 3, (4, 5)) * (rng.random((4, 5)) < 0.5)
+        )
+        new = CSRMatrix.from_dense(
+            rng.integers(-2, 3, (4, 5)) * (rng.random((4, 5)) < 0.5)
+        )
+        a = LPProblem.from_arrays(
+            [f"x{j}" for j in range(5)], np.zeros(5), np.ones(5),
+            np.zeros(5, bool), "Maximalizovat", np.zeros(5), old,
+            np.zeros(4), np.zeros(4),
+        )
+        b = LPProblem.from_arrays(
+            a.names, a.lower, a.upper, a.integer, a.sense, a.obj_coeffs, new,
+            a.rel, a.rhs,
+        )
+        dense = old.to_dense()
+        rows, cols, vals = _matrix_changes(a, b)
+        dense[rows, cols] = vals
+        np.testing.assert_array_equal(dense, new.to_dense())
+
+
+@pytest.mark.parametrize("integer", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_solves_match_fresh_solves(seed, integer):
+    rng = np.random.default_rng(seed)
+    session = SolveSession()
+    problem = random_problem(rng, integer)
+    first = session.solve(problem)
+    assert first.session_changes is None
+    for _ in range(15):
+        problem = edited(problem, rng)
+        result = session.solve(problem)
+        fresh = ORToolsSolver().solve(problem)
+        if not integer:
+            # U MIP se po změně mezí celočíselné proměnné model sestaví znovu
+            assert result.session_changes is not None
+        assert result.status == fresh.status
+        if fresh.objective_value is not None:
+            assert result.objective_value == pytest.approx(fresh.objective_value)
+
+
+def test_changed_dimensions_rebuild_model():
+    rng = np.random.default_rng(1)
+    session = SolveSession()
+    session.solve(random_problem(rng))
+    problem = random_problem(rng)
+    smaller = LPProblem.from_arrays(
+        names=problem.names,
+        lower=problem.lower,
+        upper=problem.upper,
+        integer=problem.integer,
+        sense=problem.sense,
+        objective=problem.obj_coeffs,
+        matrix=CSRMatrix.from_dense(problem.matrix.to_dense()[:3]),
+        rel=problem.rel[:3],
+        rhs=problem.rhs[:3],
+    )
+    result = session.solve(smaller)
+    assert result.session_changes is None
+    assert result.objective_value == pytest.approx(
+        ORToolsSolver().solve(smaller).objective_value
+    )
+
+
+def test_binary_bound_change_rebuilds_mip():
+    # SCIP si proměnnou s mezemi 0..1 převede na binární a pozdější
+    # zvýšení horní meze by odmítl
+    rng = np.random.default_rng(2)
+    problem = random_problem(rng, integer=True)
+    binary = LPProblem.from_arrays(
+        problem.names, problem.lower, np.minimum(problem.upper, 1.0),
+        problem.integer, problem.sense, problem.obj_coeffs, problem.matrix,
+        problem.rel, np.abs(problem.rhs),
+    )
+    session = SolveSession()
+    session.solve(binary)
+    result = session.solve(problem)
+    assert result.session_changes is None
+    fresh = ORToolsSolver().solve(problem)
+    assert result.status == fresh.status
+    assert result.objective_value == pytest.approx(fresh.objective_value)
@@ -0,0 +1,166 @@
+"""
+Testy automatické volby řešiče a souboru historie
+(python -m pytest test_solver_auto.py).
+"""
+
+import json
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import solver_auto
+from batch_solve import run_batch
+from models import LPProblem, CSRMatrix, REL_LE
+from solver_auto import (
+    EXPLORE_EVERY,
+    FAILURE_PENALTY,
+    HISTORY_WINDOW,
+    ProblemFeatures,
+    SolveHistory,
+    _file_lock,
+    choose_backend,
+    expected_times,
+)
+
+LP = ProblemFeatures(
+    rows=100, cols=100, nonzeros=20, integers=0, free_vars=0, boxed_vars=3
+)
+MIP = ProblemFeatures(
+    rows=100, cols=100, nonzeros=20, integers=4, free_vars=0, boxed_vars=3
+)
+LARGE_LP = ProblemFeatures(
+    rows=500, cols=500, nonzeros=5000, integers=0, free_vars=0, boxed_vars=0
+)
+
+
+def records(problem_class, backend, times, status="Optimal"):
+    return [
+        {"class": problem_class, "backend": backend, "status": status, "solve_time": t}
+        for t in times
+    ]
+
+
+def test_problem_class():
+    assert LP.problem_class == "lp/1e1/sparse/mixed"
+    assert LP.class_levels == ["lp/1e1/sparse/mixed", "lp/1e1", "lp"]
+    problem = LPProblem.from_arrays(
+        names=["x1", "x2"],
+        lower=[0.0, -np.inf],
+        upper=[1.0, np.inf],
+        integer=[True, False],
+        sense="Maximalizovat",
+        objective=[1.0, 1.0],
+        matrix=CSRMatrix.from_dense([[1.0, 1.0]]),
+        rel=[REL_LE],
+        rhs=[1.0],
+    )
+    assert ProblemFeatures.from_problem(problem).problem_class == "mip/1e0/dense/free"
+
+
+def test_expected_times_uses_recent_window_and_penalties():
+    history = (
+        records("lp/1e1/sparse/mixed", "pulp", [100.0] * 5 + [1.0] * HISTORY_WINDOW)
+        + records("lp/1e1/dense/boxed", "scipy", [2.0, 2.0])
+        + records("lp/1e1/sparse/mixed", "scipy", [1.0], status="TimeLimit")
+        + records("lp/1e1/sparse/mixed", "ortools", [0.1], status="Error")
+        # Třída lp/1e10 nesmí spadnout do lp/1e1
+        + records("lp/1e10/sparse/mixed", "ortools", [0.1, 0.1])
+    )
+    times = expected_times(history, "lp/1e1", ["pulp", "scipy", "ortools"])
+    assert times["pulp"] == (1.0, 5 + HISTORY_WINDOW)
+    assert times["scipy"] == (2.0, 3)
+    assert times["ortools"] == (float("inf"), 1)
+    exact = expected_times(history, "lp/1e1/sparse/mixed", ["scipy"])
+    assert exact["scipy"] == (FAILURE_PENALTY, 1)
+
+
+def test_default_choice_without_history():
+    assert choose_backend(LP, [])[0] == "ortools"
+    assert choose_backend(MIP, [])[0] == "ortools"
+    assert choose_backend(LARGE_LP, [])[0] == "scipy"
+    # Bez OR-Tools zvolí MIP první řešič, který celočíselnost podporuje
+    assert choose_backend(MIP, [], ("scipy", "pulp"))[0] == "pulp"
+
+
+def test_fastest_backend_from_history():
+    history = records(LP.problem_class, "pulp", [0.1, 0.1]) + records(
+        LP.problem_class, "ortools", [0.5, 0.5]
+    )
+    backend, reason = choose_backend(LP, history)
+    assert backend == "pulp"
+    assert LP.problem_class in reason
+
+
+def test_mip_never_chooses_scipy():
+    history = (
+        records(MIP.problem_class, "scipy", [0.01] * 3)
+        + records(MIP.problem_class, "pulp", [1.0] * 3)
+        + records(MIP.problem_class, "ortools", [2.0] * 3)
+    )
+    assert choose_backend(MIP, history)[0] == "pulp"
+
+
+def test_falls_back_to_more_general_class():
+    history = records("lp/1e1/dense/boxed", "scipy", [0.1, 0.1]) + records(
+        "lp/1e1/dense/boxed", "pulp", [0.5, 0.5]
+    )
+    backend, reason = choose_backend(LP, history)
+    assert backend == "scipy"
+    assert "lp/1e1 " in reason
+
+
+def test_exploration_tries_backend_with_few_records():
+    history = records(LP.problem_class, "pulp", [0.1] * (EXPLORE_EVERY - 1))
+    history += records(LP.problem_class, "ortools", [0.5])
+    backend, reason = choose_backend(LP, history)
+    assert backend == "scipy"
+    assert "zkušební" in reason
+
+
+def test_history_round_trip_and_compaction(tmp_path, monkeypatch):
+    path = tmp_path / "historie.jsonl"
+    history = SolveHistory(str(path))
+    history.record(LP, "pulp", "Optimal", 0.25)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("poškozený řádek\n")
+    (record,) = history.load()
+    assert record["class"] == LP.problem_class
+    assert record["backend"] == "pulp" and record["solve_time"] == 0.25
+
+    monkeypatch.setattr(solver_auto, "MAX_HISTORY_BYTES", 2000)
+    for i in range(40):
+        history.record(LP, "scipy", "Optimal", float(i))
+    assert path.stat().st_size <= 2000
+    times = [r["solve_time"] for r in history.load()]
+    assert times == sorted(times) and times[-1] == 39.0
+
+
+def test_record_waits_for_lock_held_by_another_writer(tmp_path):
+    path = str(tmp_path / "historie.jsonl")
+    history = SolveHistory(path)
+    with _file_lock(path + ".lock"):
+        writer = threading.Thread(
+            target=history.record, args=(LP, "pulp", "Optimal", 1.0)
+        )
+        writer.start()
+        time.sleep(0.3)
+        assert history.load() == []
+    writer.join(timeout=5)
+    assert len(history.load()) == 1
+
+
+@pytest.mark.parametrize("record_history", [True, False])
+def test_batch_history_can_be_disabled(tmp_path, monkeypatch, record_history):
+    pytest.importorskip("scipy")
+    path = tmp_path / "historie.jsonl"
+    monkeypatch.setenv(solver_auto.STATS_ENV, str(path))
+    with open(tmp_path / "vysledky.jsonl", "w", encoding="utf-8") as out:
+        run_batch(
+            ["optimal.json"], backend="scipy", jobs=1, out=out,
+            record_history=record_history,
+        )
+    with open(tmp_path / "vysledky.jsonl", encoding="utf-8") as f:
+        assert json.loads(f.readline())["status"] == "Optimal"
+    assert path.exists() == record_history
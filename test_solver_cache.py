@@ -0,0 +1,120 @@
+"""
+Testy klíčů a obálky cache výsledků (python -m pytest test_solver_cache.py).
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from models import LPProblem, CSRMatrix, SolverResult, SolverOptions, REL_LE
+from solver_base import AbstractLPSolver
+from solver_cache import CachedSolver, ResultCache, problem_hash
+
+
+def make_problem(**changes):
+    arrays = dict(
+        names=["x1", "x2"],
+        lower=np.zeros(2),
+        upper=np.full(2, np.inf),
+        integer=np.zeros(2, dtype=bool),
+        sense="Maximalizovat",
+        objective=np.array([1.0, 2.0]),
+        matrix=CSRMatrix.from_dense([[1.0, 3.0], [2.0, 0.0]]),
+        rel=[REL_LE, REL_LE],
+        rhs=np.array([4.0, 5.0]),
+    )
+    arrays.update(changes)
+    return LPProblem.from_arrays(**arrays)
+
+
+class CountingSolver(AbstractLPSolver):
+    """Řešič s pevným výsledkem, který počítá volání solve"""
+
+    def __init__(self, status="Optimal"):
+        self.status = status
+        self._calls = 0
+
+    def solve(self, problem, options=None):
+        self._calls += 1
+        return SolverResult(self.status, 1.0, {"x1": 1.0, "x2": 0.0})
+
+
+def test_hash_ignores_csr_order_and_negative_zero():
+    # Stejná matice s prvky řádku v opačném pořadí a s -0.0 v mezích
+    shuffled = CSRMatrix(
+        indptr=np.array([0, 2, 3]),
+        indices=np.array([1, 0, 0], dtype=np.int32),
+        data=np.array([3.0, 1.0, 2.0]),
+        n_cols=2,
+    )
+    same = make_problem(matrix=shuffled, lower=np.array([-0.0, 0.0]))
+    assert problem_hash(same) == problem_hash(make_problem())
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"names": ["x1", "y"]},
+        {"lower": np.array([0.0, 1.0])},
+        {"upper": np.array([np.inf, 9.0])},
+        {"integer": np.array([True, False])},
+        {"sense": "Minimalizovat"},
+        {"objective": np.array([1.0, 2.5])},
+        {"matrix": CSRMatrix.from_dense([[1.0, 3.0], [0.0, 2.0]])},
+        {"rel": [REL_LE, REL_LE + 1]},
+        {"rhs": np.array([4.0, 6.0])},
+    ],
+)
+def test_hash_changes_with_every_part_of_problem(changes):
+    assert problem_hash(make_problem(**changes)) != problem_hash(make_problem())
+
+
+def test_hash_depends_on_solver_config():
+    problem = make_problem()
+    assert problem_hash(problem, {"backend": "a"}) != problem_hash(
+        problem, {"backend": "b"}
+    )
+
+
+def test_cached_solver_reuses_result_for_same_problem_and_options():
+    inner = CountingSolver()
+    solver = CachedSolver(inner, ResultCache())
+    first = solver.solve(make_problem())
+    second = solver.solve(make_problem())
+    assert inner._calls == 1
+    assert not first.from_cache and second.from_cache
+    assert second.variable_values == first.variable_values
+    # Výsledek z cache je kopie, úprava ho do cache nepropíše
+    second.variable_values["x1"] = 7.0
+    assert solver.solve(make_problem()).variable_values["x1"] == 1.0
+
+    solver.solve(make_problem(), SolverOptions(time_limit=10))
+    assert inner._calls == 2
+
+
+def test_cached_solver_skips_inconclusive_results():
+    inner = CountingSolver(status="TimeLimit")
+    solver = CachedSolver(inner, ResultCache())
+    solver.solve(make_problem())
+    solver.solve(make_problem())
+    assert inner._calls == 2
+
+
+def test_cache_evicts_least_recently_used():
+    result = SolverResult("Optimal", 1.0, {"x1": 1.0})
+    cache = ResultCache(max_bytes=1000)
+    for key in ("a", "b", "c"):
+        cache.put(key, result)
+        cache.get("a")
+    assert cache.size_bytes <= 1000
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+
+
+def test_disk_cache_survives_new_instance(tmp_path):
+    result = SolverResult("Optimal", 2.0, {"x1": 1.0}, solve_time=0.5)
+    ResultCache(cache_dir=str(tmp_path)).put("key", result)
+    loaded = ResultCache(cache_dir=str(tmp_path)).get("key")
+    assert dataclasses.asdict(loaded) == dataclasses.asdict(result)
@@ -0,0 +1,139 @@
+"""
+Testy tvrdého přerušení a časového limitu v pracovním procesu
+(python -m pytest test_solver_process.py).
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from models import LPProblem, CSRMatrix, SolverResult, SolverOptions, REL_EQ
+from solver_base import AbstractLPSolver, create_solver
+from solver_process import ProcessSolver
+
+
+class SleepingSolver(AbstractLPSolver):
+    """Řešič, který nedodržuje časový limit ani přerušení.
+
+    Ve výsledku vrací číslo pracovního procesu, ve kterém běžel.
+    """
+
+    def __init__(self, seconds: float = 0.0, exit_code=None):
+        self.seconds = seconds
+        self.exit_code = exit_code
+
+    def solve(self, problem, options=None):
+        if self.exit_code is not None:
+            os._exit(self.exit_code)
+        time.sleep(self.seconds)
+        return SolverResult("Optimal", 0.0, {"pid": os.getpid()})
+
+
+def small_problem():
+    return LPProblem.from_arrays(
+        names=["x1"],
+        lower=[0.0],
+        upper=[1.0],
+        integer=[False],
+        sense="Maximalizovat",
+        objective=[1.0],
+        matrix=CSRMatrix.empty(0, 1),
+        rel=[],
+        rhs=[],
+    )
+
+
+def market_split(m=4, n=30, seed=0):
+    """Celočíselná úloha, kterou CBC nevyřeší ani za desítky sekund"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 100, (m, n)).astype(np.float64)
+    return LPProblem.from_arrays(
+        names=[f"x{j + 1}" for j in range(n)],
+        lower=np.zeros(n),
+        upper=np.ones(n),
+        integer=np.ones(n, dtype=bool),
+        sense="Maximalizovat",
+        objective=np.ones(n),
+        matrix=CSRMatrix.from_dense(a),
+        rel=np.full(m, REL_EQ),
+        rhs=np.floor(a.sum(axis=1) / 2),
+    )
+
+
+def timed_solve(solver, problem, options=None):
+    start = time.perf_counter()
+    result = solver.solve(problem, options)
+    return result, time.perf_counter() - start
+
+
+def test_worker_process_is_reused_until_killed():
+    solver = ProcessSolver(SleepingSolver(), grace_period=0.2)
+    first = solver.solve(small_problem())
+    second = solver.solve(small_problem())
+    pid = first.variable_values["pid"]
+    assert pid != os.getpid()
+    assert second.variable_values["pid"] == pid
+
+    # Zrušení ukončí proces ze zásoby, další řešení spustí nový
+    slow = ProcessSolver(SleepingSolver(seconds=30), grace_period=0.2)
+    threading.Timer(0.5, slow.cancel).start()
+    assert slow.solve(small_problem()).status == "Cancelled"
+    third = solver.solve(small_problem())
+    assert third.variable_values["pid"] != pid
+
+
+def test_solve_time_includes_process_overhead():
+    result, elapsed = timed_solve(
+        ProcessSolver(SleepingSolver(seconds=0.2)), small_problem()
+    )
+    assert 0.2 <= result.solve_time <= elapsed
+
+
+def test_cancel_kills_solver_that_ignores_it():
+    solver = ProcessSolver(SleepingSolver(seconds=30))
+    threading.Timer(0.5, solver.cancel).start()
+    result, elapsed = timed_solve(solver, small_problem())
+    assert result.status == "Cancelled"
+    assert result.variable_values == {}
+    assert elapsed < 5
+
+
+def test_time_limit_overrun_is_killed_after_grace_period():
+    solver = ProcessSolver(SleepingSolver(seconds=30), grace_period=0.3)
+    result, elapsed = timed_solve(
+        solver, small_problem(), SolverOptions(time_limit=0.2)
+    )
+    assert result.status == "TimeLimit"
+    assert elapsed < 5
+
+
+def test_crashed_worker_reports_error():
+    result = ProcessSolver(SleepingSolver(exit_code=3)).solve(small_problem())
+    assert result.status == "Error"
+    assert "3" in result.error_message
+
+
+@pytest.mark.parametrize("backend", ["pulp", "ortools"])
+def test_native_time_limit(backend):
+    pytest.importorskip(backend)
+    result, elapsed = timed_solve(
+        ProcessSolver(create_solver(backend)),
+        market_split(),
+        SolverOptions(time_limit=1.0),
+    )
+    assert result.status == "TimeLimit"
+    assert elapsed < 1.0 + 2.0
+
+
+def test_interrupt_stops_cbc_with_cancelled_status():
+    pytest.importorskip("pulp")
+    from solver_pulp import PuLPSolver
+
+    solver = ProcessSolver(PuLPSolver())
+    threading.Timer(1.0, solver.interrupt).start()
+    result, elapsed = timed_solve(solver, market_split())
+    assert result.status == "Cancelled"
+    assert elapsed < 1.0 + solver.grace_period + 1.0
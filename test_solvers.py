@@ -0,0 +1,187 @@
+"""
+Testy stavů výsledku jednotlivých řešičů (python -m pytest test_solvers.py).
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from models import (
+    LPProblem,
+    CSRMatrix,
+    Variable,
+    Objective,
+    Constraint,
+    SolverOptions,
+    REL_LE,
+    REL_GE,
+    REL_EQ,
+)
+from problem_io import load_problem_file
+from solver_base import create_solver
+
+BACKENDS = ("pulp", "scipy", "ortools")
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(params=BACKENDS)
+def solver(request):
+    pytest.importorskip(request.param)
+    return create_solver(request.param)
+
+
+def test_violated_empty_row_is_infeasible(solver):
+    # 0·x1 <= -2: CBC tento spor hlásil jako předčasné ukončení
+    problem = LPProblem(
+        [Variable("x1", 0)],
+        Objective("Minimalizovat", [-3.0]),
+        [Constraint([0.0], "≤", -2.0)],
+    )
+    result = solver.solve(problem)
+    assert result.status == "Infeasible"
+    assert result.objective_value is None
+    assert result.variable_values == {}
+
+
+def make_problem(constraints, objective, integer=False):
+    vtype = "Integer" if integer else "Continuous"
+    return LPProblem(
+        [Variable(f"x{j + 1}", 0, None, vtype) for j in range(len(objective))],
+        Objective("Maximalizovat", objective),
+        [Constraint(coeffs, rel, rhs) for coeffs, rel, rhs in constraints],
+    )
+
+
+@pytest.mark.parametrize("integer", [False, True])
+def test_infeasible_problem(solver, integer):
+    problem = make_problem(
+        [([1.0, 1.0], "≤", 1.0), ([1.0, 1.0], "≥", 2.0)], [1.0, 1.0], integer
+    )
+    result = solver.solve(problem)
+    assert result.status == "Infeasible"
+    assert result.objective_value is None
+    assert result.variable_values == {}
+
+
+@pytest.mark.parametrize("native_presolve", [True, False])
+@pytest.mark.parametrize("integer", [False, True])
+def test_unbounded_problem(solver, integer, native_presolve):
+    problem = make_problem([([1.0, -1.0], "≤", 1.0)], [1.0, 0.0], integer)
+    result = solver.solve(problem, SolverOptions(native_presolve=native_presolve))
+    assert result.status == "Unbounded"
+    assert result.objective_value is None
+    assert result.variable_values == {}
+
+
+@pytest.mark.parametrize(
+    "file_name, status",
+    [
+        ("optimal.json", "Optimal"),
+        ("unbounded.json", "Unbounded"),
+        # x20 je v účelové funkci a v žádném omezení, úloha je neomezená
+        ("infeasible.json", "Unbounded"),
+    ],
+)
+def test_bundled_examples(solver, file_name, status):
+    problem = load_problem_file(os.path.join(HERE, file_name))
+    assert solver.solve(problem).status == status
+
+
+def test_unbounded_check_gets_only_remaining_time():
+    # Po vyčerpání limitu se kontrola nespustí a stav není jednoznačný
+    pulp = pytest.importorskip("pulp")
+    from solver_pulp import PuLPSolver
+
+    model = pulp.LpProblem("test", pulp.LpMaximize)
+    model += pulp.LpVariable("x1", 0)
+    options = SolverOptions(time_limit=1.0)
+    status = PuLPSolver._confirm_infeasible(model, options, 2.0, pulp)
+    assert status == "Not Solved"
+
+
+def test_ortools_unbounded_check_gets_only_remaining_time():
+    pytest.importorskip("ortools")
+    from ortools.linear_solver import pywraplp, linear_solver_pb2 as pb
+    from solver_ortools import ORToolsSolver
+
+    problem = make_problem([([1.0, -1.0], "≤", 1.0)], [1.0, 0.0])
+    response = pb.MPSolutionResponse(status=pb.MPSOLVER_INFEASIBLE)
+    options = SolverOptions(time_limit=1.0)
+    ORToolsSolver._confirm_infeasible(problem, options, response, 2.0, pywraplp, pb)
+    assert response.status == pb.MPSOLVER_NOT_SOLVED
+
+
+def random_problem(seed, integer=False):
+    """Přípustná omezená úloha se všemi relacemi a prázdným sloupcem"""
+    rng = np.random.default_rng(seed)
+    n, m = 8, 6
+    dense = rng.integers(-3, 4, (m, n)) * (rng.random((m, n)) < 0.5)
+    dense[:, -1] = 0
+    upper = rng.integers(1, 6, n).astype(np.float64)
+    x0 = np.floor(rng.uniform(0, upper))
+    rel = np.array([REL_LE, REL_LE, REL_GE, REL_GE, REL_EQ, REL_LE])
+    rhs = dense @ x0 + np.where(rel == REL_LE, 1.0, np.where(rel == REL_GE, -1.0, 0))
+    return LPProblem.from_arrays(
+        names=[f"x{j + 1}" for j in range(n)],
+        lower=np.zeros(n),
+        upper=upper,
+        integer=np.full(n, integer),
+        sense="Maximalizovat",
+        objective=rng.integers(-2, 6, n).astype(np.float64),
+        matrix=CSRMatrix.from_dense(dense),
+        rel=rel,
+        rhs=rhs,
+    )
+
+
+def dense_reference(problem):
+    """Optimum LP spočtené z husté matice bez převodů řešičů"""
+    from scipy.optimize import linprog
+
+    dense = problem.matrix.to_dense()
+    sign = np.where(problem.rel == REL_GE, -1.0, 1.0)
+    ub = problem.rel != REL_EQ
+    result = linprog(
+        -problem.obj_coeffs,
+        A_ub=(dense * sign[:, None])[ub],
+        b_ub=(problem.rhs * sign)[ub],
+        A_eq=dense[~ub],
+        b_eq=problem.rhs[~ub],
+        bounds=np.column_stack((problem.lower, problem.upper)),
+    )
+    return -result.fun
+
+
+BUILD_PATHS = [
+    ("pulp", {}, SolverOptions()),
+    ("scipy", {}, SolverOptions()),
+    ("ortools", {}, SolverOptions()),
+    ("ortools", {}, SolverOptions(algorithm="simplex")),
+    ("ortools", {"use_proto": False}, SolverOptions()),
+]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("backend, kwargs, options", BUILD_PATHS)
+def test_csr_build_paths_match_dense_reference(backend, kwargs, options, seed):
+    pytest.importorskip("scipy")
+    pytest.importorskip(backend)
+    problem = random_problem(seed)
+    result = create_solver(backend, **kwargs).solve(problem, options)
+    assert result.status == "Optimal"
+    assert result.objective_value == pytest.approx(dense_reference(problem))
+    assert list(result.variable_values) == problem.names
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_mip_build_paths_agree(seed):
+    pytest.importorskip("pulp")
+    pytest.importorskip("ortools")
+    problem = random_problem(seed, integer=True)
+    objectives = [
+        create_solver(backend, **kwargs).solve(problem, options).objective_value
+        for backend, kwargs, options in BUILD_PATHS
+        if backend != "scipy"
+    ]
+    assert objectives == pytest.approx([objectives[0]] * len(objectives))